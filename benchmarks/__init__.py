@@ -0,0 +1,3 @@
+"""
+Benchmark tooling for the bootstrap pipeline (synthetic corpora and scaling runners).
+"""
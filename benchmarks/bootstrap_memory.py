@@ -0,0 +1,240 @@
+"""
+Peak-memory benchmark for `BootstrapOrchestrator` against SQLite.
+
+Each (layout, task count) case bootstraps a synthetic corpus in a freshly spawned interpreter,
+so the peak resident set size of one case is not inflated by memory an earlier, smaller case
+left in the allocator. The child reports:
+
+* peak RSS over the whole run (sampled by `ResourceGuard`) and per stage group;
+* ``tracemalloc`` peak and retained Python allocations, from a second, traced bootstrap.
+
+A least-squares line through (tasks, peak RSS) gives the per-task memory cost and the largest
+corpus that fits ``--memory-budget-mb``::
+
+    python -m benchmarks.bootstrap_memory --sizes 1000 5000 20000 --output memory.json \\
+        --baseline memory-baseline.json --threshold 0.15
+
+With ``--baseline`` the run exits with status 1 when the per-task RSS or traced cost grew by
+more than ``--threshold`` (a fraction).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+from benchmarks.bootstrap_scaling import STAGE_GROUPS, TASKS_PER_FEATURE, environment, stage_group
+from benchmarks.corpus import LAYOUTS, CorpusSpec, generate_corpus
+from src.lib.resource_guard import ResourceGuard, current_rss_mb
+from src.services.bootstrap_options import BootstrapOptions
+from src.services.bootstrap_orchestrator import BootstrapOrchestrator
+from src.services.data_store_gateway import DataStoreGateway
+
+DEFAULT_SIZES = (1_000, 5_000, 20_000)
+DEFAULT_BUDGET_MB = 4096
+DEFAULT_THRESHOLD = 0.15
+# Cost fields compared against a baseline, in KB per task.
+COST_FIELDS = ("rss_kb_per_task", "traced_kb_per_task")
+
+
+@dataclass(frozen=True)
+class LinearFit:
+    slope: float
+    intercept: float
+
+    def solve(self, y: float) -> Optional[float]:
+        """``x`` where the line reaches ``y``; None when memory does not grow with tasks."""
+        if self.slope <= 0:
+            return None
+        return (y - self.intercept) / self.slope
+
+
+def fit_line(points: Sequence[tuple[float, float]]) -> LinearFit:
+    if len(points) < 2:
+        raise ValueError("At least two sizes are needed to fit a per-task cost")
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        raise ValueError("Sizes must differ to fit a per-task cost")
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    return LinearFit(slope=slope, intercept=mean_y - slope * mean_x)
+
+
+def _bootstrap(docs: Path, db_path: Path, guard: Optional[ResourceGuard] = None):
+    gateway = DataStoreGateway(db_path, sqlite_profile=None)
+    try:
+        summary = BootstrapOrchestrator(docs, gateway, resource_guard=guard).run_bootstrap(BootstrapOptions())
+    finally:
+        gateway.close()
+        db_path.unlink(missing_ok=True)
+    if not summary.success:
+        raise RuntimeError(f"Bootstrap of {docs} failed: {summary.error_message}")
+    return summary
+
+
+def _measure(docs: Path, workdir: Path, trace: bool) -> dict:
+    """Runs in a spawned child process."""
+    baseline_rss = current_rss_mb()
+    guard = ResourceGuard(sample_interval=0.02)
+    with guard.monitor():
+        summary = _bootstrap(docs, workdir / "rss.sqlite", guard)
+
+    stage_peaks: dict[str, float] = {}
+    for span in summary.stages:
+        group = stage_group(span.name)
+        if group is not None and span.peak_rss_mb is not None:
+            stage_peaks[group] = max(stage_peaks.get(group, 0.0), span.peak_rss_mb)
+
+    measured = {
+        "baseline_rss_mb": round(baseline_rss, 1),
+        "peak_rss_mb": round(guard.peak_rss_mb, 1),
+        "stage_peak_rss_mb": {group: round(stage_peaks[group], 1) for group in STAGE_GROUPS if group in stage_peaks},
+    }
+    if trace:
+        del summary
+        tracemalloc.start()
+        try:
+            summary = _bootstrap(docs, workdir / "traced.sqlite")
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        measured["traced_peak_mb"] = round(peak / (1024 * 1024), 2)
+        measured["traced_retained_mb"] = round(retained / (1024 * 1024), 2)
+    return measured
+
+
+def run_case(
+    workdir: Path,
+    layout: str,
+    tasks: int,
+    dependency_density: float = 1.0,
+    trace: bool = True,
+    seed: int = 0,
+) -> dict:
+    spec = CorpusSpec(
+        tasks=tasks,
+        features=max(1, tasks // TASKS_PER_FEATURE),
+        dependency_density=dependency_density,
+        layout=layout,
+        seed=seed,
+    )
+    case_dir = workdir / f"{layout}-{tasks}"
+    manifest = generate_corpus(case_dir / "docs", spec)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        measured = pool.submit(_measure, case_dir / "docs", case_dir, trace).result()
+    return {
+        "layout": layout,
+        "tasks": manifest.tasks,
+        "dependencies": manifest.dependencies,
+        "corpus_bytes": manifest.bytes_written,
+        **measured,
+    }
+
+
+def summarize(results: Sequence[dict], budget_mb: float) -> dict:
+    """Per-layout cost fits: KB per task, fixed overhead, and the largest corpus within ``budget_mb``."""
+    fits: dict[str, dict] = {}
+    for layout in dict.fromkeys(r["layout"] for r in results):
+        cases = [r for r in results if r["layout"] == layout]
+        if len({r["tasks"] for r in cases}) < 2:
+            continue
+        rss = fit_line([(r["tasks"], r["peak_rss_mb"]) for r in cases])
+        max_tasks = rss.solve(budget_mb)
+        fit = {
+            "rss_kb_per_task": round(rss.slope * 1024, 3),
+            "rss_fixed_mb": round(rss.intercept, 1),
+            "budget_mb": budget_mb,
+            "max_tasks_within_budget": int(max_tasks) if max_tasks is not None else None,
+        }
+        if all("traced_peak_mb" in r for r in cases):
+            traced = fit_line([(r["tasks"], r["traced_peak_mb"]) for r in cases])
+            fit["traced_kb_per_task"] = round(traced.slope * 1024, 3)
+        fits[layout] = fit
+    return fits
+
+
+@dataclass(frozen=True)
+class CostRegression:
+    layout: str
+    field: str
+    baseline: float
+    current: float
+
+
+def compare(fits: dict, baseline_fits: dict, threshold: float = DEFAULT_THRESHOLD) -> list[CostRegression]:
+    regressions: list[CostRegression] = []
+    for layout, fit in fits.items():
+        base = baseline_fits.get(layout, {})
+        for field in COST_FIELDS:
+            if field in fit and base.get(field) and fit[field] > base[field] * (1 + threshold):
+                regressions.append(CostRegression(layout, field, base[field], fit[field]))
+    return regressions
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bootstrap_memory", description=__doc__.split("\n\n")[1]
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Task counts to run.")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=["flat"], help="Corpus layouts to run.")
+    parser.add_argument("--density", type=float, default=1.0, help="Mean dependency edges per task.")
+    parser.add_argument("--no-tracemalloc", dest="trace", action="store_false", help="Skip the traced run.")
+    parser.add_argument(
+        "--memory-budget-mb", type=float, default=DEFAULT_BUDGET_MB, help="Runner memory to project against."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", type=Path, default=None, help="Keep generated corpora here instead of a temp dir.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here (default: stdout).")
+    parser.add_argument("--baseline", type=Path, default=None, help="Earlier report to compare against.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed per-task cost growth.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="speckit-bench-mem-"))
+    try:
+        results = [
+            run_case(workdir, layout, size, dependency_density=args.density, trace=args.trace, seed=args.seed)
+            for layout in args.layouts
+            for size in sorted(args.sizes)
+        ]
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    fits = summarize(results, args.memory_budget_mb)
+    report: dict = {"environment": environment(), "results": results, "fits": fits}
+    regressions: list[CostRegression] = []
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(fits, baseline.get("fits", {}), args.threshold)
+        report["baseline"] = str(args.baseline)
+        report["regressions"] = [asdict(r) for r in regressions]
+
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.layout} {regression.field}: {regression.baseline:.2f} -> {regression.current:.2f}",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Scaling benchmark for `BootstrapOrchestrator` against SQLite.
+
+Generates a synthetic corpus per (layout, task count), bootstraps it into a fresh database and
+reports per-stage wall time and task throughput as JSON::
+
+    python -m benchmarks.bootstrap_scaling --sizes 1000 10000 --layouts flat nested \\
+        --output results.json --baseline baseline.json --threshold 0.25
+
+With ``--baseline`` the run exits with status 1 when a stage got slower than the baseline by
+more than ``--threshold`` (a fraction) and by more than ``--min-seconds`` (to ignore noise on
+stages that only take milliseconds).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+from benchmarks.corpus import LAYOUTS, CorpusSpec, generate_corpus
+from src.lib.resource_guard import usable_cores
+from src.lib.stage_timing import StageSpan
+from src.services.bootstrap_options import BootstrapOptions
+from src.services.bootstrap_orchestrator import BootstrapOrchestrator
+from src.services.data_store_gateway import DataStoreGateway
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_SECONDS = 0.05
+TASKS_PER_FEATURE = 50
+
+# Reported stage groups, in pipeline order. Only top-level spans are summed: `persist`
+# already contains the nested upsert.* / task_runs / ai_jobs spans.
+STAGE_GROUPS = ("discovery", "parse", "validate", "step_orders", "persist")
+
+
+def stage_group(name: str) -> Optional[str]:
+    if name == "discovery" or name == "step_orders" or name == "persist":
+        return name
+    if name.startswith("parse.") or name == "normalize.dependencies":
+        return "parse"
+    if name.startswith("validate."):
+        return "validate"
+    return None
+
+
+def group_stages(spans: Iterable[StageSpan]) -> dict[str, float]:
+    totals = {group: 0.0 for group in STAGE_GROUPS}
+    for span in spans:
+        group = stage_group(span.name)
+        if group is not None:
+            totals[group] += span.wall_seconds
+    return totals
+
+
+@dataclass(frozen=True)
+class Regression:
+    case: str
+    stage: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds if self.baseline_seconds else float("inf")
+
+
+def case_key(result: dict) -> str:
+    return f"{result['layout']}/{result['tasks']}"
+
+
+def run_case(
+    workdir: Path,
+    layout: str,
+    tasks: int,
+    dependency_density: float = 1.0,
+    repeat: int = 1,
+    jobs: int = 1,
+    sqlite_profile: Optional[str] = None,
+    seed: int = 0,
+) -> dict:
+    """Generate one corpus and bootstrap it ``repeat`` times; each stage keeps its best time."""
+    spec = CorpusSpec(
+        tasks=tasks,
+        features=max(1, tasks // TASKS_PER_FEATURE),
+        dependency_density=dependency_density,
+        layout=layout,
+        seed=seed,
+    )
+    case_dir = workdir / f"{layout}-{tasks}"
+    generate_started = time.perf_counter()
+    manifest = generate_corpus(case_dir / "docs", spec)
+    generate_seconds = time.perf_counter() - generate_started
+
+    best: dict[str, float] = {}
+    best_total = float("inf")
+    for attempt in range(repeat):
+        db_path = case_dir / f"run-{attempt}.sqlite"
+        gateway = DataStoreGateway(db_path, sqlite_profile=sqlite_profile)
+        started = time.perf_counter()
+        summary = BootstrapOrchestrator(case_dir / "docs", gateway).run_bootstrap(BootstrapOptions(jobs=jobs))
+        total = time.perf_counter() - started
+        gateway.close()
+        db_path.unlink(missing_ok=True)
+        if not summary.success:
+            raise RuntimeError(f"Bootstrap of {layout}/{tasks} failed: {summary.error_message}")
+        best_total = min(best_total, total)
+        for group, seconds in group_stages(summary.stages).items():
+            best[group] = min(best.get(group, float("inf")), seconds)
+
+    return {
+        "layout": layout,
+        "tasks": manifest.tasks,
+        "features": manifest.features,
+        "dependencies": manifest.dependencies,
+        "files": manifest.files,
+        "corpus_bytes": manifest.bytes_written,
+        "generate_seconds": round(generate_seconds, 4),
+        "total_seconds": round(best_total, 4),
+        "stages": {
+            group: {
+                "seconds": round(seconds, 4),
+                "tasks_per_second": round(manifest.tasks / seconds, 1) if seconds > 0 else None,
+            }
+            for group, seconds in best.items()
+        },
+    }
+
+
+def compare(
+    results: Sequence[dict],
+    baseline: Sequence[dict],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> list[Regression]:
+    """Stages of ``results`` slower than the matching ``baseline`` case beyond both tolerances."""
+    previous = {case_key(r): r for r in baseline}
+    regressions: list[Regression] = []
+    for result in results:
+        base = previous.get(case_key(result))
+        if base is None:
+            continue
+        for stage, timing in result["stages"].items():
+            base_timing = base["stages"].get(stage)
+            if base_timing is None:
+                continue
+            current, before = timing["seconds"], base_timing["seconds"]
+            if current > before * (1 + threshold) and current - before > min_seconds:
+                regressions.append(Regression(case_key(result), stage, before, current))
+    return regressions
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "usable_cores": usable_cores(),
+    }
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bootstrap_scaling", description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Task counts to run.")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=["flat"], help="Corpus layouts to run.")
+    parser.add_argument("--density", type=float, default=1.0, help="Mean dependency edges per task.")
+    parser.add_argument("--repeat", type=int, default=1, help="Bootstraps per case; the best time per stage is kept.")
+    parser.add_argument("--jobs", type=int, default=1, help="Parser worker processes (0 = all usable cores).")
+    parser.add_argument("--sqlite-profile", default=None, help="SQLite pragma profile (durable, tuned, fast).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", type=Path, default=None, help="Keep generated corpora here instead of a temp dir.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here (default: stdout).")
+    parser.add_argument("--baseline", type=Path, default=None, help="Earlier report to compare against.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown fraction.")
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS, help="Ignore smaller slowdowns.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="speckit-bench-"))
+    try:
+        results = [
+            run_case(
+                workdir,
+                layout,
+                size,
+                dependency_density=args.density,
+                repeat=args.repeat,
+                jobs=args.jobs,
+                sqlite_profile=args.sqlite_profile,
+                seed=args.seed,
+            )
+            for layout in args.layouts
+            for size in args.sizes
+        ]
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report: dict = {"environment": environment(), "results": results}
+    regressions: list[Regression] = []
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline["results"], args.threshold, args.min_seconds)
+        report["baseline"] = str(args.baseline)
+        report["regressions"] = [{**asdict(r), "ratio": round(r.ratio, 3)} for r in regressions]
+
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.case} {regression.stage}: "
+            f"{regression.baseline_seconds:.3f}s -> {regression.current_seconds:.3f}s ({regression.ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Deterministic synthetic documentation corpora for benchmarking `BootstrapOrchestrator`.
+
+Three layouts are supported, matching what `DocumentationDiscoveryService` recognises:
+
+* ``flat``: ``features/*.md``, ``specs/*.md``, ``tasks/*.md`` (feature codes in front matter);
+* ``legacy``: numbered directories, ``specs/NNNN-<feature>/*.md`` and ``tasks/NNNN-<feature>/*.md``
+  (feature codes derived from the directory name);
+* ``nested``: ``specs/NNNN-<feature>/spec.md`` with ``specs/NNNN-<feature>/tasks/*.md`` and no
+  top-level ``tasks/`` or ``dependencies/`` directory.
+
+Dependencies only point at earlier tasks, so every corpus is acyclic and bootstraps cleanly.
+The same `CorpusSpec` always produces byte-identical files.
+
+``postgres_compatible`` shapes the corpus for the PostgreSQL schema contract, which links rows
+by name and looks tasks up by lower-cased code: project, feature and spec titles equal their
+codes, and task codes are lower-case (taken from the file name).
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+Layout = Literal["flat", "legacy", "nested"]
+LAYOUTS: tuple[Layout, ...] = ("flat", "legacy", "nested")
+
+_WORDS = (
+    "account", "audit", "batch", "cache", "client", "config", "event", "export", "gateway", "index",
+    "invoice", "ledger", "metric", "notify", "order", "payment", "queue", "report", "schema", "search",
+    "session", "storage", "stream", "token", "upload", "user", "webhook", "worker",
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    tasks: int = 1000
+    features: int = 20
+    # Mean number of "Depends on" edges per task.
+    dependency_density: float = 1.0
+    # Share of edges pointing at a task of an earlier feature rather than the same one.
+    cross_feature_ratio: float = 0.1
+    layout: Layout = "flat"
+    seed: int = 0
+    postgres_compatible: bool = False
+
+
+@dataclass(frozen=True)
+class CorpusManifest:
+    root: Path
+    spec: CorpusSpec
+    features: int
+    specs: int
+    tasks: int
+    dependencies: int
+    files: int
+    bytes_written: int
+
+
+def task_code(index: int) -> str:
+    return f"T{index + 1:06d}"
+
+
+def feature_code(index: int) -> str:
+    return f"feature-{index + 1:04d}"
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.files = 0
+        self.bytes_written = 0
+
+    def write(self, path: Path, text: str) -> None:
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        self.files += 1
+        self.bytes_written += len(data)
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _front_matter(fields: dict[str, str]) -> str:
+    return "---\n" + "".join(f"{key}: {value}\n" for key, value in fields.items()) + "---\n"
+
+
+def _pick_dependencies(
+    rng: random.Random, spec: CorpusSpec, index: int, feature_start: int
+) -> list[int]:
+    whole, fraction = divmod(spec.dependency_density, 1)
+    wanted = int(whole) + (1 if rng.random() < fraction else 0)
+    targets: set[int] = set()
+    for _ in range(wanted):
+        if feature_start > 0 and rng.random() < spec.cross_feature_ratio:
+            targets.add(rng.randrange(0, feature_start))
+        elif index > feature_start:
+            targets.add(rng.randrange(feature_start, index))
+    return sorted(targets)
+
+
+def _feature_bounds(spec: CorpusSpec) -> list[tuple[int, int]]:
+    """Contiguous ``[start, end)`` task ranges, one per feature, as even as possible."""
+    base, extra = divmod(spec.tasks, spec.features)
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    for f in range(spec.features):
+        end = start + base + (1 if f < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def generate_corpus(root: Path, spec: CorpusSpec) -> CorpusManifest:
+    """Write the corpus described by ``spec`` under ``root`` (which should be empty)."""
+    if spec.layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{spec.layout}'. Choose from: {', '.join(LAYOUTS)}.")
+    if spec.features < 1 or spec.tasks < spec.features:
+        raise ValueError("A corpus needs at least one feature and one task per feature")
+
+    rng = random.Random(spec.seed)
+    writer = _Writer()
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "features").mkdir(exist_ok=True)
+    (root / "specs").mkdir(exist_ok=True)
+    if spec.layout != "nested":
+        (root / "tasks").mkdir(exist_ok=True)
+        (root / "dependencies").mkdir(exist_ok=True)
+
+    pg = spec.postgres_compatible
+    writer.write(
+        root / "project.md",
+        _front_matter({"code": "bench", "name": "Benchmark Project"})
+        + f"\n# {'bench' if pg else 'Benchmark Project'}\n\n{_sentence(rng, 30)}\n",
+    )
+
+    edge_count = 0
+    for f, (start, end) in enumerate(_feature_bounds(spec)):
+        code = feature_code(f)
+        numbered_dir = f"{f + 1:04d}-{code}"
+        writer.write(
+            root / "features" / f"{code}.md",
+            _front_matter({"priority": f"P{f % 3 + 1}"})
+            + f"\n# {code if pg else f'Feature {f + 1}'}\n\n{_sentence(rng, 40)}\n\n## Scope\n\n- {_sentence(rng)}\n- {_sentence(rng)}\n",
+        )
+
+        spec_body = f"\n# {f'{code}-spec' if pg else f'Specification for {code}'}\n\n## Overview\n\n{_sentence(rng, 60)}\n\n## Requirements\n\n"
+        spec_body += "".join(f"- FR-{r + 1:03d}: {_sentence(rng)}\n" for r in range(5))
+        if spec.layout == "flat":
+            spec_path = root / "specs" / f"{code}.md"
+            spec_fields = {"code": f"{code}-spec", "feature_code": code}
+        else:
+            spec_dir = root / "specs" / numbered_dir
+            spec_dir.mkdir(exist_ok=True)
+            if spec.layout == "legacy":
+                # Feature code comes from the numbered directory; spec code from the file name.
+                spec_path = spec_dir / f"{code}-spec.md"
+                spec_fields = {"spec_type": "functional"}
+            else:
+                spec_path = spec_dir / "spec.md"
+                spec_fields = {"code": f"{code}-spec", "spec_type": "functional"}
+        writer.write(spec_path, _front_matter(spec_fields) + spec_body)
+
+        if spec.layout == "flat":
+            task_dir = root / "tasks"
+        elif spec.layout == "legacy":
+            task_dir = root / "tasks" / numbered_dir
+        else:
+            task_dir = root / "specs" / numbered_dir / "tasks"
+        task_dir.mkdir(exist_ok=True)
+
+        for index in range(start, end):
+            deps = _pick_dependencies(rng, spec, index, start)
+            edge_count += len(deps)
+            fields = {"status": "pending", "task_type": rng.choice(("implementation", "testing", "docs"))}
+            if spec.layout == "flat":
+                fields = {"feature_code": code, **fields}
+            code_of = (lambda i: task_code(i).lower()) if pg else task_code
+            title = _sentence(rng, 5)[:-1]
+            # Without a code in the heading the parser takes the (lower-case) file name as the code.
+            heading = title if pg else f"{task_code(index)}: {title}"
+            body = f"\n# {heading}\n\n## Description\n\n{_sentence(rng, 30)}\n\n"
+            if deps:
+                body += f"Depends on: {', '.join(code_of(d) for d in deps)}\n\n"
+            body += "## Acceptance Criteria\n\n" + "".join(f"{c + 1}. {_sentence(rng, 8)}\n" for c in range(3))
+            writer.write(task_dir / f"{code_of(index)}.md", _front_matter(fields) + body)
+
+    return CorpusManifest(
+        root=root,
+        spec=spec,
+        features=spec.features,
+        specs=spec.features,
+        tasks=spec.tasks,
+        dependencies=edge_count,
+        files=writer.files,
+        bytes_written=writer.bytes_written,
+    )
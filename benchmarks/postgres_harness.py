@@ -0,0 +1,445 @@
+"""
+Benchmark harness for the PostgreSQL backend.
+
+Provisions a throwaway server (``initdb`` into a temp dir, listening only on a Unix socket) or a
+scratch database on an existing server (``--dsn``), creates the schema `PostgresGateway.verify_schema`
+expects, and bootstraps synthetic corpora into it through `BootstrapOrchestrator`. For each case
+it reports:
+
+* end-to-end bootstrap time, for the initial load and for a re-run over the same corpus;
+* per gateway write method (one per entity type): rows, seconds, rows/s, and database round
+  trips counted by wrapping every psycopg2 cursor the pool hands out.
+
+::
+
+    python -m benchmarks.postgres_harness --sizes 1000 10000 --output pg.json
+    python -m benchmarks.postgres_harness --dsn postgresql://postgres@localhost/postgres --sizes 1000
+
+Corpora are generated with ``postgres_compatible=True`` (see `benchmarks.corpus`), since the
+backend links rows by name and looks tasks up by lower-cased code.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import glob
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence
+from urllib.parse import urlencode
+
+from benchmarks.bootstrap_scaling import TASKS_PER_FEATURE, environment, group_stages
+from benchmarks.corpus import LAYOUTS, CorpusSpec, generate_corpus
+from src.services.bootstrap_options import BootstrapOptions
+from src.services.bootstrap_orchestrator import BootstrapOrchestrator
+from src.services.data_store_gateway import DataStoreGateway
+from src.services.postgres_pool import PostgresPoolConfig
+
+DEFAULT_SIZES = (1_000, 10_000)
+
+# The tables and columns `PostgresGateway.verify_schema` requires, plus the unique pair
+# `create_task_dependencies` relies on for ON CONFLICT.
+SCHEMA_DDL = (
+    """
+    CREATE TABLE projects (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        name text NOT NULL,
+        description text,
+        status text NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE features (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        project_id uuid NOT NULL REFERENCES projects (id),
+        name text NOT NULL,
+        description text,
+        priority integer,
+        status text NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE specs (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        feature_id uuid NOT NULL REFERENCES features (id),
+        name text NOT NULL,
+        file_path text,
+        status text NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE tasks (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        name text NOT NULL,
+        status text NOT NULL,
+        description text,
+        metadata jsonb NOT NULL DEFAULT '{}'::jsonb,
+        feature_id uuid REFERENCES features (id),
+        project_id uuid REFERENCES projects (id),
+        step_order integer
+    )
+    """,
+    """
+    CREATE TABLE task_dependencies (
+        predecessor_id uuid NOT NULL REFERENCES tasks (id),
+        successor_id uuid NOT NULL REFERENCES tasks (id),
+        PRIMARY KEY (predecessor_id, successor_id)
+    )
+    """,
+)
+
+# Gateway methods reported per entity type, with the argument that carries the rows.
+PROBED_METHODS = (
+    "create_or_update_projects",
+    "create_or_update_features",
+    "create_or_update_specs",
+    "create_or_update_tasks",
+    "create_task_dependencies",
+    "create_task_runs",
+    "create_ai_jobs",
+    "get_projects_by_codes",
+    "get_features_by_codes",
+    "get_specs_by_codes",
+    "get_tasks_by_codes",
+)
+
+
+# -- round-trip counting ---------------------------------------------------------------------
+
+
+class RoundTripCounter:
+    """Statements sent to the server, by kind (``execute``, ``copy``, ``commit``, ...)."""
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+
+    def add(self, kind: str, count: int = 1) -> None:
+        self.counts[kind] += count
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class CountingCursor:
+    """Delegating cursor wrapper that counts every call that reaches the server."""
+
+    def __init__(self, cursor: Any, counter: RoundTripCounter) -> None:
+        self._cursor = cursor
+        self._counter = counter
+
+    def __enter__(self) -> "CountingCursor":
+        self._cursor.__enter__()
+        return self
+
+    def __exit__(self, *exc_info) -> Any:
+        return self._cursor.__exit__(*exc_info)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def execute(self, query, params=None):
+        self._counter.add("execute")
+        return self._cursor.execute(query, params)
+
+    def executemany(self, query, params_seq):
+        # psycopg2 sends one statement per parameter set.
+        params = list(params_seq)
+        self._counter.add("executemany", len(params))
+        return self._cursor.executemany(query, params)
+
+    def copy_expert(self, sql, file, size=8192):
+        self._counter.add("copy")
+        return self._cursor.copy_expert(sql, file, size)
+
+    def callproc(self, procname, parameters=None):
+        self._counter.add("callproc")
+        return self._cursor.callproc(procname, parameters)
+
+
+def counting_connection_factory(counter: RoundTripCounter) -> type:
+    """A psycopg2 connection class whose cursors, commits and rollbacks feed ``counter``."""
+    import psycopg2.extensions
+
+    class CountingConnection(psycopg2.extensions.connection):
+        def cursor(self, *args, **kwargs):
+            return CountingCursor(super().cursor(*args, **kwargs), counter)
+
+        def commit(self):
+            counter.add("commit")
+            return super().commit()
+
+        def rollback(self):
+            counter.add("rollback")
+            return super().rollback()
+
+    return CountingConnection
+
+
+@dataclass
+class MethodStats:
+    calls: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    round_trips: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "seconds": round(self.seconds, 4),
+            "rows_per_second": round(self.rows / self.seconds, 1) if self.seconds > 0 and self.rows else None,
+            "round_trips": self.round_trips,
+            "round_trips_per_row": round(self.round_trips / self.rows, 3) if self.rows else None,
+        }
+
+
+class GatewayProbe:
+    """Gateway proxy recording rows, time and round trips for each method in `PROBED_METHODS`."""
+
+    def __init__(self, gateway: Any, counter: RoundTripCounter) -> None:
+        self._gateway = gateway
+        self._counter = counter
+        self.stats: dict[str, MethodStats] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        target = getattr(self._gateway, name)
+        if name not in PROBED_METHODS:
+            return target
+
+        def probed(items, *args, **kwargs):
+            items = list(items)
+            stats = self.stats.setdefault(name, MethodStats())
+            trips_before = self._counter.total
+            started = time.perf_counter()
+            try:
+                return target(items, *args, **kwargs)
+            finally:
+                stats.seconds += time.perf_counter() - started
+                stats.calls += 1
+                stats.rows += len(items)
+                stats.round_trips += self._counter.total - trips_before
+
+        return probed
+
+
+# -- throwaway server ------------------------------------------------------------------------
+
+
+def find_pg_bin(explicit: Optional[Path] = None) -> Path:
+    """Directory holding ``initdb`` and ``pg_ctl``: ``--pg-bin``, PATH, then common install locations."""
+    candidates: list[Path] = []
+    if explicit is not None:
+        candidates.append(explicit)
+    on_path = shutil.which("initdb")
+    if on_path:
+        candidates.append(Path(on_path).parent)
+    candidates.extend(Path(p) for p in sorted(glob.glob("/usr/lib/postgresql/*/bin"), reverse=True))
+    candidates.extend(Path(p) for p in ("/usr/local/pgsql/bin", "/opt/homebrew/bin", "/usr/local/bin"))
+    for directory in candidates:
+        if (directory / "initdb").exists() and (directory / "pg_ctl").exists():
+            return directory
+    raise FileNotFoundError("Could not find initdb/pg_ctl; install PostgreSQL, pass --pg-bin, or use --dsn")
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@contextlib.contextmanager
+def local_postgres(pg_bin: Path, workdir: Path) -> Iterator[str]:
+    """Run a private server for the duration of the block and yield a DSN for its ``postgres`` database."""
+    data_dir = workdir / "pgdata"
+    socket_dir = workdir / "pgsock"
+    socket_dir.mkdir(parents=True, exist_ok=True)
+    port = _free_port()
+    subprocess.run(
+        [str(pg_bin / "initdb"), "-D", str(data_dir), "-U", "speckit", "--auth=trust", "-E", "UTF8", "--no-sync"],
+        check=True,
+        capture_output=True,
+    )
+    options = f"-k {socket_dir} -p {port} -c listen_addresses=''"
+    subprocess.run(
+        [str(pg_bin / "pg_ctl"), "-D", str(data_dir), "-o", options, "-l", str(workdir / "postgres.log"), "-w", "start"],
+        check=True,
+        capture_output=True,
+    )
+    try:
+        yield f"postgresql://speckit@/postgres?host={socket_dir}&port={port}"
+    finally:
+        subprocess.run(
+            [str(pg_bin / "pg_ctl"), "-D", str(data_dir), "-m", "fast", "-w", "stop"], check=False, capture_output=True
+        )
+
+
+def _with_database(dsn: str, database: str) -> str:
+    """``dsn`` pointed at ``database``, as a ``postgresql://`` URI (which `DataStoreGateway` requires)."""
+    from psycopg2.extensions import parse_dsn
+
+    params = {key: value for key, value in parse_dsn(dsn).items() if key != "dbname"}
+    return f"postgresql:///{database}?{urlencode(params)}"
+
+
+@contextlib.contextmanager
+def scratch_database(admin_dsn: str) -> Iterator[str]:
+    """Create an empty database with the expected schema; drop it afterwards."""
+    import psycopg2
+
+    name = f"speckit_bench_{uuid.uuid4().hex[:12]}"
+    admin = psycopg2.connect(admin_dsn)
+    admin.autocommit = True
+    try:
+        with admin.cursor() as cursor:
+            cursor.execute(f"CREATE DATABASE {name}")
+        dsn = _with_database(admin_dsn, name)
+        with contextlib.closing(psycopg2.connect(dsn)) as conn:
+            with conn, conn.cursor() as cursor:
+                for statement in SCHEMA_DDL:
+                    cursor.execute(statement)
+        try:
+            yield dsn
+        finally:
+            with admin.cursor() as cursor:
+                cursor.execute(f"DROP DATABASE IF EXISTS {name} WITH (FORCE)")
+    finally:
+        admin.close()
+
+
+# -- cases -----------------------------------------------------------------------------------
+
+
+@dataclass
+class PassResult:
+    total_seconds: float
+    round_trips: dict[str, int]
+    stages: dict[str, float]
+    methods: dict[str, MethodStats] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "total_seconds": round(self.total_seconds, 4),
+            "round_trips": {"total": sum(self.round_trips.values()), **dict(sorted(self.round_trips.items()))},
+            "stages": {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            "methods": {name: stats.to_dict() for name, stats in self.methods.items()},
+        }
+
+
+def bootstrap_pass(docs: Path, dsn: str, options: BootstrapOptions, pool_max: int = 4) -> PassResult:
+    counter = RoundTripCounter()
+    gateway = DataStoreGateway(
+        dsn,
+        enable_experimental_postgres=True,
+        pool_config=PostgresPoolConfig(max_size=pool_max, connection_factory=counting_connection_factory(counter)),
+    )
+    gateway.verify_schema()
+    probe = GatewayProbe(gateway, counter)
+    try:
+        started = time.perf_counter()
+        summary = BootstrapOrchestrator(docs, probe).run_bootstrap(options)
+        total = time.perf_counter() - started
+    finally:
+        gateway.close()
+    if not summary.success:
+        raise RuntimeError(f"Postgres bootstrap of {docs} failed: {summary.error_message}")
+    return PassResult(total, dict(counter.counts), group_stages(summary.stages), probe.stats)
+
+
+def run_case(
+    admin_dsn: str,
+    workdir: Path,
+    layout: str,
+    tasks: int,
+    dependency_density: float = 1.0,
+    ensure_indexes: bool = False,
+    seed: int = 0,
+) -> dict:
+    spec = CorpusSpec(
+        tasks=tasks,
+        features=max(1, tasks // TASKS_PER_FEATURE),
+        dependency_density=dependency_density,
+        layout=layout,
+        seed=seed,
+        postgres_compatible=True,
+    )
+    docs = workdir / f"{layout}-{tasks}" / "docs"
+    manifest = generate_corpus(docs, spec)
+    options = BootstrapOptions(ensure_indexes=ensure_indexes)
+    with scratch_database(admin_dsn) as dsn:
+        initial = bootstrap_pass(docs, dsn, options)
+        rerun = bootstrap_pass(docs, dsn, options)
+    return {
+        "layout": layout,
+        "tasks": manifest.tasks,
+        "features": manifest.features,
+        "dependencies": manifest.dependencies,
+        "ensure_indexes": ensure_indexes,
+        "initial": initial.to_dict(),
+        "rerun": rerun.to_dict(),
+    }
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.postgres_harness", description=__doc__.split("\n\n")[1]
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Task counts to run.")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=["flat"], help="Corpus layouts to run.")
+    parser.add_argument("--density", type=float, default=1.0, help="Mean dependency edges per task.")
+    parser.add_argument("--ensure-indexes", action="store_true", help="Create the metadata->>'code' index first.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dsn", default=os.getenv("SPECKIT_BENCH_PG_DSN"), help="Use this server instead of initdb.")
+    parser.add_argument("--pg-bin", type=Path, default=None, help="Directory containing initdb and pg_ctl.")
+    parser.add_argument("--workdir", type=Path, default=None, help="Keep corpora (and pgdata) here.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here (default: stdout).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="speckit-bench-pg-"))
+    try:
+        with contextlib.ExitStack() as stack:
+            admin_dsn = args.dsn or stack.enter_context(local_postgres(find_pg_bin(args.pg_bin), workdir))
+            results = [
+                run_case(
+                    admin_dsn,
+                    workdir,
+                    layout,
+                    size,
+                    dependency_density=args.density,
+                    ensure_indexes=args.ensure_indexes,
+                    seed=args.seed,
+                )
+                for layout in args.layouts
+                for size in args.sizes
+            ]
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps({"environment": environment(), "results": results}, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
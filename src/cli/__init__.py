@@ -18,6 +18,7 @@ from src.cli.commands.parallelize import register as register_parallelize
 from src.cli.commands.specify import register as register_specify
 from src.cli.commands.plan import register as register_plan
 from src.cli.commands.context import register as register_context
+from src.cli.commands.search import register as register_search
 
 app = typer.Typer(help="Speckit developer tooling")
 register_db_prepare(app)
@@ -31,5 +32,6 @@ register_parallelize(app)
 register_specify(app)
 register_plan(app)
 register_context(app)
+register_search(app)
 
 __all__ = ["app"]
@@ -7,6 +7,7 @@ from __future__ import annotations
 import errno
 import hashlib
 import logging
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
@@ -15,12 +16,17 @@ import typer
 from src.lib.error_reporter import ErrorReporter
 from src.lib.config_loader import BootstrapConfig, ConfigLoader
 from src.lib.locking import LockConfig, queue_lock
-from src.lib.logging import LogFormat, configure_logging
+from src.lib.logging import LogFormat, configure_logging, shutdown_logging
 from src.lib.metrics import emit_bootstrap_summary
+from src.lib.parse_cache import DEFAULT_CACHE_DIR, activate_parse_cache
+from src.lib.profiling import maybe_profile, profile_paths
 from src.lib.resource_guard import ResourceGuard, ResourceLimits
 from src.services.bootstrap_options import BootstrapOptions
 from src.services.bootstrap_orchestrator import BootstrapOrchestrator
 from src.services.data_store_gateway import DataStoreGateway
+from src.services.doc_watcher import create_watcher, wait_for_burst
+from src.services.postgres_pool import PostgresPoolConfig
+from src.services.sqlite_connection import DEFAULT_PRAGMA_PROFILE, PRAGMA_PROFILES
 from src.services.rollback_manager import RollbackManager
 
 logger = logging.getLogger("speckit.db_prepare")
@@ -56,11 +62,36 @@ def register(app: typer.Typer) -> None:
             "--enable-experimental-postgres",
             help="Enable experimental PostgreSQL backend (disabled by default).",
         ),
+        sqlite_profile: str = typer.Option(
+            DEFAULT_PRAGMA_PROFILE,
+            "--sqlite-profile",
+            help=(
+                f"SQLite pragma profile ({'|'.join(PRAGMA_PROFILES)}). 'tuned' (WAL) and 'fast' are quicker "
+                "but may lose the last committed runs on power loss."
+            ),
+        ),
+        pg_pool_max: int = typer.Option(
+            4,
+            "--pg-pool-max",
+            min=1,
+            help="Maximum pooled PostgreSQL connections.",
+        ),
+        pg_statement_timeout_ms: Optional[int] = typer.Option(
+            None,
+            "--pg-statement-timeout-ms",
+            min=0,
+            help="statement_timeout applied to pooled PostgreSQL sessions (default: server setting).",
+        ),
         log_format: LogFormat = typer.Option(
             LogFormat.HUMAN,
             "--log-format",
             help="Logging output format (human|json).",
         ),
+        async_logging: bool = typer.Option(
+            False,
+            "--async-logging",
+            help="Format and write log lines on a background thread instead of the pipeline thread.",
+        ),
         verbose: bool = typer.Option(
             False,
             "--verbose",
@@ -93,6 +124,64 @@ def register(app: typer.Typer) -> None:
             "--skip-ai-jobs",
             help="Skip creation of AI job entities.",
         ),
+        incremental: bool = typer.Option(
+            False,
+            "--incremental",
+            help="Re-parse and persist only documents changed since the last run (SQLite only).",
+        ),
+        jobs: int = typer.Option(
+            1,
+            "--jobs",
+            "-j",
+            min=0,
+            help="Parse feature/spec/task documents across N worker processes (0 = all available cores).",
+        ),
+        ensure_indexes: bool = typer.Option(
+            False,
+            "--ensure-indexes",
+            help="Create the unique index on tasks (metadata->>'code') before persisting (PostgreSQL).",
+        ),
+        watch: bool = typer.Option(
+            False,
+            "--watch",
+            help="Keep running and re-bootstrap incrementally whenever documentation changes (SQLite only).",
+        ),
+        watch_debounce_ms: int = typer.Option(
+            300,
+            "--watch-debounce-ms",
+            min=0,
+            help="Quiet period that ends a burst of file events in --watch mode.",
+        ),
+        max_memory_mb: int = typer.Option(
+            ResourceLimits.max_memory_mb,
+            "--max-memory-mb",
+            min=1,
+            help="Abort (and roll back) once resident memory exceeds this many MB.",
+        ),
+        max_cpu_cores: Optional[float] = typer.Option(
+            None,
+            "--max-cpu-cores",
+            min=0.5,
+            help="CPU budget in cores, worker processes included (default: all usable cores). "
+            "Parser workers are reduced when a run goes over it.",
+        ),
+        max_file_mb: int = typer.Option(
+            ResourceLimits.max_file_mb,
+            "--max-file-mb",
+            min=1,
+            help="Reject documentation files larger than this many MB.",
+        ),
+        trace_allocations: int = typer.Option(
+            0,
+            "--trace-allocations",
+            min=0,
+            help="Log the top N allocation sites (tracemalloc; slows the run).",
+        ),
+        profile: Optional[Path] = typer.Option(
+            None,
+            "--profile",
+            help="Write PATH.pstats (cProfile) and PATH.collapsed (flamegraph stacks tagged by stage).",
+        ),
     ) -> None:
         """
         Bootstrap Speckit documentation into system data storage.
@@ -102,7 +191,7 @@ def register(app: typer.Typer) -> None:
         data to the configured SQLite or PostgreSQL database.
         """
 
-        configure_logging(level=logging.DEBUG if verbose else logging.INFO, fmt=log_format)
+        configure_logging(level=logging.DEBUG if verbose else logging.INFO, fmt=log_format, queued=async_logging)
         config = ConfigLoader(docs_root=docs_path, storage_path=storage_path).materialize()
         options = BootstrapOptions(
             dry_run=dry_run,
@@ -110,8 +199,36 @@ def register(app: typer.Typer) -> None:
             project=project,
             skip_task_runs=skip_task_runs,
             skip_ai_jobs=skip_ai_jobs,
+            incremental=incremental,
+            jobs=jobs,
+            ensure_indexes=ensure_indexes,
         )
-        _run_bootstrap(config, options, db_url, enable_experimental_postgres)
+        if sqlite_profile not in PRAGMA_PROFILES:
+            typer.echo(f"Unknown --sqlite-profile '{sqlite_profile}'. Choose from: {', '.join(PRAGMA_PROFILES)}.")
+            raise typer.Exit(code=1)
+        if watch and db_url:
+            typer.echo("--watch is only supported on the SQLite backend. Re-run without --db-url.")
+            raise typer.Exit(code=1)
+        pool_config = PostgresPoolConfig(
+            min_size=1, max_size=pg_pool_max, statement_timeout_ms=pg_statement_timeout_ms
+        )
+        guard = ResourceGuard(
+            ResourceLimits(max_memory_mb=max_memory_mb, max_cpu_cores=max_cpu_cores, max_file_mb=max_file_mb),
+            trace_allocations=trace_allocations,
+        )
+        try:
+            with maybe_profile(profile, "db.prepare"):
+                if watch:
+                    _watch(config, replace(options, incremental=True), watch_debounce_ms / 1000, sqlite_profile, guard)
+                else:
+                    _run_bootstrap(
+                        config, options, db_url, enable_experimental_postgres, pool_config, sqlite_profile, guard
+                    )
+        finally:
+            shutdown_logging()
+            if profile is not None:
+                output = profile_paths(profile)
+                typer.echo(f"Profile written to {output.pstats_path} and {output.collapsed_path}")
 
 
 def _run_bootstrap(
@@ -119,11 +236,16 @@ def _run_bootstrap(
     options: BootstrapOptions,
     db_url: Optional[str] = None,
     enable_experimental_postgres: bool = False,
+    pool_config: Optional[PostgresPoolConfig] = None,
+    sqlite_profile: Optional[str] = None,
+    guard: Optional[ResourceGuard] = None,
 ) -> None:
     """
     Execute the bootstrap pipeline using the configured orchestrator.
     """
 
+    guard = guard or ResourceGuard()
+
     logger.info("Bootstrapping Speckit documentation", extra={"docs": str(config.docs_root)})
     gateway_target = db_url if db_url else config.storage_path
     lock_target = db_url if db_url else str(config.storage_path)
@@ -141,12 +263,16 @@ def _run_bootstrap(
         )
         raise typer.Exit(code=1)
 
+    if db_url and options.incremental:
+        typer.echo("--incremental is only supported on the SQLite backend. Re-run without --incremental.")
+        raise typer.Exit(code=1)
+
     lock_config = LockConfig(lock_dir=config.storage_path.parent / ".locks")
     queue_name = _lock_name_for_run(config, lock_target)
 
     try:
         with queue_lock(lock_config, queue_name, non_blocking=True):
-            ResourceGuard(ResourceLimits(max_memory_mb=2048, max_cpu_percent=95, max_file_mb=50)).enforce_all()
+            guard.enforce_all()
 
             rollback_manager = RollbackManager()
             created_sqlite_db = False
@@ -158,10 +284,21 @@ def _run_bootstrap(
                 )
 
             try:
-                gateway = DataStoreGateway(gateway_target, enable_experimental_postgres=enable_experimental_postgres)
-                orchestrator = BootstrapOrchestrator(config.docs_root, gateway)
+                gateway = DataStoreGateway(
+                    gateway_target,
+                    enable_experimental_postgres=enable_experimental_postgres,
+                    pool_config=pool_config,
+                    sqlite_profile=sqlite_profile,
+                )
+                orchestrator = BootstrapOrchestrator(config.docs_root, gateway, resource_guard=guard)
 
-                summary = orchestrator.run_bootstrap(options)
+                # The parse cache lives next to the SQLite file so `speckit validate` run from the
+                # same root shares it (both default to .speckit/).
+                try:
+                    with guard.monitor(), activate_parse_cache(config.storage_path.parent / DEFAULT_CACHE_DIR.name):
+                        summary = orchestrator.run_bootstrap(options)
+                finally:
+                    gateway.close()
                 emit_bootstrap_summary(summary)
             except Exception:
                 rollback_manager.rollback()
@@ -173,14 +310,23 @@ def _run_bootstrap(
             else:
                 rollback_manager.actions.clear()
 
-    except BlockingIOError:
+    except OSError as exc:
+        if not _is_lock_contention(exc):
+            raise
         typer.echo("Another speckit.db.prepare run is already in progress for this target. Try again later.")
         raise typer.Exit(code=1)
-    except OSError as exc:
-        if getattr(exc, "errno", None) in {errno.EWOULDBLOCK, errno.EAGAIN}:
-            typer.echo("Another speckit.db.prepare run is already in progress for this target. Try again later.")
-            raise typer.Exit(code=1)
-        raise
+
+    if not _report_summary(summary, options):
+        raise typer.Exit(code=1)
+
+
+def _is_lock_contention(exc: OSError) -> bool:
+    """Whether a non-blocking `queue_lock` failed because another run holds the lock."""
+    return isinstance(exc, BlockingIOError) or exc.errno in {errno.EWOULDBLOCK, errno.EAGAIN}
+
+
+def _report_summary(summary, options: BootstrapOptions) -> bool:
+    """Echo the validation report and run counts; return whether the run succeeded."""
 
     if summary.validation_result:
         report = ErrorReporter.format_report(summary.validation_result)
@@ -190,7 +336,7 @@ def _run_bootstrap(
         typer.echo("Bootstrap failed.")
         if summary.error_message:
             typer.echo(summary.error_message)
-        raise typer.Exit(code=1)
+        return False
 
     typer.echo("Bootstrap completed successfully.")
     typer.echo(
@@ -199,3 +345,59 @@ def _run_bootstrap(
         f"Dependencies: {summary.dependency_count}, "
         f"Task Runs: {summary.task_run_count}, AI Jobs: {summary.ai_job_count}"
     )
+    if options.incremental:
+        typer.echo(
+            f"Incremental: {summary.changed_file_count} changed file(s), "
+            f"{summary.unchanged_file_count} unchanged file(s) reused."
+        )
+    if summary.storage_profile:
+        settings = ", ".join(f"{k}={v}" for k, v in summary.storage_profile.items() if k != "backend")
+        typer.echo(f"Storage: {summary.storage_profile.get('backend', 'unknown')} ({settings})")
+    return True
+
+
+def _watch(
+    config: BootstrapConfig,
+    options: BootstrapOptions,
+    debounce_seconds: float,
+    sqlite_profile: Optional[str] = None,
+    guard: Optional[ResourceGuard] = None,
+) -> None:
+    """
+    Run an incremental bootstrap, then re-run it after every burst of documentation changes.
+
+    The gateway, orchestrator (with its in-memory entity graph) and parse cache stay alive
+    between runs, so each re-run only pays for the files that changed.
+    """
+
+    lock_config = LockConfig(lock_dir=config.storage_path.parent / ".locks")
+    queue_name = _lock_name_for_run(config, str(config.storage_path))
+    gateway = DataStoreGateway(config.storage_path, sqlite_profile=sqlite_profile)
+    guard = guard or ResourceGuard()
+    orchestrator = BootstrapOrchestrator(config.docs_root, gateway, resource_guard=guard)
+
+    # Start watching before the first run so edits made while it runs are not missed.
+    watcher = create_watcher(config.docs_root)
+    try:
+        with activate_parse_cache(config.storage_path.parent / DEFAULT_CACHE_DIR.name):
+            while True:
+                try:
+                    with queue_lock(lock_config, queue_name, non_blocking=True):
+                        guard.enforce_all()
+                        with guard.monitor():
+                            summary = orchestrator.run_bootstrap(options)
+                        emit_bootstrap_summary(summary)
+                    _report_summary(summary, options)
+                except OSError as exc:
+                    if not _is_lock_contention(exc):
+                        raise
+                    typer.echo("Another speckit.db.prepare run is in progress for this target; waiting for the next change.")
+
+                typer.echo(f"Watching {config.docs_root} for changes (Ctrl+C to stop)...")
+                changed = wait_for_burst(watcher, debounce_seconds)
+                logger.info("Documentation changed", extra={"changed_paths": len(changed)})
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+    finally:
+        watcher.close()
+        gateway.close()
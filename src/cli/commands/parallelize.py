@@ -30,23 +30,21 @@ def register(app: typer.Typer) -> None:
         for task in tasks:
             deps = sorted(task.get('metadata', {}).get('dependencies', []))
             dep_key = ",".join(deps) if deps else "none"
-            
-            if dep_key not in dep_groups:
-                dep_groups[dep_key] = []
-            dep_groups[dep_key].append(task['code'])
+            dep_groups.setdefault(dep_key, []).append(task['code'])
             
         parallel_count = 0
+        group_of: Dict[str, str] = {}
         for dep_key, task_codes in dep_groups.items():
             if len(task_codes) > 1:
                 typer.echo(f"   • Parallel Group (deps: {dep_key}): {', '.join(task_codes)}")
                 parallel_count += 1
-                
-                # Mark tasks as parallel in metadata
-                for task in tasks:
-                    if task['code'] in task_codes:
-                        if 'metadata' not in task:
-                            task['metadata'] = {}
-                        task['metadata']['parallel_group'] = dep_key
+                group_of.update(dict.fromkeys(task_codes, dep_key))
+
+        # Mark tasks as parallel in metadata
+        for task in tasks:
+            dep_key = group_of.get(task['code'])
+            if dep_key is not None:
+                task.setdefault('metadata', {})['parallel_group'] = dep_key
         
         with open(tasks_file, 'w', encoding='utf-8') as f:
             json.dump(tasks, f, indent=2)
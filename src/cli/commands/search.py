@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from src.services.data_store_gateway import DataStoreGateway
+from src.services.sqlite_gateway import SEARCH_ENTITY_TYPES
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("search")
+    def search(
+        query: str = typer.Argument(..., help="Search terms; all must match. End a term with * for prefix matches."),
+        entity_type: Optional[str] = typer.Option(
+            None, "--type", help=f"Restrict hits to one entity type ({', '.join(SEARCH_ENTITY_TYPES)})"
+        ),
+        limit: int = typer.Option(20, "--limit", min=1, help="Maximum number of hits"),
+        as_json: bool = typer.Option(False, "--json", help="Emit hits as a JSON array"),
+        rebuild: bool = typer.Option(False, "--rebuild", help="Repopulate the search index before querying"),
+        storage_path: Optional[Path] = typer.Option(None, "--storage-path", help="Path to SQLite DB"),
+        db_url: Optional[str] = typer.Option(None, "--db-url", help="PostgreSQL Connection String"),
+    ):
+        """
+        Full-text search over task titles and acceptance criteria, feature names and descriptions,
+        and spec titles and bodies in the store populated by `db prepare`.
+
+        Hits are ranked by BM25, best first.
+        """
+        if entity_type is not None and entity_type not in SEARCH_ENTITY_TYPES:
+            typer.echo(f"❌ Unknown --type '{entity_type}'. Choose from: {', '.join(SEARCH_ENTITY_TYPES)}.", err=True)
+            raise typer.Exit(code=2)
+
+        final_storage_path = storage_path if storage_path else Path.cwd() / ".speckit/db.sqlite"
+        if not db_url and not final_storage_path.exists():
+            typer.echo(f"❌ No store found at {final_storage_path}. Run `speckit db prepare` first.", err=True)
+            raise typer.Exit(code=1)
+
+        gateway = DataStoreGateway(db_url if db_url else final_storage_path, enable_experimental_postgres=bool(db_url))
+        try:
+            if rebuild:
+                gateway.rebuild_search_index()
+            hits = gateway.search(query, entity_type=entity_type, limit=limit)
+        except (RuntimeError, ValueError) as exc:
+            typer.echo(f"❌ {exc}", err=True)
+            raise typer.Exit(code=1)
+        finally:
+            gateway.close()
+
+        if as_json:
+            typer.echo(json.dumps([asdict(hit) for hit in hits], indent=2))
+            return
+
+        if not hits:
+            typer.echo("No matches.")
+            return
+        for hit in hits:
+            typer.echo(f"{hit.entity_type:<8} {hit.code:<24} {hit.title}")
+            if hit.snippet:
+                typer.echo(f"         {' '.join(hit.snippet.split())}")
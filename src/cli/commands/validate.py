@@ -5,6 +5,8 @@ from typing import Optional
 import typer
 
 from src.core.config import SpeckitConfig
+from src.lib.parse_cache import DEFAULT_CACHE_DIR, activate_parse_cache
+from src.lib.profiling import maybe_profile, profile_paths
 from src.validation.validator import ProjectValidator
 from src.validation.error_formatter import ErrorFormatter
 
@@ -16,7 +18,10 @@ def register(app: typer.Typer) -> None:
         strict: bool = typer.Option(False, "--strict", help="Treat warnings as errors"),
         fix: bool = typer.Option(False, "--fix", help="Auto-fix fixable issues"),
         explain: bool = typer.Option(False, "--explain", help="Show detailed explanations"),
-        config_path: Path = typer.Option(Path("speckit.yaml"), "--config-path", help="Path to config file")
+        config_path: Path = typer.Option(Path("speckit.yaml"), "--config-path", help="Path to config file"),
+        profile: Optional[Path] = typer.Option(
+            None, "--profile", help="Write PATH.pstats (cProfile) and PATH.collapsed (flamegraph stacks)"
+        ),
     ):
         """Validate project structure and files"""
         
@@ -31,11 +36,15 @@ def register(app: typer.Typer) -> None:
             validator = ProjectValidator(config, project_root)
             
             # Auto-fix if requested
-            if fix:
-                typer.echo("🔧 Auto-fixing issues...")
-                result = validator.auto_fix()
-            else:
-                result = validator.validate(strict=strict)
+            with maybe_profile(profile, "validate"), activate_parse_cache(project_root / DEFAULT_CACHE_DIR):
+                if fix:
+                    typer.echo("🔧 Auto-fixing issues...")
+                    result = validator.auto_fix()
+                else:
+                    result = validator.validate(strict=strict)
+            if profile is not None:
+                output = profile_paths(profile)
+                typer.echo(f"📈 Profile written to {output.pstats_path} and {output.collapsed_path}")
             
             # Format and display results
             formatter = ErrorFormatter()
@@ -0,0 +1,281 @@
+"""
+Compact task dependency graph.
+
+`TaskGraph` interns task codes to integer ids and stores the deduplicated edges twice in CSR
+form (an ``array`` of ``len(graph) + 1`` offsets into a flat ``array`` of targets): once from
+each task to the tasks it depends on, once from each task to its dependents. It is built once
+per bootstrap run and shared by validation, step ordering and ``parallelize``.
+
+Cycle detection is an iterative Tarjan strongly-connected-components pass, so it is O(V + E)
+and never hits Python's recursion limit however deep the dependency chains are. Every group
+of mutually dependent tasks is reported once, together with a shortest witness cycle through
+the group's first task (found by a breadth-first search restricted to the group).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Sequence
+
+from src.models.entities import TaskDTO, TaskDependencyDTO
+
+
+@dataclass(frozen=True)
+class CycleGroup:
+    # Every task in the strongly connected component, in first-seen order.
+    members: tuple[str, ...]
+    # Shortest cycle through ``members[0]``, closed: ``("A", "B", "A")``.
+    witness: tuple[str, ...]
+
+
+def _csr(node_count: int, rows: array, columns: array) -> tuple[array, array]:
+    """Offsets and targets for the ``rows[i] -> columns[i]`` edges, keeping their input order per row."""
+    offsets = array("l", bytes(array("l").itemsize * (node_count + 1)))
+    for row in rows:
+        offsets[row + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+    targets = array("i", bytes(array("i").itemsize * len(columns)))
+    positions = offsets[:-1]
+    for row, column in zip(rows, columns):
+        targets[positions[row]] = column
+        positions[row] += 1
+    return offsets, targets
+
+
+class TaskGraph:
+    """
+    Immutable dependency graph over interned task codes.
+
+    Node ids run from 0 in the order codes were first seen; `codes` maps them back. Edges
+    point from a task to the tasks it depends on, so `in_degree` is a task's dependency count.
+    """
+
+    __slots__ = ("codes", "_ids", "_normalize", "_dependency_offsets", "_dependencies", "_dependent_offsets", "_dependents")
+
+    def __init__(
+        self,
+        codes: Sequence[str],
+        ids: dict[str, int],
+        edges: Iterable[tuple[int, int]],
+        normalize: Callable[[str], str],
+    ) -> None:
+        self.codes: tuple[str, ...] = tuple(codes)
+        self._ids = ids
+        self._normalize = normalize
+
+        node_count = len(self.codes)
+        seen: set[int] = set()
+        tasks, dependencies = array("i"), array("i")
+        for task, dependency in edges:
+            key = task * node_count + dependency
+            if key in seen:
+                continue
+            seen.add(key)
+            tasks.append(task)
+            dependencies.append(dependency)
+        self._dependency_offsets, self._dependencies = _csr(node_count, tasks, dependencies)
+        self._dependent_offsets, self._dependents = _csr(node_count, dependencies, tasks)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[TaskDTO], dependencies: Iterable[TaskDependencyDTO]) -> "TaskGraph":
+        """One node per task, matched case-insensitively; edges touching unknown codes are dropped."""
+        ids: dict[str, int] = {}
+        codes: list[str] = []
+        for task in tasks:
+            key = task.code.lower()
+            if key not in ids:
+                ids[key] = len(codes)
+                codes.append(task.code)
+
+        def edges() -> Iterable[tuple[int, int]]:
+            for dep in dependencies:
+                task = ids.get(dep.task_code.lower())
+                dependency = ids.get(dep.depends_on.lower())
+                if task is not None and dependency is not None:
+                    yield task, dependency
+
+        return cls(codes, ids, edges(), str.lower)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[str, str]], codes: Iterable[str] = ()) -> "TaskGraph":
+        """Graph of ``(task, dependency)`` code pairs, compared exactly; ``codes`` adds isolated nodes first."""
+        ids: dict[str, int] = {}
+        names: list[str] = []
+
+        def intern(code: str) -> int:
+            node = ids.get(code)
+            if node is None:
+                node = ids[code] = len(names)
+                names.append(code)
+            return node
+
+        for code in codes:
+            intern(code)
+        pairs = [(intern(task), intern(dependency)) for task, dependency in edges]
+        return cls(names, ids, pairs, lambda code: code)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._dependencies)
+
+    def id_of(self, code: str) -> Optional[int]:
+        return self._ids.get(self._normalize(code))
+
+    def dependencies(self, node: int) -> array:
+        return self._dependencies[self._dependency_offsets[node] : self._dependency_offsets[node + 1]]
+
+    def dependents(self, node: int) -> array:
+        return self._dependents[self._dependent_offsets[node] : self._dependent_offsets[node + 1]]
+
+    def in_degree(self, node: int) -> int:
+        return self._dependency_offsets[node + 1] - self._dependency_offsets[node]
+
+    def topological_order(self) -> array:
+        """Node ids with every dependency before its dependents; tasks on or behind a cycle are left out."""
+        remaining = array("i", (self.in_degree(node) for node in range(len(self))))
+        order = array("i", (node for node in range(len(self)) if remaining[node] == 0))
+        offsets, dependents = self._dependent_offsets, self._dependents
+        position = 0
+        while position < len(order):
+            node = order[position]
+            position += 1
+            for dependent in dependents[offsets[node] : offsets[node + 1]]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    order.append(dependent)
+        return order
+
+    def levels(self) -> array:
+        """Per node, 1 for a task without dependencies, else one more than its deepest dependency."""
+        levels = array("i", [1]) * len(self)
+        offsets, dependents = self._dependent_offsets, self._dependents
+        for node in self.topological_order():
+            next_level = levels[node] + 1
+            for dependent in dependents[offsets[node] : offsets[node + 1]]:
+                if levels[dependent] < next_level:
+                    levels[dependent] = next_level
+        return levels
+
+    def ancestors(self, node: int) -> set[int]:
+        """Every task ``node`` depends on, directly or transitively."""
+        return self._reachable(node, self._dependency_offsets, self._dependencies)
+
+    def descendants(self, node: int) -> set[int]:
+        """Every task that depends on ``node``, directly or transitively."""
+        return self._reachable(node, self._dependent_offsets, self._dependents)
+
+    @staticmethod
+    def _reachable(start: int, offsets: array, targets: array) -> set[int]:
+        found: set[int] = set()
+        pending = [start]
+        while pending:
+            node = pending.pop()
+            for target in targets[offsets[node] : offsets[node + 1]]:
+                if target not in found:
+                    found.add(target)
+                    pending.append(target)
+        return found
+
+    def strongly_connected_components(self) -> list[list[int]]:
+        """Tarjan's SCCs without recursion; a component comes out after every component it depends on."""
+        offsets, targets = self._dependency_offsets, self._dependencies
+        n = len(self)
+        index = array("i", [-1]) * n
+        lowlink = array("i", [0]) * n
+        on_stack = bytearray(n)
+        stack: list[int] = []
+        components: list[list[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # Explicit call stack of (node, offset of the next edge to follow).
+            work = [(root, offsets[root])]
+            while work:
+                node, position = work[-1]
+                if position < offsets[node + 1]:
+                    work[-1] = (node, position + 1)
+                    successor = targets[position]
+                    if index[successor] == -1:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = 1
+                        work.append((successor, offsets[successor]))
+                    elif on_stack[successor] and index[successor] < lowlink[node]:
+                        lowlink[node] = index[successor]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    component: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def _shortest_cycle(self, start: int, members: set[int]) -> list[int]:
+        """Shortest path from ``start`` back to itself using only ``members``."""
+        parent = {start: start}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for successor in self.dependencies(node):
+                if successor not in members:
+                    continue
+                if successor == start:
+                    path = [start]
+                    while node != start:
+                        path.append(node)
+                        node = parent[node]
+                    path.append(start)
+                    path.reverse()
+                    return path
+                if successor not in parent:
+                    parent[successor] = node
+                    queue.append(successor)
+        raise AssertionError("start is not on a cycle")  # pragma: no cover
+
+    def cycles(self) -> list[CycleGroup]:
+        """Every cycle group, ordered by first member; a self-dependency is a group of one."""
+        groups: list[tuple[int, CycleGroup]] = []
+        for component in self.strongly_connected_components():
+            if len(component) == 1 and component[0] not in self.dependencies(component[0]):
+                continue
+            component.sort()
+            witness = self._shortest_cycle(component[0], set(component))
+            groups.append(
+                (
+                    component[0],
+                    CycleGroup(
+                        members=tuple(self.codes[node] for node in component),
+                        witness=tuple(self.codes[node] for node in witness),
+                    ),
+                )
+            )
+        groups.sort(key=lambda item: item[0])
+        return [group for _, group in groups]
+
+
+def find_cycles(edges: Iterable[tuple[str, str]]) -> list[CycleGroup]:
+    """Every cycle group in the graph of ``(task, dependency)`` code pairs, in first-seen order."""
+    return TaskGraph.from_edges(edges).cycles()
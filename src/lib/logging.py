@@ -1,14 +1,30 @@
 """
 Structured logging helpers for Speckit CLI tooling.
+
+With ``queued=True`` the calling thread only enqueues records; a `QueueListener` thread
+formats and writes them, so a chatty run is not blocked on stdout. Call `shutdown_logging`
+before exiting to drain the queue.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import queue
 import sys
 from enum import Enum
-from typing import Any, TypedDict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional, TypedDict
+
+# Attributes every LogRecord carries, plus those set by formatting/queueing; anything else came from `extra=`.
+_RESERVED_RECORD_KEYS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+_listener: Optional[QueueListener] = None
 
 class LogFormat(str, Enum):
     HUMAN = "human"
@@ -36,22 +52,19 @@ class JsonFormatter(logging.Formatter):
             "lineno": record.lineno,
         }
 
-        extras = {
-            k: v
-            for k, v in record.__dict__.items()
-            if k not in logging.LogRecord("", 0, "", 0, "", (), None).__dict__
-        }
+        extras = {k: v for k, v in record.__dict__.items() if k not in _RESERVED_RECORD_KEYS}
         if extras:
             payload["extras"] = extras
 
         return json.dumps(payload, ensure_ascii=False)
 
 
-def configure_logging(level: int = logging.INFO, fmt: LogFormat = "human") -> None:
+def configure_logging(level: int = logging.INFO, fmt: LogFormat = "human", queued: bool = False) -> None:
     """
-    Configure root logging with the requested format.
+    Configure root logging with the requested format, optionally behind a background queue.
     """
 
+    shutdown_logging()
     handler = logging.StreamHandler(stream=sys.stdout)
     if fmt == "json":
         handler.setFormatter(JsonFormatter())
@@ -63,4 +76,36 @@ def configure_logging(level: int = logging.INFO, fmt: LogFormat = "human") -> No
             )
         )
 
-    logging.basicConfig(level=level, handlers=[handler], force=True)
+    if not queued:
+        logging.basicConfig(level=level, handlers=[handler], force=True)
+        return
+
+    global _listener
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+    enqueue = QueueHandler(records)
+    # QueueHandler bakes the formatted text into record.msg; keep it to the message (plus any traceback)
+    # so the listener's formatter does not see a second level/name prefix.
+    enqueue.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[enqueue], force=True)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background listener started by ``configure_logging(queued=True)``, if any."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    # Records logged after shutdown go straight to the real handlers instead of an unread queue.
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        handler.flush()
+        root.addHandler(handler)
+
+
+atexit.register(shutdown_logging)
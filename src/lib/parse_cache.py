@@ -0,0 +1,254 @@
+"""
+Persistent, content-addressed cache for parsed YAML frontmatter.
+
+Both parsing stacks (``src.parsing`` / the validation rules and ``src.services.parser``) load
+frontmatter through ``cached_yaml_load``. When a command has activated a cache with
+``activate_parse_cache`` the parsed mapping is looked up by a digest of the frontmatter text
+and the cache version, so ``speckit validate`` followed by ``speckit db.prepare`` only pays the
+YAML cost once per unique frontmatter block.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the cached representation or the frontmatter semantics change.
+PARSE_CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path(".speckit") / "cache"
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+CACHE_FILENAME = "parse_cache.sqlite"
+
+# Hits refresh ``last_used`` at most this often, so warm runs stay read-only.
+_TOUCH_INTERVAL_SECONDS = 60.0
+# Eviction trims the cache to this fraction of ``max_bytes`` to avoid evicting on every run.
+_EVICT_TARGET_RATIO = 0.8
+
+_active_cache: Optional["ParseCache"] = None
+
+
+def _encode_extra(value: Any) -> Any:
+    if isinstance(value, dt.datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, dt.date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Unsupported type {type(value).__name__}")
+
+
+def _decode_extra(obj: dict) -> Any:
+    if len(obj) == 1:
+        if "$datetime" in obj:
+            return dt.datetime.fromisoformat(obj["$datetime"])
+        if "$date" in obj:
+            return dt.date.fromisoformat(obj["$date"])
+    return obj
+
+
+def _serialize(value: Any) -> Optional[str]:
+    """Return a JSON payload for ``value`` or ``None`` when it does not round-trip exactly."""
+    try:
+        payload = json.dumps(value, default=_encode_extra, ensure_ascii=False, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    if _deserialize(payload) != value:
+        # e.g. non-string keys, NaN, or a mapping that looks like an encoded date.
+        return None
+    return payload
+
+
+def _deserialize(payload: str) -> Any:
+    return json.loads(payload, object_hook=_decode_extra)
+
+
+def _frontmatter_digest(text: str, version_tag: str) -> str:
+    # Both stacks slice frontmatter slightly differently (with or without the blank lines next
+    # to the fences); YAML ignores those, so they are not part of the key.
+    lines = text.split("\n")
+    start, end = 0, len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    normalized = "\n".join(lines[start:end])
+    return hashlib.sha256(f"{version_tag}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    SQLite-backed LRU cache of parsed frontmatter mappings.
+
+    Entries are keyed by content digest, so renamed or copied files hit the same entry and
+    stale entries simply stop being referenced until eviction removes them. Any storage error
+    disables the cache for the rest of the process; parsing itself never depends on it.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._path = cache_dir / CACHE_FILENAME
+        self._max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._disabled = False
+        self._memory: dict[str, str] = {}
+        self._version_tag: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _version(self) -> str:
+        if self._version_tag is None:
+            try:
+                import yaml
+
+                yaml_version = getattr(yaml, "__version__", "unknown")
+            except ImportError:  # pragma: no cover - callers raise MissingYAMLDependencyError first
+                yaml_version = "none"
+            self._version_tag = f"v{PARSE_CACHE_VERSION}:pyyaml-{yaml_version}"
+        return self._version_tag
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._disabled:
+            return None
+        pid = os.getpid()
+        if self._conn is not None and self._pid == pid:
+            return self._conn
+        # A connection inherited across fork() must not be reused.
+        self._conn = None
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS frontmatter ("
+                "digest TEXT PRIMARY KEY, payload TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_frontmatter_last_used ON frontmatter(last_used)")
+        except (sqlite3.Error, OSError) as exc:
+            self._disable(exc)
+            return None
+        self._conn = conn
+        self._pid = pid
+        return conn
+
+    def _disable(self, exc: BaseException) -> None:
+        logger.warning("Parse cache disabled (%s): %s", self._path, exc)
+        self._disabled = True
+        self._conn = None
+
+    def load_yaml(self, text: str, load: Callable[[str], Any]) -> Any:
+        """Return ``load(text)``, served from the cache when the same frontmatter was parsed before."""
+        digest = _frontmatter_digest(text, self._version())
+
+        payload = self._memory.get(digest)
+        if payload is None:
+            payload = self._read(digest)
+            if payload is not None:
+                self._memory[digest] = payload
+        if payload is not None:
+            self.hits += 1
+            return _deserialize(payload)
+
+        self.misses += 1
+        value = load(text)
+        payload = _serialize(value)
+        if payload is not None:
+            self._memory[digest] = payload
+            self._write(digest, payload)
+        return value
+
+    def _read(self, digest: str) -> Optional[str]:
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT payload, last_used FROM frontmatter WHERE digest = ?", (digest,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[1] > _TOUCH_INTERVAL_SECONDS:
+                conn.execute("UPDATE frontmatter SET last_used = ? WHERE digest = ?", (now, digest))
+            return row[0]
+        except sqlite3.Error as exc:
+            self._disable(exc)
+            return None
+
+    def _write(self, digest: str, payload: str) -> None:
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO frontmatter (digest, payload, size, last_used) VALUES (?, ?, ?, ?)",
+                (digest, payload, len(digest) + len(payload.encode("utf-8")), time.time()),
+            )
+        except sqlite3.Error as exc:
+            self._disable(exc)
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until the cache fits its size budget."""
+        conn = self._connection()
+        if conn is None:
+            return 0
+        try:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM frontmatter").fetchone()[0]
+            if total <= self._max_bytes:
+                return 0
+            excess = total - int(self._max_bytes * _EVICT_TARGET_RATIO)
+            # Walk entries oldest-first and cut at the last_used where the running total covers the excess.
+            freed = 0
+            cutoff: Optional[float] = None
+            for size, last_used in conn.execute("SELECT size, last_used FROM frontmatter ORDER BY last_used"):
+                freed += size
+                cutoff = last_used
+                if freed >= excess:
+                    break
+            removed = conn.execute("DELETE FROM frontmatter WHERE last_used <= ?", (cutoff,)).rowcount
+        except sqlite3.Error as exc:
+            self._disable(exc)
+            return 0
+        logger.debug("Parse cache evicted %d entries (%d bytes over budget)", removed, excess)
+        return removed
+
+    def close(self) -> None:
+        if self._conn is not None and self._pid == os.getpid():
+            self.evict()
+            if self._conn is not None:
+                self._conn.close()
+        self._conn = None
+        logger.debug("Parse cache: %d hits, %d misses", self.hits, self.misses)
+
+
+def cached_yaml_load(text: str, load: Callable[[str], Any]) -> Any:
+    """Parse frontmatter ``text`` with ``load`` through the active cache, if any."""
+    cache = _active_cache
+    if cache is None:
+        return load(text)
+    return cache.load_yaml(text, load)
+
+
+@contextlib.contextmanager
+def activate_parse_cache(cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> Iterator[ParseCache]:
+    """Make a ``ParseCache`` rooted at ``cache_dir`` active for the duration of a command."""
+    global _active_cache
+
+    cache = ParseCache(cache_dir, max_bytes=max_bytes)
+    previous = _active_cache
+    _active_cache = cache
+    try:
+        yield cache
+    finally:
+        _active_cache = previous
+        cache.close()
@@ -0,0 +1,121 @@
+"""
+Opt-in profiling for CLI commands (`--profile PATH`).
+
+A run is profiled two ways at once, using only the standard library:
+
+* ``cProfile`` on the calling thread, written as ``PATH.pstats`` (``python -m pstats``,
+  snakeviz, ...);
+* a sampling thread that snapshots every thread's stack at a fixed interval and writes
+  ``PATH.collapsed`` in the folded-stack format flamegraph tools read (``flamegraph.pl``,
+  speedscope, inferno). Each sample is prefixed with the bootstrap stages open at the time
+  (``stage:persist;stage:upsert.tasks;...``) so a flame graph splits by pipeline stage.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import contextlib
+import logging
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Iterator, Optional
+
+from src.lib.stage_timing import current_stages
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+@dataclass(frozen=True)
+class ProfileOutput:
+    pstats_path: Path
+    collapsed_path: Path
+
+
+def profile_paths(path: Path) -> ProfileOutput:
+    """``run`` and ``run.pstats`` both map to ``run.pstats`` / ``run.collapsed``."""
+    return ProfileOutput(pstats_path=path.with_suffix(".pstats"), collapsed_path=path.with_suffix(".collapsed"))
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    # ';' separates frames in the folded format; keep labels free of it.
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(";", ",")
+
+
+class _StackSampler(threading.Thread):
+    def __init__(self, label: str, interval: float) -> None:
+        super().__init__(name="speckit-profiler", daemon=True)
+        self._label = label
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.samples: Counter[str] = Counter()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        stages = current_stages()
+        prefix = [f"stage:{name}" for name in stages] or [f"stage:{self._label}"]
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == self.ident:
+                continue
+            stack: list[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples[";".join([*prefix, f"thread:{names.get(ident, ident)}", *stack])] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+@contextlib.contextmanager
+def profile_to(path: Path, label: str, interval: float = DEFAULT_SAMPLE_INTERVAL) -> Iterator[ProfileOutput]:
+    """
+    Profile the enclosed block and write both outputs next to ``path``.
+
+    Samples taken outside any bootstrap stage are tagged ``stage:<label>``. Output is written
+    even when the block raises (including ``typer.Exit``), since failing runs are usually the
+    ones worth profiling. Work in ``--jobs`` worker processes is not captured.
+    """
+    output = profile_paths(path)
+    output.pstats_path.parent.mkdir(parents=True, exist_ok=True)
+
+    sampler = _StackSampler(label, interval)
+    profiler = cProfile.Profile()
+    sampler.start()
+    profiler.enable()
+    try:
+        yield output
+    finally:
+        profiler.disable()
+        sampler.stop()
+        profiler.dump_stats(str(output.pstats_path))
+        with output.collapsed_path.open("w", encoding="utf-8") as handle:
+            for stack, count in sorted(sampler.samples.items()):
+                handle.write(f"{stack} {count}\n")
+        logger.info(
+            "Profile written",
+            extra={
+                "pstats": str(output.pstats_path),
+                "collapsed": str(output.collapsed_path),
+                "samples": sum(sampler.samples.values()),
+            },
+        )
+
+
+def maybe_profile(path: Optional[Path], label: str):
+    """`profile_to` when ``path`` is given, otherwise a no-op context."""
+    if path is None:
+        return contextlib.nullcontext()
+    return profile_to(path, label)
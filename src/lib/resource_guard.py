@@ -1,65 +1,279 @@
 """
 Resource guard utilities for monitoring CPU/memory/file sizes.
+
+`ResourceGuard.monitor()` runs a background sampler for the duration of a bootstrap run. It
+tracks the current resident set size (not the process-lifetime `ru_maxrss` peak) and CPU
+usage, records the peak RSS of every orchestrator stage, and flags a memory-limit breach so
+the next stage boundary aborts the run (and its transaction) instead of the OS killing it.
+
+CPU is budgeted in cores, counting worker processes as well as this one. Going over the
+budget never fails a run; it halves the worker count handed to the next parallel stage.
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
 import resource
+import threading
+import time
+import tracemalloc
 from dataclasses import dataclass
 from time import perf_counter
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SAMPLE_INTERVAL = 0.1
+
 
 @dataclass(frozen=True)
 class ResourceLimits:
-    max_memory_mb: int
-    max_cpu_percent: int
-    max_file_mb: int
+    max_memory_mb: int = 2048
+    # None: every core this process may run on (see `usable_cores`).
+    max_cpu_cores: Optional[float] = None
+    max_file_mb: int = 50
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    location: str
+    size_kb: float
+    count: int
+
+
+class ResourceLimitExceeded(RuntimeError):
+    """Raised at a stage boundary once the sampler has seen a limit breach."""
+
+
+def _peak_rss_mb() -> float:
+    usage_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if os.name == "posix" and os.uname().sysname != "Darwin":
+        return usage_kb / 1024
+    return usage_kb / (1024 * 1024)  # pragma: no cover - macOS reports bytes
+
+
+def usable_cores() -> int:
+    """Cores this process may be scheduled on (CPU affinity / cgroup cpusets), not the machine total."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:  # pragma: no cover - non-Linux
+        return max(1, os.cpu_count() or 1)
+
+
+def _live_children_cpu_seconds() -> float:
+    """CPU time of running child processes; `RUSAGE_CHILDREN` only covers children already reaped."""
+    total_ticks = 0
+    try:
+        tasks = os.listdir("/proc/self/task")
+    except OSError:  # pragma: no cover - non-Linux
+        return 0.0
+    for tid in tasks:
+        try:
+            with open(f"/proc/self/task/{tid}/children", "rb") as children:
+                pids = children.read().split()
+        except OSError:
+            continue
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid.decode()}/stat", "rb") as stat:
+                    # Fields after "(comm)": state, ppid, ..., utime (12th), stime (13th).
+                    fields = stat.read().rsplit(b")", 1)[1].split()
+                total_ticks += int(fields[11]) + int(fields[12])
+            except (OSError, ValueError, IndexError):
+                continue
+    return total_ticks / os.sysconf("SC_CLK_TCK")
+
+
+def process_cpu_seconds() -> float:
+    """User + system CPU of this process and all of its children, live or finished."""
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    reaped = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + reaped.ru_utime + reaped.ru_stime + _live_children_cpu_seconds()
+
+
+def current_rss_mb() -> float:
+    """Resident set size right now; falls back to the lifetime peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):  # pragma: no cover - non-Linux
+        return _peak_rss_mb()
 
 
 class ResourceGuard:
-    def __init__(self, limits: ResourceLimits) -> None:
-        self._limits = limits
+    def __init__(
+        self,
+        limits: Optional[ResourceLimits] = None,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        trace_allocations: int = 0,
+    ) -> None:
+        self._limits = limits or ResourceLimits()
         self._cpu_window_start = perf_counter()
+        self._cpu_seconds_start = process_cpu_seconds()
+        self._sample_interval = sample_interval
+        self._trace_allocations = trace_allocations
+        self._lock = threading.Lock()
+        self._stage_peaks: dict[str, float] = {}
+        self._violation: Optional[str] = None
+        self._over_cpu_budget = False
+        self._worker_cap = self._max_workers()
+        self.peak_rss_mb = 0.0
+        self.peak_cpu_cores = 0.0
+        self.top_allocations: list[AllocationSite] = []
 
-    def check_memory(self) -> None:
-        usage_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        if os.name == "posix":
-            mem_mb = usage_kb / 1024
-        else:  # pragma: no cover
-            mem_mb = usage_kb / (1024 * 1024)
+    @property
+    def limits(self) -> ResourceLimits:
+        return self._limits
+
+    @property
+    def cpu_budget_cores(self) -> float:
+        cores = usable_cores()
+        if self._limits.max_cpu_cores is None:
+            return float(cores)
+        return min(float(self._limits.max_cpu_cores), float(cores))
 
+    def _max_workers(self) -> int:
+        return max(1, int(self.cpu_budget_cores))
+
+    def check_memory(self) -> None:
+        mem_mb = current_rss_mb()
         if mem_mb > self._limits.max_memory_mb:
             raise MemoryError(f"Memory usage exceeded limit: {mem_mb:.2f}MB > {self._limits.max_memory_mb}MB")
         logger.debug("Memory usage OK", extra={"usage_mb": mem_mb})
 
-    def check_cpu(self) -> None:
-        current = perf_counter()
-        elapsed = current - self._cpu_window_start
-        if elapsed == 0:
-            return
+    def check_cpu(self) -> Optional[float]:
+        """
+        Return the cores used (this process plus children) since the guard was created.
 
-        # The CPU% estimate is unstable for extremely small elapsed windows,
-        # and can frequently report near-100% for trivial programs.
+        Never raises: a parallel stage is expected to use several cores, and overuse is handled
+        by `worker_budget` backing off instead.
+        """
+        elapsed = perf_counter() - self._cpu_window_start
+        # The estimate is unstable for extremely small elapsed windows.
         if elapsed < 0.25:
-            return
+            return None
 
-        usage = resource.getrusage(resource.RUSAGE_SELF)
-        cpu_time = usage.ru_utime + usage.ru_stime
-        cpu_percent = min(100.0, (cpu_time / elapsed) * 100)
-        if cpu_percent > self._limits.max_cpu_percent:
-            raise RuntimeError(f"CPU usage exceeded limit: {cpu_percent:.2f}% > {self._limits.max_cpu_percent}%")
-        logger.debug("CPU usage OK", extra={"usage_percent": cpu_percent})
+        cores = (process_cpu_seconds() - self._cpu_seconds_start) / elapsed
+        logger.debug("CPU usage", extra={"usage_cores": round(cores, 2), "budget_cores": self.cpu_budget_cores})
+        return cores
 
-    def check_file_size(self, file_path: str) -> None:
-        size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    def check_file_size(self, file_path: str, size_bytes: Optional[int] = None) -> None:
+        size = os.path.getsize(file_path) if size_bytes is None else size_bytes
+        size_mb = size / (1024 * 1024)
         if size_mb > self._limits.max_file_mb:
-            raise RuntimeError(f"File size exceeded limit: {size_mb:.2f}MB > {self._limits.max_file_mb}MB")
+            raise RuntimeError(f"File size exceeded limit: {size_mb:.2f}MB > {self._limits.max_file_mb}MB ({file_path})")
         logger.debug("File size OK", extra={"path": file_path, "size_mb": size_mb})
 
     def enforce_all(self) -> None:
         self.check_memory()
         self.check_cpu()
+
+    # -- continuous monitoring -------------------------------------------------------------
+
+    def _record(self, rss_mb: float) -> None:
+        with self._lock:
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+            for stage, peak in self._stage_peaks.items():
+                if rss_mb > peak:
+                    self._stage_peaks[stage] = rss_mb
+            if rss_mb > self._limits.max_memory_mb and self._violation is None:
+                self._violation = f"Memory usage exceeded limit: {rss_mb:.2f}MB > {self._limits.max_memory_mb}MB"
+                logger.error(self._violation)
+
+    def _sample_cpu(self, cores: float) -> None:
+        with self._lock:
+            self.peak_cpu_cores = max(self.peak_cpu_cores, cores)
+            # Half a core of slack for the coordinating main thread next to a full worker pool.
+            if cores > self.cpu_budget_cores + 0.5:
+                self._over_cpu_budget = True
+
+    def _run_sampler(self, stop: threading.Event) -> None:
+        last_wall, last_cpu = time.perf_counter(), process_cpu_seconds()
+        while not stop.wait(self._sample_interval):
+            self._record(current_rss_mb())
+            wall, cpu = time.perf_counter(), process_cpu_seconds()
+            if wall > last_wall:
+                # Reaped children can make the cumulative total step backwards; ignore those windows.
+                self._sample_cpu(max(0.0, cpu - last_cpu) / (wall - last_wall))
+            last_wall, last_cpu = wall, cpu
+
+    def worker_budget(self, requested: int) -> int:
+        """
+        Worker count for the next parallel stage: ``requested`` (``0`` = every usable core),
+        capped by the CPU budget and halved each time the sampler saw the previous stages
+        run over it.
+        """
+        with self._lock:
+            if self._over_cpu_budget:
+                self._over_cpu_budget = False
+                if self._worker_cap > 1:
+                    self._worker_cap = max(1, self._worker_cap // 2)
+                    logger.info(
+                        "CPU budget exceeded; reducing parser workers",
+                        extra={"workers": self._worker_cap, "budget_cores": self.cpu_budget_cores},
+                    )
+            cap = self._worker_cap
+        wanted = usable_cores() if requested <= 0 else requested
+        return max(1, min(wanted, cap))
+
+    @contextlib.contextmanager
+    def monitor(self) -> Iterator["ResourceGuard"]:
+        """Sample RSS and CPU in a background thread until the block exits."""
+        with self._lock:
+            # A guard may monitor several runs (db.prepare --watch); each starts clean.
+            self._violation = None
+            self._over_cpu_budget = False
+            self._worker_cap = self._max_workers()
+            self.peak_rss_mb = 0.0
+            self.peak_cpu_cores = 0.0
+            self._stage_peaks.clear()
+        stop = threading.Event()
+        sampler = threading.Thread(target=self._run_sampler, args=(stop,), name="speckit-resource-guard", daemon=True)
+        started_tracing = False
+        if self._trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        self._record(current_rss_mb())
+        sampler.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            sampler.join()
+            self._record(current_rss_mb())
+            if started_tracing:
+                self._collect_allocations()
+                tracemalloc.stop()
+
+    def _collect_allocations(self) -> None:
+        stats = tracemalloc.take_snapshot().statistics("lineno")[: self._trace_allocations]
+        self.top_allocations = [
+            AllocationSite(location=str(stat.traceback[0]), size_kb=stat.size / 1024, count=stat.count)
+            for stat in stats
+        ]
+        for site in self.top_allocations:
+            logger.info(
+                "Allocation site",
+                extra={"location": site.location, "size_kb": round(site.size_kb, 1), "count": site.count},
+            )
+
+    def raise_if_exceeded(self) -> None:
+        if self._violation is not None:
+            raise ResourceLimitExceeded(self._violation)
+
+    def stage_started(self, name: str) -> None:
+        """Stage-boundary hook for `StageTimer`: abort on a pending breach, then start tracking the stage."""
+        self.raise_if_exceeded()
+        rss_mb = current_rss_mb()
+        with self._lock:
+            self._stage_peaks[name] = rss_mb
+        self._record(rss_mb)
+
+    def stage_finished(self, name: str) -> Optional[float]:
+        """Return the peak RSS (MB) observed while stage ``name`` was open."""
+        self._record(current_rss_mb())
+        with self._lock:
+            return self._stage_peaks.pop(name, None)
@@ -0,0 +1,96 @@
+"""
+Per-stage timing spans for bootstrap runs.
+
+Each span records wall time, CPU time (this process and its children, so both parser worker
+threads and `--jobs` worker processes are included), an item count and the bytes of source files read, so a slow run can be attributed to the
+filesystem, parsing, validation or the database.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional, Protocol
+
+from src.lib.resource_guard import process_cpu_seconds
+
+# Names of the spans currently open, outermost first. Read by the sampling profiler
+# (`src.lib.profiling`) to tag stack samples with the stage they were taken in.
+_active_stages: list[str] = []
+
+
+def current_stages() -> tuple[str, ...]:
+    return tuple(_active_stages)
+
+
+class StageMonitor(Protocol):
+    """Notified at stage boundaries (see `ResourceGuard`); may raise from `stage_started` to abort."""
+
+    def stage_started(self, name: str) -> None: ...
+
+    def stage_finished(self, name: str) -> Optional[float]: ...
+
+
+@dataclass(slots=True, frozen=True)
+class StageSpan:
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    items: int = 0
+    bytes_read: int = 0
+    # Highest resident set size seen while the stage was open; None without a monitor.
+    peak_rss_mb: Optional[float] = None
+
+
+class _OpenSpan:
+    """Counters a stage fills in while it runs; frozen into a `StageSpan` when it ends."""
+
+    __slots__ = ("items", "bytes_read")
+
+    def __init__(self) -> None:
+        self.items = 0
+        self.bytes_read = 0
+
+
+class StageTimer:
+    """Collects `StageSpan`s in the order the stages finish."""
+
+    def __init__(self, monitor: Optional[StageMonitor] = None) -> None:
+        self._spans: list[StageSpan] = []
+        self._monitor = monitor
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[_OpenSpan]:
+        """
+        Time the enclosed block as stage ``name``.
+
+        The span is recorded even when the block raises, so failed runs still show where
+        the time went.
+        """
+        if self._monitor is not None:
+            self._monitor.stage_started(name)
+        counters = _OpenSpan()
+        wall_start = time.perf_counter()
+        cpu_start = process_cpu_seconds()
+        _active_stages.append(name)
+        try:
+            yield counters
+        finally:
+            _active_stages.pop()
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = process_cpu_seconds() - cpu_start
+            self._spans.append(
+                StageSpan(
+                    name=name,
+                    wall_seconds=wall_seconds,
+                    cpu_seconds=cpu_seconds,
+                    items=counters.items,
+                    bytes_read=counters.bytes_read,
+                    peak_rss_mb=self._monitor.stage_finished(name) if self._monitor is not None else None,
+                )
+            )
+
+    @property
+    def spans(self) -> tuple[StageSpan, ...]:
+        return tuple(self._spans)
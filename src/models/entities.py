@@ -34,6 +34,8 @@ class SpecificationDTO:
     title: str
     path: str
     metadata: Mapping[str, Any] = field(default_factory=dict)
+    # Full markdown source; indexed for `speckit search` on SQLite.
+    body: str = ""
 
 
 @dataclass(slots=True, frozen=True)
@@ -67,3 +69,22 @@ class AIJobDTO:
     job_type: str
     prompt: Optional[str] = None
     metadata: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class SourceFileDTO:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    entity_type: str
+    entity_code: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class SearchHitDTO:
+    entity_type: str
+    code: str
+    title: str
+    snippet: str
+    score: float
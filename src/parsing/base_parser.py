@@ -4,6 +4,8 @@ from typing import List, Dict, Any, Optional
 import yaml
 import logging
 
+from src.lib.parse_cache import cached_yaml_load
+
 logger = logging.getLogger(__name__)
 
 class MarkdownParser:
@@ -41,7 +43,7 @@ class MarkdownParser:
             if len(parts) < 3:
                 return None
                 
-            data = yaml.safe_load(parts[1])
+            data = cached_yaml_load(parts[1], yaml.safe_load)
             if not isinstance(data, dict):
                 return None
                 
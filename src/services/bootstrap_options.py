@@ -19,3 +19,6 @@ class BootstrapOptions:
     project: Optional[str] = None
     skip_task_runs: bool = False
     skip_ai_jobs: bool = False
+    incremental: bool = False
+    jobs: int = 1
+    ensure_indexes: bool = False
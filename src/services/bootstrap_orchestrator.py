@@ -4,22 +4,25 @@ Bootstrap orchestration pipeline for US1.
 
 from __future__ import annotations
 
-from collections import deque
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Mapping, Optional, Sequence
 
+from src.lib.dependency_graph import TaskGraph
+from src.lib.resource_guard import ResourceGuard
+from src.lib.stage_timing import StageSpan, StageTimer
 from src.models.entities import TaskDTO, TaskDependencyDTO
 from src.services.bootstrap_options import BootstrapOptions
 from src.services.data_store_protocol import DataStoreGatewayProtocol
-from src.services.doc_discovery import DocumentationDiscoveryService
+from src.services.doc_discovery import DiscoveryResult, DocumentIndex, DocumentationDiscoveryService
 from src.services.parser.project_parser import ProjectParser
 from src.services.parser.feature_parser import FeatureParser, SpecificationParser, TaskParser
 from src.services.parser.dependency_parser import DependencyParser
 from src.services.task_run_service import TaskRunService
 from src.services.ai_job_service import AIJobService
 from src.services.upsert_service import UpsertService
+from src.services.source_manifest import IncrementalTracker
 from src.services.validation.rules import (
     RequiredFieldsRule,
     ReferentialIntegrityRule,
@@ -49,6 +52,11 @@ class BootstrapSummary:
     circular_dependency_count: int = 0
     skipped_count: int = 0
     overwritten_count: int = 0
+    changed_file_count: int = 0
+    unchanged_file_count: int = 0
+    storage_profile: Mapping[str, str] = field(default_factory=dict)
+    # Wall/CPU time, item counts and bytes read per pipeline stage, in execution order.
+    stages: tuple[StageSpan, ...] = ()
     success: bool = True
     error_message: Optional[str] = None
     validation_result: Optional[ValidationResult] = None
@@ -61,29 +69,56 @@ class BootstrapSummary:
 class BootstrapOrchestrator:
     """Coordinates discovery, parsing, validation, and persistence for bootstrap runs."""
 
-    def __init__(self, project_path: Path, gateway: DataStoreGatewayProtocol) -> None:
+    def __init__(
+        self,
+        project_path: Path,
+        gateway: DataStoreGatewayProtocol,
+        resource_guard: Optional[ResourceGuard] = None,
+    ) -> None:
         self._project_path = project_path
         self._gateway = gateway
+        # Checked at every stage boundary: a limit breach seen by its sampler aborts the run
+        # (rolling back the transaction) and each stage records its peak RSS.
+        self._resource_guard = resource_guard
         self._discovery_service = DocumentationDiscoveryService(project_path)
         self._matcher = EntityMatcher(gateway)
         self._upsert_service = UpsertService(self._matcher, gateway)
         self._task_run_service = TaskRunService()
         self._ai_job_service = AIJobService()
+        # Entities from the last successful incremental run, by entity type and code. Long-lived
+        # orchestrators (db.prepare --watch) rehydrate unchanged documents from here instead of
+        # querying the store.
+        self._warm_entities: dict[str, dict[str, object]] = {}
 
     def run_bootstrap(self, options: BootstrapOptions) -> BootstrapSummary:
         """
         Execute the complete bootstrap workflow.
         """
+        timer = StageTimer(monitor=self._resource_guard)
         try:
-            docs = self._discovery_service.verify_structure()
-
-            project = ProjectParser(docs.project_file).parse()
+            with timer.span("discovery") as span:
+                docs = self._discovery_service.verify_structure()
+                index = self._discovery_service.build_index(docs)
+                span.items = sum(1 for _ in index.all_files())
+                if self._resource_guard is not None:
+                    for indexed in index.all_files():
+                        self._resource_guard.check_file_size(str(indexed.path), indexed.size)
+
+            tracker: Optional[IncrementalTracker] = None
+            if options.incremental:
+                with timer.span("manifest.load") as span:
+                    manifest = self._gateway.get_source_manifest()
+                    tracker = IncrementalTracker(docs.project_file.parent, manifest)
+                    span.items = len(manifest)
+
+            with timer.span("parse.project") as span:
+                project = ProjectParser(docs.project_file).parse()
+                span.items = 1
+                span.bytes_read = index.project.size if index.project else 0
             if options.project and project.code != options.project:
                 return BootstrapSummary.empty()
 
-            features = FeatureParser(docs.features_dir, project.code).parse()
-            specs = SpecificationParser(docs.specs_dir, search_recursive=docs.is_nested).parse()
-            tasks = TaskParser(docs.tasks_dir, search_recursive=docs.is_nested).parse()
+            features, specs, tasks = self._parse_documents(docs, index, project, tracker, timer, jobs=options.jobs)
 
             # Apply scoping filters if project is specified
             if options.project:
@@ -93,29 +128,40 @@ class BootstrapOrchestrator:
                 specs = [s for s in specs if s.feature_code in valid_feature_codes]
                 tasks = [t for t in tasks if t.feature_code in valid_feature_codes]
 
-            dep_parser = DependencyParser(docs.dependencies_dir, search_recursive=docs.is_nested)
-            dependencies = dep_parser.parse()
-            task_dependencies = dep_parser.parse_from_tasks(tasks)
-            all_dependencies = list(dependencies) + list(task_dependencies)
-
-            valid_task_codes = {t.code.upper() for t in tasks}
-
-            # When scoping by project, drop dependency edges from tasks outside the scoped set,
-            # but still validate edges where a scoped task references an unknown dependency.
-            if options.project:
-                all_dependencies = [d for d in all_dependencies if d.task_code.upper() in valid_task_codes]
-
-            invalid_dependencies = [
-                d
-                for d in all_dependencies
-                if d.task_code.upper() not in valid_task_codes or d.depends_on.upper() not in valid_task_codes
-            ]
-
-            all_dependencies = [
-                d
-                for d in all_dependencies
-                if d.task_code.upper() in valid_task_codes and d.depends_on.upper() in valid_task_codes
-            ]
+            with timer.span("parse.dependencies") as span:
+                dep_parser = DependencyParser(
+                    docs.dependencies_dir,
+                    search_recursive=docs.is_nested,
+                    files=index.dependencies,
+                )
+                dependencies = dep_parser.parse()
+                task_dependencies = dep_parser.parse_from_tasks(tasks)
+                all_dependencies = list(dependencies) + list(task_dependencies)
+                span.items = len(all_dependencies)
+                span.bytes_read = sum(f.size for f in index.dependencies)
+
+            with timer.span("normalize.dependencies") as span:
+                valid_task_codes = {t.code.upper() for t in tasks}
+
+                # When scoping by project, drop dependency edges from tasks outside the scoped set,
+                # but still validate edges where a scoped task references an unknown dependency.
+                if options.project:
+                    all_dependencies = [d for d in all_dependencies if d.task_code.upper() in valid_task_codes]
+
+                invalid_dependencies = [
+                    d
+                    for d in all_dependencies
+                    if d.task_code.upper() not in valid_task_codes or d.depends_on.upper() not in valid_task_codes
+                ]
+
+                all_dependencies = [
+                    d
+                    for d in all_dependencies
+                    if d.task_code.upper() in valid_task_codes and d.depends_on.upper() in valid_task_codes
+                ]
+                # Built once and shared by validation and step ordering.
+                task_graph = TaskGraph.from_tasks(tasks, all_dependencies)
+                span.items = len(all_dependencies)
 
             validation_result = self._run_validation(
                 project=project,
@@ -124,10 +170,18 @@ class BootstrapOrchestrator:
                 tasks=tasks,
                 dependencies=all_dependencies,
                 invalid_dependencies=invalid_dependencies,
+                task_graph=task_graph,
+                timer=timer,
             )
 
             # Calculate step orders based on dependencies
-            tasks = self._calculate_step_orders(tasks, all_dependencies)
+            with timer.span("step_orders") as span:
+                previous_step_orders = {t.code: t.step_order for t in tasks}
+                tasks = self._calculate_step_orders(tasks, all_dependencies, task_graph)
+                span.items = len(tasks)
+
+            changed_file_count = tracker.changed_file_count if tracker else 0
+            unchanged_file_count = tracker.unchanged_file_count if tracker else 0
 
             if options.dry_run:
                 return BootstrapSummary(
@@ -141,25 +195,74 @@ class BootstrapOrchestrator:
                     warning_count=validation_result.warning_count,
                     error_count=validation_result.error_count,
                     circular_dependency_count=validation_result.circular_dependency_count,
+                    changed_file_count=changed_file_count,
+                    unchanged_file_count=unchanged_file_count,
+                    storage_profile=self._gateway.describe_storage(),
+                    stages=timer.spans,
                     validation_result=validation_result,
                 )
 
+            projects = [project]
+            persisted_features, persisted_specs, persisted_tasks = features, specs, tasks
+            if tracker is not None:
+                # Only entities whose source changed are written; unchanged tasks are still
+                # rewritten when a dependency edit moved their step order. These rows usually
+                # exist already, so they are always overwritten (see `_persist_entities`).
+                projects = [p for p in projects if tracker.is_changed("project", p.code)]
+                persisted_features = [f for f in features if tracker.is_changed("feature", f.code)]
+                persisted_specs = [s for s in specs if tracker.is_changed("spec", s.code)]
+                persisted_tasks = [
+                    t
+                    for t in tasks
+                    if tracker.is_changed("task", t.code) or t.step_order != previous_step_orders.get(t.code)
+                ]
+
             task_runs = []
             ai_jobs = []
 
-            with self._gateway.transaction():
+            # "persist" covers the whole transaction, including schema checks and the commit.
+            with timer.span("persist"), self._gateway.transaction():
                 self._gateway.verify_schema()
-                self._persist_entities(project, features, specs, tasks, all_dependencies, options)
+                if options.ensure_indexes:
+                    self._gateway.ensure_indexes()
+                self._persist_entities(
+                    projects,
+                    persisted_features,
+                    persisted_specs,
+                    persisted_tasks,
+                    all_dependencies,
+                    timer,
+                    # Incremental runs save the new manifest hashes, so a skipped edit would
+                    # never be picked up again: changed entities must be written.
+                    force=options.force or tracker is not None,
+                )
 
                 if not options.skip_task_runs:
-                    task_runs = self._task_run_service.create_task_runs(tasks, options)
-                    if task_runs:
-                        self._gateway.create_task_runs(task_runs)
+                    with timer.span("task_runs") as span:
+                        task_runs = self._task_run_service.create_task_runs(persisted_tasks, options)
+                        if task_runs:
+                            self._gateway.create_task_runs(task_runs)
+                        span.items = len(task_runs)
 
                 if not options.skip_ai_jobs:
-                    ai_jobs = self._ai_job_service.create_ai_jobs(tasks, options)
-                    if ai_jobs:
-                        self._gateway.create_ai_jobs(ai_jobs)
+                    with timer.span("ai_jobs") as span:
+                        ai_jobs = self._ai_job_service.create_ai_jobs(persisted_tasks, options)
+                        if ai_jobs:
+                            self._gateway.create_ai_jobs(ai_jobs)
+                        span.items = len(ai_jobs)
+
+                if tracker is not None:
+                    with timer.span("manifest.save") as span:
+                        entries = tracker.entries()
+                        self._gateway.replace_source_manifest(entries)
+                        span.items = len(entries)
+
+            if tracker is not None:
+                self._warm_entities = {
+                    "feature": {f.code: f for f in features},
+                    "spec": {s.code: s for s in specs},
+                    "task": {t.code: t for t in tasks},
+                }
 
             return BootstrapSummary(
                 project_count=1,
@@ -172,6 +275,10 @@ class BootstrapOrchestrator:
                 warning_count=validation_result.warning_count,
                 error_count=validation_result.error_count,
                 circular_dependency_count=validation_result.circular_dependency_count,
+                changed_file_count=changed_file_count,
+                unchanged_file_count=unchanged_file_count,
+                storage_profile=self._gateway.describe_storage(),
+                stages=timer.spans,
                 validation_result=validation_result,
             )
 
@@ -183,28 +290,94 @@ class BootstrapOrchestrator:
                 warning_count=exc.result.warning_count,
                 error_count=exc.result.error_count,
                 circular_dependency_count=exc.result.circular_dependency_count,
+                stages=timer.spans,
                 validation_result=exc.result
             )
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("Bootstrap failed", exc_info=True)
-            return BootstrapSummary(success=False, error_message=str(exc))
+            return BootstrapSummary(success=False, error_message=str(exc), stages=timer.spans)
 
-    def _persist_entities(
+    def _parse_documents(
         self,
+        docs: DiscoveryResult,
+        index: DocumentIndex,
         project,
+        tracker: Optional[IncrementalTracker],
+        timer: StageTimer,
+        jobs: int = 1,
+    ):
+        def parse_features(files, workers):
+            return FeatureParser(docs.features_dir, project.code, files=files, jobs=workers).parse()
+
+        def parse_specs(files, workers):
+            return SpecificationParser(
+                docs.specs_dir, search_recursive=docs.is_nested, files=files, jobs=workers
+            ).parse()
+
+        def parse_tasks(files, workers):
+            return TaskParser(docs.tasks_dir, search_recursive=docs.is_nested, files=files, jobs=workers).parse()
+
+        def load(entity_type: str, files, parse, fetch):
+            # bytes_read counts only the files actually parsed; unchanged ones are rehydrated.
+            with timer.span(f"parse.{entity_type}s") as span:
+                # Re-read per stage so the guard can back off workers after a stage ran over the CPU budget.
+                workers = jobs if self._resource_guard is None else self._resource_guard.worker_budget(jobs)
+
+                def parse_counted(batch):
+                    span.bytes_read += sum(f.size for f in batch)
+                    return parse(batch, workers)
+
+                if tracker is None:
+                    entities = parse_counted(files)
+                else:
+                    entities = tracker.load(entity_type, files, parse_counted, self._rehydrator(entity_type, fetch))
+                span.items = len(entities)
+            return entities
+
+        if tracker is not None:
+            tracker.track_file(index.project, "project", project.code)
+        features = load("feature", index.features, parse_features, self._gateway.get_features_by_codes)
+        specs = load("spec", index.specs, parse_specs, self._gateway.get_specs_by_codes)
+        tasks = load("task", index.tasks, parse_tasks, self._gateway.get_tasks_by_codes)
+        return features, specs, tasks
+
+    def _rehydrator(self, entity_type: str, fetch_many):
+        warm = self._warm_entities.get(entity_type, {})
+
+        def rehydrate(codes):
+            # One bulk read for whatever the warm cache does not cover, instead of a SELECT per code.
+            found = {code: warm[code] for code in codes if code in warm}
+            missing = [code for code in codes if code not in found]
+            if missing:
+                found.update(fetch_many(missing))
+            return found
+
+        return rehydrate
+
+    def _persist_entities(
+        self,
+        projects,
         features,
         specs,
         tasks,
         dependencies,
-        options: BootstrapOptions,
+        timer: StageTimer,
+        force: bool = False,
     ) -> None:
-        self._upsert_service.upsert_projects([project], force=options.force)
-        self._upsert_service.upsert_features(features, force=options.force)
-        self._upsert_service.upsert_specs(specs, force=options.force)
-        self._upsert_service.upsert_tasks(tasks, force=options.force)
+        for name, entities, upsert in (
+            ("projects", projects, self._upsert_service.upsert_projects),
+            ("features", features, self._upsert_service.upsert_features),
+            ("specs", specs, self._upsert_service.upsert_specs),
+            ("tasks", tasks, self._upsert_service.upsert_tasks),
+        ):
+            with timer.span(f"upsert.{name}") as span:
+                upsert(entities, force=force)
+                span.items = len(entities)
 
         if dependencies:
-            self._gateway.create_task_dependencies(dependencies)
+            with timer.span("upsert.dependencies") as span:
+                self._gateway.create_task_dependencies(dependencies)
+                span.items = len(dependencies)
 
     def _run_validation(
         self,
@@ -214,80 +387,55 @@ class BootstrapOrchestrator:
         tasks,
         dependencies,
         invalid_dependencies,
+        task_graph: Optional[TaskGraph] = None,
+        timer: Optional[StageTimer] = None,
     ) -> ValidationResult:
+        if task_graph is None:
+            task_graph = TaskGraph.from_tasks(tasks, dependencies)
         pipeline = ValidationPipeline(
             rules=[
                 RequiredFieldsRule(project, features, specs, tasks),
                 ReferentialIntegrityRule(project, features, specs, tasks),
                 InvalidDependencyReferenceRule(invalid_dependencies),
                 DuplicateEntityRule([project], features, specs, tasks),
-                CircularDependencyRule(tasks, dependencies),
+                CircularDependencyRule(tasks, dependencies, task_graph),
                 MalformedDocRule(tasks),
-                DependencyStatusRule(tasks, dependencies),
-            ]
+                DependencyStatusRule(tasks, dependencies, task_graph),
+            ],
+            timer=timer,
         )
         result = pipeline.execute()
         if result.has_blocking_errors:
             raise ValidationException(result)
         return result
 
-    def _calculate_step_orders(self, tasks: Sequence[TaskDTO], dependencies: Sequence[TaskDependencyDTO]) -> Sequence[TaskDTO]:
+    def _calculate_step_orders(
+        self,
+        tasks: Sequence[TaskDTO],
+        dependencies: Sequence[TaskDependencyDTO],
+        task_graph: Optional[TaskGraph] = None,
+    ) -> Sequence[TaskDTO]:
         """
         Calculate step order for each task based on topological dependency depth.
         Task with no dependencies = 1.
         Task with dependencies = max(dependency.step_order) + 1.
         """
-        # Map task codes to objects (lowercase keys)
-        task_map = {t.code.lower(): t for t in tasks}
-        
-        # Build adjacency list (pred -> succ) and in-degree count
-        adj = {code: [] for code in task_map}
-        in_degree = {code: 0 for code in task_map}
-        
-        for dep in dependencies:
-            pred = dep.depends_on.lower()
-            succ = dep.task_code.lower()
-            
-            if pred in task_map and succ in task_map:
-                adj[pred].append(succ)
-                in_degree[succ] += 1
-                
-        # Zero in-degree nodes vary start at step 1
-        step_orders = {code: 1 for code in task_map}
-
-        # Topological Sort (Kahn's algorithmish)
-        # We process nodes with in-degree 0, then their neighbors.
-        # But for 'longest path' (critical path), we can just relax edges.
-        # Since it's a DAG (validated by CircularDependencyRule), we can iterate.
-        
-        # Initialize queue with all source nodes
-        queue = deque([code for code in task_map if in_degree[code] == 0])
-        
-        while queue:
-            u = queue.popleft()
-            
-            current_step = step_orders[u]
-            
-            for v in adj[u]:
-                # Relax edge: Successor step is at least current step + 1
-                if step_orders[v] < current_step + 1:
-                    step_orders[v] = current_step + 1
-                
-                in_degree[v] -= 1
-                if in_degree[v] == 0:
-                    queue.append(v)
-
-        # Log calculated plan
-        ordered_codes = sorted(step_orders.keys(), key=lambda x: step_orders[x])
-        logger.debug("Calculated Execution Plan:")
-        for code in ordered_codes:
-            logger.debug(f"  [Step {step_orders[code]}] {code}")
+        if task_graph is None:
+            task_graph = TaskGraph.from_tasks(tasks, dependencies)
+        # Longest-path levels over a topological order. Tasks on a cycle are never released, so
+        # they keep the level their acyclic dependencies gave them (validation has already
+        # rejected cycles by the time a real run gets here).
+        levels = task_graph.levels()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculated Execution Plan:")
+            for node in sorted(range(len(task_graph)), key=levels.__getitem__):
+                logger.debug(f"  [Step {levels[node]}] {task_graph.codes[node]}")
 
         # Reconstruct TaskDTOs with step_order
         updated_tasks = []
         for t in tasks:
-            code = t.code.lower()
-            order = step_orders.get(code, 1)
+            order = levels[task_graph.id_of(t.code)]
             
             new_t = TaskDTO(
                 code=t.code,
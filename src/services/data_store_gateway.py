@@ -7,13 +7,20 @@ from __future__ import annotations
 from pathlib import Path
 
 from src.services.postgres_gateway import PostgresGateway
+from src.services.postgres_pool import PostgresPoolConfig
 from src.services.sqlite_gateway import SqliteGateway
 
 
 class DataStoreGateway:
     """Compatibility shim that selects an appropriate backend implementation."""
 
-    def __init__(self, storage_path: Path | str, enable_experimental_postgres: bool = False) -> None:
+    def __init__(
+        self,
+        storage_path: Path | str,
+        enable_experimental_postgres: bool = False,
+        pool_config: PostgresPoolConfig | None = None,
+        sqlite_profile: str | None = None,
+    ) -> None:
         if isinstance(storage_path, str) and storage_path.startswith("postgresql://"):
             if not enable_experimental_postgres:
                 raise ValueError(
@@ -21,9 +28,9 @@ class DataStoreGateway:
                     "Re-run with --enable-experimental-postgres (CLI) or pass "
                     "enable_experimental_postgres=True (API). See docs/cli/db_prepare.md."
                 )
-            self._backend = PostgresGateway(storage_path)
+            self._backend = PostgresGateway(storage_path, pool_config=pool_config)
         else:
-            self._backend = SqliteGateway(storage_path)
+            self._backend = SqliteGateway(storage_path, pragma_profile=sqlite_profile)
 
         self._is_postgres = bool(getattr(self._backend, "_is_postgres", False))
 
@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-from typing import Iterable, Protocol, Sequence
+from typing import Iterable, Iterator, Protocol, Sequence
 
 from src.models.entities import (
     AIJobDTO,
     FeatureDTO,
     ProjectDTO,
+    SearchHitDTO,
+    SourceFileDTO,
     SpecificationDTO,
     TaskDTO,
     TaskDependencyDTO,
     TaskRunDTO,
 )
 
+# Rows fetched per round trip by the `iter_*` readers.
+DEFAULT_ITER_BATCH_SIZE = 1000
+
 
 class DataStoreGatewayProtocol(Protocol):
     _is_postgres: bool
 
     def verify_schema(self) -> None: ...
 
+    def ensure_indexes(self) -> None: ...
+
+    def close(self) -> None: ...
+
+    def describe_storage(self) -> dict[str, str]: ...
+
     def transaction(self): ...
 
     def create_or_update_projects(self, projects: Sequence[ProjectDTO]) -> None: ...
@@ -34,6 +45,10 @@ class DataStoreGatewayProtocol(Protocol):
 
     def create_ai_jobs(self, ai_jobs: Sequence[AIJobDTO]) -> None: ...
 
+    def get_source_manifest(self) -> list[SourceFileDTO]: ...
+
+    def replace_source_manifest(self, entries: Sequence[SourceFileDTO]) -> None: ...
+
     def get_task(self, code: str) -> TaskDTO | None: ...
 
     def get_project(self, code: str) -> ProjectDTO | None: ...
@@ -41,3 +56,25 @@ class DataStoreGatewayProtocol(Protocol):
     def get_feature(self, code: str) -> FeatureDTO | None: ...
 
     def get_spec(self, code: str) -> SpecificationDTO | None: ...
+
+    def get_tasks_by_codes(self, codes: Iterable[str]) -> dict[str, TaskDTO]: ...
+
+    def get_projects_by_codes(self, codes: Iterable[str]) -> dict[str, ProjectDTO]: ...
+
+    def get_features_by_codes(self, codes: Iterable[str]) -> dict[str, FeatureDTO]: ...
+
+    def get_specs_by_codes(self, codes: Iterable[str]) -> dict[str, SpecificationDTO]: ...
+
+    def iter_tasks(
+        self, feature_code: str | None = None, status: str | None = None, batch_size: int = DEFAULT_ITER_BATCH_SIZE
+    ) -> Iterator[TaskDTO]: ...
+
+    def iter_features(
+        self, project_code: str | None = None, batch_size: int = DEFAULT_ITER_BATCH_SIZE
+    ) -> Iterator[FeatureDTO]: ...
+
+    def iter_dependencies(self, batch_size: int = DEFAULT_ITER_BATCH_SIZE) -> Iterator[TaskDependencyDTO]: ...
+
+    def search(self, query: str, entity_type: str | None = None, limit: int = 20) -> list[SearchHitDTO]: ...
+
+    def rebuild_search_index(self) -> None: ...
@@ -4,9 +4,14 @@ Documentation discovery service utilities.
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Callable, Iterable, Iterator, Mapping, Optional
+
+_NUMBERED_PREFIX = re.compile(r"^\d+")
+
 
 @dataclass(frozen=True)
 class DiscoveryResult:
@@ -29,6 +34,138 @@ class DiscoveryResult:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class IndexedFile:
+    """A discovered markdown document with the stat info captured during the scan."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class DocumentIndex:
+    """Typed file index produced by a single scan of the documentation tree."""
+
+    project: Optional[IndexedFile] = None
+    features: tuple[IndexedFile, ...] = ()
+    specs: tuple[IndexedFile, ...] = ()
+    tasks: tuple[IndexedFile, ...] = ()
+    dependencies: tuple[IndexedFile, ...] = ()
+
+    def all_files(self) -> Iterator[IndexedFile]:
+        if self.project is not None:
+            yield self.project
+        yield from self.features
+        yield from self.specs
+        yield from self.tasks
+        yield from self.dependencies
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(f.size for f in self.all_files())
+
+
+# Bucket classifiers operate on the path relative to the bucket root (directory parts + file name).
+# They mirror the glob patterns the parsers historically used for flat and nested layouts.
+_Classifier = Callable[[tuple[str, ...], Path], bool]
+
+
+def _flat_numbered(rel: tuple[str, ...], root: Path) -> bool:
+    if len(rel) == 1:
+        return not root.name.isdigit()
+    return len(rel) == 2 and bool(_NUMBERED_PREFIX.match(rel[0]))
+
+
+def _flat_dependencies(rel: tuple[str, ...], root: Path) -> bool:
+    return len(rel) == 1 or (len(rel) == 2 and rel[0].isdigit())
+
+
+def _nested_under(dirname: str) -> _Classifier:
+    def _classify(rel: tuple[str, ...], root: Path) -> bool:
+        return len(rel) >= 2 and rel[-2] == dirname
+
+    return _classify
+
+
+def _nested_specs(rel: tuple[str, ...], root: Path) -> bool:
+    return (len(rel) >= 2 and rel[-2] == "specs") or rel[-1] == "spec.md"
+
+
+# bucket -> (flat classifier, flat max depth, nested classifier)
+_BUCKET_RULES: Mapping[str, tuple[_Classifier, int, _Classifier]] = {
+    "features": (lambda rel, root: len(rel) == 1, 1, lambda rel, root: len(rel) == 1),
+    "specs": (_flat_numbered, 2, _nested_specs),
+    "tasks": (_flat_numbered, 2, _nested_under("tasks")),
+    "dependencies": (_flat_dependencies, 2, _nested_under("dependencies")),
+}
+
+
+def _walk_markdown(root: Path, max_depth: Optional[int]) -> Iterator[tuple[tuple[str, ...], IndexedFile]]:
+    """Yield ``*.md`` files below ``root`` using ``os.scandir`` in a deterministic (sorted) order."""
+    stack: list[tuple[Path, tuple[str, ...]]] = [(root, ())]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+        subdirs: list[tuple[Path, tuple[str, ...]]] = []
+        for entry in entries:
+            rel = rel_dir + (entry.name,)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if max_depth is None or len(rel) < max_depth:
+                        subdirs.append((Path(entry.path), rel))
+                    continue
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield rel, IndexedFile(path=Path(entry.path), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+        # Files of a directory come before its subdirectories, subdirectories in name order.
+        stack.extend(reversed(subdirs))
+
+
+def _stat_file(path: Path) -> Optional[IndexedFile]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return IndexedFile(path=path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def scan_documents(root: Path, bucket: str, recursive: bool = False) -> list[IndexedFile]:
+    """Scan a single bucket root (used by parsers that are not handed a prebuilt index)."""
+    return _scan_roots({root: [(bucket, recursive)]})[bucket]
+
+
+def _scan_roots(roots: Mapping[Path, list[tuple[str, bool]]]) -> dict[str, list[IndexedFile]]:
+    buckets: dict[str, list[IndexedFile]] = {name: [] for name in _BUCKET_RULES}
+
+    for root, wanted in roots.items():
+        classifiers: list[tuple[str, _Classifier]] = []
+        max_depth: Optional[int] = 0
+        for bucket, recursive in wanted:
+            flat, flat_depth, nested = _BUCKET_RULES[bucket]
+            classifiers.append((bucket, nested if recursive else flat))
+            if recursive:
+                max_depth = None
+            elif max_depth is not None:
+                max_depth = max(max_depth, flat_depth)
+
+        for rel, indexed in _walk_markdown(root, max_depth):
+            for bucket, classify in classifiers:
+                if classify(rel, root):
+                    buckets[bucket].append(indexed)
+
+    return buckets
+
+
 class DocumentationDiscoveryService:
     """Validates required documentation directories for bootstrap."""
 
@@ -69,7 +206,7 @@ class DocumentationDiscoveryService:
         for key in ["tasks", "dependencies"]:
             rel_path = key
             path = (self._docs_root / rel_path).resolve()
-            
+
             if not path.exists() or not path.is_dir():
                 # Check for nested structure in specs/
                 specs_path = resolved["specs"]
@@ -88,3 +225,28 @@ class DocumentationDiscoveryService:
             dependencies_dir=resolved["dependencies"],
             is_nested=is_nested
         )
+
+    def build_index(self, docs: DiscoveryResult) -> DocumentIndex:
+        """
+        Scan every documentation root exactly once and bucket the markdown files.
+
+        Roots shared between buckets (the nested layout points tasks/ and dependencies/
+        at specs/) are walked a single time and classified into all matching buckets.
+        """
+        roots: dict[Path, list[tuple[str, bool]]] = {}
+        for bucket, root, recursive in (
+            ("features", docs.features_dir, False),
+            ("specs", docs.specs_dir, docs.is_nested),
+            ("tasks", docs.tasks_dir, docs.is_nested),
+            ("dependencies", docs.dependencies_dir, docs.is_nested),
+        ):
+            roots.setdefault(root, []).append((bucket, recursive))
+
+        buckets = _scan_roots(roots)
+        return DocumentIndex(
+            project=_stat_file(docs.project_file),
+            features=tuple(buckets["features"]),
+            specs=tuple(buckets["specs"]),
+            tasks=tuple(buckets["tasks"]),
+            dependencies=tuple(buckets["dependencies"]),
+        )
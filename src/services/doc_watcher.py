@@ -0,0 +1,233 @@
+"""
+Filesystem watchers used by `db.prepare --watch`.
+
+``InotifyWatcher`` uses the Linux inotify API through ctypes (no third-party dependency);
+``PollingWatcher`` compares stat snapshots and is used wherever inotify is unavailable
+(other platforms, exhausted watch limits, network filesystems).
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Optional, Protocol, Set
+
+logger = logging.getLogger(__name__)
+
+# Only documentation sources trigger a re-run; writes to .speckit/ (the store, the parse cache,
+# lock files) must never feed back into the watcher.
+WATCHED_SUFFIXES = (".md", ".json")
+DEFAULT_POLL_INTERVAL = 1.0
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class DocumentWatcher(Protocol):
+    def poll(self, timeout: float) -> Set[Path]: ...
+
+    def close(self) -> None: ...
+
+
+def _is_hidden(name: str) -> bool:
+    return name.startswith(".")
+
+
+def _is_watched_file(name: str) -> bool:
+    return not _is_hidden(name) and name.endswith(WATCHED_SUFFIXES)
+
+
+def _walk_dirs(root: Path):
+    yield root
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and not _is_hidden(entry.name):
+                        path = Path(entry.path)
+                        yield path
+                        stack.append(path)
+        except OSError:
+            continue
+
+
+class PollingWatcher:
+    """Detects changes by comparing (size, mtime_ns) snapshots of watched files."""
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self._root = root
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for directory in _walk_dirs(self._root):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if _is_watched_file(entry.name) and entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            snapshot[Path(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                continue
+        return snapshot
+
+    def poll(self, timeout: float) -> Set[Path]:
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            previous, self._snapshot = self._snapshot, current
+            changed = {path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)}
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self._interval, remaining))
+
+    def close(self) -> None:
+        self._snapshot = {}
+
+
+class InotifyWatcher:
+    """Recursive inotify watch over every non-hidden directory below ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name or "libc.so.6", use_errno=True)
+        self._inotify_add_watch = libc.inotify_add_watch
+        self._inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._inotify_add_watch.restype = ctypes.c_int
+
+        # IN_NONBLOCK / IN_CLOEXEC share their values with O_NONBLOCK / O_CLOEXEC on Linux.
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        self._root = root
+        self._watches: dict[int, Path] = {}
+        try:
+            for directory in _walk_dirs(root):
+                self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return  # removed before we got to it
+            raise OSError(err, f"inotify_add_watch({directory}) failed: {os.strerror(err)}")
+        self._watches[wd] = directory
+
+    def poll(self, timeout: float) -> Set[Path]:
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return set()
+        return self._decode(data)
+
+    def _decode(self, data: bytes) -> Set[Path]:
+        changed: Set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            raw_name = data[offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length]
+            offset += _EVENT_HEADER.size + length
+            name = os.fsdecode(raw_name.rstrip(b"\0"))
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped; report the root so the caller re-scans everything.
+                changed.add(self._root)
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & _IN_ISDIR:
+                if _is_hidden(name):
+                    continue
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    for new_dir in _walk_dirs(path):
+                        try:
+                            self._add_watch(new_dir)
+                        except OSError as exc:
+                            logger.warning("Cannot watch %s: %s", new_dir, exc)
+                changed.add(path)
+            elif _is_watched_file(name):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches.clear()
+
+
+def create_watcher(root: Path, poll_interval: float = DEFAULT_POLL_INTERVAL) -> DocumentWatcher:
+    """Return an inotify watcher when the platform supports it, otherwise a polling watcher."""
+    try:
+        watcher: DocumentWatcher = InotifyWatcher(root)
+        logger.debug("Watching %s with inotify", root)
+        return watcher
+    except (OSError, AttributeError) as exc:
+        logger.info("inotify unavailable (%s); polling %s every %.1fs", exc, root, poll_interval)
+        return PollingWatcher(root, interval=poll_interval)
+
+
+def wait_for_burst(watcher: DocumentWatcher, quiet_period: float, idle_timeout: Optional[float] = None) -> Set[Path]:
+    """
+    Block until files change, then keep collecting until ``quiet_period`` passes without events.
+
+    Editors typically emit several events per save (write, rename, attribute change); coalescing
+    them means one re-run per save instead of one per event. Returns an empty set if nothing
+    changed within ``idle_timeout`` seconds.
+    """
+    deadline = None if idle_timeout is None else time.monotonic() + idle_timeout
+    changed: Set[Path] = set()
+    while not changed:
+        if deadline is None:
+            wait = DEFAULT_POLL_INTERVAL
+        else:
+            wait = deadline - time.monotonic()
+            if wait <= 0:
+                return changed
+        changed |= watcher.poll(wait)
+
+    while True:
+        more = watcher.poll(quiet_period)
+        if not more:
+            return changed
+        changed |= more
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, Protocol, TypeVar
+from typing import Callable, Iterable, Mapping, Optional, Protocol, TypeVar
 
 from src.models.entities import ProjectDTO, FeatureDTO, SpecificationDTO, TaskDTO
 
@@ -13,27 +13,73 @@ class DataStoreReader(Protocol):
     def get_feature(self, code: str) -> Optional[FeatureDTO]: ...
     def get_spec(self, code: str) -> Optional[SpecificationDTO]: ...
     def get_task(self, code: str) -> Optional[TaskDTO]: ...
+    def get_projects_by_codes(self, codes: Iterable[str]) -> Mapping[str, ProjectDTO]: ...
+    def get_features_by_codes(self, codes: Iterable[str]) -> Mapping[str, FeatureDTO]: ...
+    def get_specs_by_codes(self, codes: Iterable[str]) -> Mapping[str, SpecificationDTO]: ...
+    def get_tasks_by_codes(self, codes: Iterable[str]) -> Mapping[str, TaskDTO]: ...
 
 class EntityMatcher:
-    """Matches incoming entities against existing ones in the datastore to determine sync status."""
+    """
+    Matches incoming entities against existing ones in the datastore to determine sync status.
+
+    `prefetch_*` loads every identifier of a batch with one bulk query into an identity map
+    (identifier -> existing entity, or None when absent); `find_existing_*` answers from that
+    map and only falls back to a per-entity read for identifiers that were not prefetched.
+    """
 
     def __init__(self, reader: DataStoreReader):
         self._reader = reader
+        self._identity_map: dict[str, dict[str, Optional[object]]] = {}
 
     def _is_postgres_backend(self) -> bool:
         return bool(getattr(self._reader, "_is_postgres", False))
 
+    def _project_identifier(self, project: ProjectDTO) -> str:
+        return project.name if self._is_postgres_backend() else project.code
+
+    def _feature_identifier(self, feature: FeatureDTO) -> str:
+        return feature.name if self._is_postgres_backend() else feature.code
+
+    def _spec_identifier(self, spec: SpecificationDTO) -> str:
+        return spec.title if self._is_postgres_backend() else spec.code
+
+    def _prefetch(
+        self, entity_type: str, identifiers: Iterable[str], fetch_many: Callable[[list[str]], Mapping[str, T]]
+    ) -> None:
+        wanted = list(dict.fromkeys(i for i in identifiers if i))
+        found = fetch_many(wanted) if wanted else {}
+        self._identity_map[entity_type] = {identifier: found.get(identifier) for identifier in wanted}
+
+    def _lookup(self, entity_type: str, identifier: str, fetch_one: Callable[[str], Optional[T]]) -> Optional[T]:
+        known = self._identity_map.get(entity_type)
+        if known is not None and identifier in known:
+            return known[identifier]  # type: ignore[return-value]
+        return fetch_one(identifier)
+
+    def clear(self) -> None:
+        """Drop prefetched entities; call after writing so later lookups see the new state."""
+        self._identity_map.clear()
+
+    def prefetch_projects(self, projects: Iterable[ProjectDTO]) -> None:
+        self._prefetch("project", (self._project_identifier(p) for p in projects), self._reader.get_projects_by_codes)
+
+    def prefetch_features(self, features: Iterable[FeatureDTO]) -> None:
+        self._prefetch("feature", (self._feature_identifier(f) for f in features), self._reader.get_features_by_codes)
+
+    def prefetch_specs(self, specs: Iterable[SpecificationDTO]) -> None:
+        self._prefetch("spec", (self._spec_identifier(s) for s in specs), self._reader.get_specs_by_codes)
+
+    def prefetch_tasks(self, tasks: Iterable[TaskDTO]) -> None:
+        self._prefetch("task", (t.code for t in tasks), self._reader.get_tasks_by_codes)
+
     def find_existing_project(self, project: ProjectDTO) -> Optional[ProjectDTO]:
-        identifier = project.name if self._is_postgres_backend() else project.code
-        return self._reader.get_project(identifier)
+        return self._lookup("project", self._project_identifier(project), self._reader.get_project)
 
     def find_existing_feature(self, feature: FeatureDTO) -> Optional[FeatureDTO]:
-        identifier = feature.name if self._is_postgres_backend() else feature.code
-        return self._reader.get_feature(identifier)
+        return self._lookup("feature", self._feature_identifier(feature), self._reader.get_feature)
 
     def find_existing_spec(self, spec: SpecificationDTO) -> Optional[SpecificationDTO]:
-        identifier = spec.title if self._is_postgres_backend() else spec.code
-        return self._reader.get_spec(identifier)
+        return self._lookup("spec", self._spec_identifier(spec), self._reader.get_spec)
     
     def find_existing_task(self, task: TaskDTO) -> Optional[TaskDTO]:
-        return self._reader.get_task(task.code)
+        return self._lookup("task", task.code, self._reader.get_task)
@@ -8,9 +8,12 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Sequence, Set
 
+from src.lib.dependency_graph import find_cycles
 from src.models.entities import TaskDependencyDTO
+from src.services.doc_discovery import IndexedFile, scan_documents
+from src.services.parser.markdown_document import tokenize_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +28,15 @@ def _load_json(path: Path) -> list:
 class DependencyParser:
     """Parses task dependency relationships from markdown files and normalizes dependency edges."""
 
-    def __init__(self, dependencies_dir: Path, search_recursive: bool = False) -> None:
+    def __init__(
+        self,
+        dependencies_dir: Path,
+        search_recursive: bool = False,
+        files: Optional[Sequence[IndexedFile]] = None,
+    ) -> None:
         self._dependencies_dir = dependencies_dir
         self._search_recursive = search_recursive
-        self._dependency_pattern = re.compile(r'Depends on:\s*([^\n]+)', re.IGNORECASE)
+        self._files = files
         self._task_reference_pattern = re.compile(r'([A-Z]+-\d+|[a-zA-Z0-9-]+)', re.IGNORECASE)
         self._heading_task_code_pattern = re.compile(r'\b([A-Z]+-\d+|T\d+)\b')
 
@@ -40,28 +48,19 @@ class DependencyParser:
             logger.warning(f"Dependencies directory not found: {self._dependencies_dir}")
             return dependencies
         
-        # Determine search pattern
-        pattern = "**/dependencies/*.md" if self._search_recursive else "*.md"
+        # Flat layouts: *.md plus numeric subdirectories; nested layouts: any **/dependencies/*.md.
+        files = self._files
+        if files is None:
+            files = scan_documents(self._dependencies_dir, "dependencies", recursive=self._search_recursive)
 
-        # Look for markdown files
-        for dep_file in self._dependencies_dir.glob(pattern):
+        for indexed in files:
+            dep_file = indexed.path
             try:
                 file_deps = self._parse_dependency_file(dep_file)
                 dependencies.extend(file_deps)
             except Exception as e:
                 raise ValueError(f"Failed to parse dependency file {dep_file}: {e}") from e
-        
-        # Also look in numbered dependency directories if not recursive
-        if not self._search_recursive:
-            for dep_dir in self._dependencies_dir.iterdir():
-                if dep_dir.is_dir() and dep_dir.name.isdigit():
-                    for dep_file in dep_dir.glob("*.md"):
-                        try:
-                            file_deps = self._parse_dependency_file(dep_file)
-                            dependencies.extend(file_deps)
-                        except Exception as e:
-                            raise ValueError(f"Failed to parse dependency file {dep_file}: {e}") from e
-        
+
         # Fallback to JSON if no markdown files found
         if not dependencies and (self._dependencies_dir / "dependencies.json").exists():
             return self._parse_json_dependencies()
@@ -89,28 +88,30 @@ class DependencyParser:
 
     def _parse_dependency_file(self, dep_file: Path) -> List[TaskDependencyDTO]:
         """Parse a single dependency markdown file."""
-        content = dep_file.read_text(encoding='utf-8')
+        doc = tokenize_markdown(dep_file.read_text(encoding='utf-8'))
         dependencies: list[TaskDependencyDTO] = []
 
-        current_task_code: str = ""
-        for line in content.splitlines():
-            stripped = line.strip()
+        # Walk headings and "Depends on:" lines in document order; a heading sets the
+        # context task for the dependency lines below it.
+        heading_lines = {heading.line: heading for heading in doc.headings}
+        entries = sorted(
+            [*doc.headings, *(dep for dep in doc.depends_on if dep.line not in heading_lines and dep.value)],
+            key=lambda entry: entry.line,
+        )
 
-            if stripped.startswith("#"):
-                heading_match = self._heading_task_code_pattern.search(stripped)
+        current_task_code: str = ""
+        for entry in entries:
+            if entry.line in heading_lines:
+                heading_match = self._heading_task_code_pattern.search(doc.lines[entry.line])
                 if heading_match:
                     current_task_code = heading_match.group(1).upper()
                 continue
 
-            dep_match = self._dependency_pattern.search(stripped)
-            if not dep_match:
-                continue
-
             if not current_task_code:
                 logger.warning(f"No context task code found in {dep_file}")
                 continue
 
-            deps_text = dep_match.group(1).strip()
+            deps_text = entry.value
             task_codes = self._extract_task_codes(deps_text)
             for dep_code in task_codes:
                 dependencies.append(TaskDependencyDTO(task_code=current_task_code, depends_on=dep_code))
@@ -185,44 +186,6 @@ class DependencyParser:
         return normalized
 
     def detect_circular_dependencies(self, dependencies: List[TaskDependencyDTO]) -> List[List[str]]:
-        """Detect circular dependencies in the dependency graph."""
-        # Build adjacency list
-        graph = {}
-        for dep in dependencies:
-            if dep.task_code not in graph:
-                graph[dep.task_code] = []
-            graph[dep.task_code].append(dep.depends_on)
-        
-        # Detect cycles using DFS
-        cycles = []
-        visited = set()
-        rec_stack = set()
-        path = []
-        
-        def dfs(node: str) -> bool:
-            if node in rec_stack:
-                # Found a cycle
-                cycle_start = path.index(node)
-                cycles.append(path[cycle_start:] + [node])
-                return True
-            
-            if node in visited:
-                return False
-            
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            for neighbor in graph.get(node, []):
-                if dfs(neighbor):
-                    return True
-            
-            rec_stack.remove(node)
-            path.pop()
-            return False
-        
-        for node in graph:
-            if node not in visited:
-                dfs(node)
-        
-        return cycles
+        """Detect circular dependencies: one shortest witness cycle per group of mutually dependent tasks."""
+        groups = find_cycles((dep.task_code, dep.depends_on) for dep in dependencies)
+        return [list(group.witness) for group in groups]
@@ -7,12 +7,15 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional, Sequence
 
 from src.models.entities import (
     FeatureDTO,
 )
-from src.services.parser.parser_utils import MissingYAMLDependencyError, _load_json, parse_markdown_key_values
+from src.services.doc_discovery import IndexedFile, scan_documents
+from src.services.parser.markdown_document import ParsedDocument, tokenize_markdown
+from src.services.parser.parallel import parse_files
+from src.services.parser.parser_utils import MissingYAMLDependencyError, _load_json
 from src.services.parser.parser_utils import parse_yaml_frontmatter
 from src.services.parser.spec_parser import SpecificationParser
 from src.services.parser.task_parser import TaskParser
@@ -22,11 +25,17 @@ logger = logging.getLogger(__name__)
 class FeatureParser:
     """Parses feature metadata from markdown files in features/ directory."""
 
-    def __init__(self, features_dir: Path, project_code: str) -> None:
+    def __init__(
+        self,
+        features_dir: Path,
+        project_code: str,
+        files: Optional[Sequence[IndexedFile]] = None,
+        jobs: int = 1,
+    ) -> None:
         self._features_dir = features_dir
         self._project_code = project_code
-        self._title_pattern = re.compile(r'^#\s+(.+)$', re.MULTILINE)
-        self._frontmatter_pattern = re.compile(r'^---\s*\n(.*?)\n---', re.MULTILINE | re.DOTALL)
+        self._files = files
+        self._jobs = jobs
 
     def parse(self) -> list[FeatureDTO]:
         """Parse all feature markdown files in the features directory."""
@@ -37,30 +46,40 @@ class FeatureParser:
             return features
         
         # Look for markdown files
-        for feature_file in self._features_dir.glob("*.md"):
+        files = self._files
+        if files is None:
+            files = scan_documents(self._features_dir, "features")
+
+        features = parse_files(self, files, self._jobs)
+
+        # Fallback to JSON if no markdown files found
+        if not features and (self._features_dir / "features.json").exists():
+            return self._parse_json_features()
+        
+        return features
+
+    def _parse_files(self, files: Sequence[IndexedFile]) -> list[FeatureDTO]:
+        """Parse the given feature markdown files in order."""
+        features = []
+        for indexed in files:
+            feature_file = indexed.path
             try:
-                feature = self._parse_feature_file(feature_file)
-                features.append(feature)
+                features.append(self._parse_feature_file(feature_file))
             except MissingYAMLDependencyError:
                 raise
             except Exception as e:
                 raise ValueError(f"Failed to parse feature file {feature_file}: {e}") from e
-        
-        # Fallback to JSON if no markdown files found
-        if not features and (self._features_dir / "features.json").exists():
-            return self._parse_json_features()
-        
         return features
 
     def _parse_feature_file(self, feature_file: Path) -> FeatureDTO:
         """Parse a single feature markdown file."""
-        content = feature_file.read_text(encoding='utf-8')
+        doc = tokenize_markdown(feature_file.read_text(encoding='utf-8'))
         
         # Extract title from first # heading or filename
-        title = self._extract_title(content, feature_file)
+        title = self._extract_title(doc, feature_file)
         
         # Extract frontmatter metadata
-        metadata = self._extract_frontmatter(content)
+        metadata = self._extract_frontmatter(doc)
         
         # Extract description from frontmatter or content
         raw_description = metadata.get('description', '')
@@ -70,7 +89,7 @@ class FeatureParser:
             description = str(raw_description)
 
         if not description:
-            description = self._extract_description_from_content(content)
+            description = self._extract_description_from_content(doc)
         
         # Extract priority from metadata or default to P2
         priority = str(metadata.get('priority', 'P2'))
@@ -106,33 +125,29 @@ class FeatureParser:
             for item in data
         ]
 
-    def _extract_title(self, content: str, feature_file: Path) -> str:
+    def _extract_title(self, doc: ParsedDocument, feature_file: Path) -> str:
         """Extract title from content or fallback to filename."""
-        match = self._title_pattern.search(content)
-        if match:
-            return match.group(1).strip()
+        if doc.title:
+            return doc.title
         
         # Fallback to filename without extension
         return feature_file.stem.replace('-', ' ').replace('_', ' ').title()
 
-    def _extract_frontmatter(self, content: str) -> dict[str, str]:
+    def _extract_frontmatter(self, doc: ParsedDocument) -> dict[str, str]:
         """Extract metadata from YAML frontmatter or markdown key-value pairs."""
         metadata = {}
         
         # 1. Try YAML frontmatter first
-        match = self._frontmatter_pattern.search(content)
-        if match:
-            frontmatter_text = match.group(1)
+        frontmatter_text = doc.frontmatter_text
+        if frontmatter_text is not None:
             try:
                 metadata = parse_yaml_frontmatter(frontmatter_text)
             except ValueError as e:
                 raise ValueError(f"Invalid YAML frontmatter: {e}") from e
                 
         # 2. Markdown Key-Values fallback/merge
-        markdown_metadata = parse_markdown_key_values(content)
-        
         # Merge, preferring frontmatter if conflict
-        for k, v in markdown_metadata.items():
+        for k, v in doc.key_values.items():
             if k not in metadata:
                 metadata[k] = v
                 
@@ -157,13 +172,10 @@ class FeatureParser:
 
 
 
-    def _extract_description_from_content(self, content: str) -> str:
+    def _extract_description_from_content(self, doc: ParsedDocument) -> str:
         """Extract description from content paragraphs."""
-        # Remove frontmatter
-        content = self._frontmatter_pattern.sub('', content).strip()
-        
-        # Find first paragraph after title
-        lines = content.split('\n')
+        # Find first paragraph after title, ignoring frontmatter
+        lines = doc.body_lines()
         description_lines = []
         
         skip_next_line = False
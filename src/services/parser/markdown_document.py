@@ -0,0 +1,179 @@
+"""
+Single-pass markdown tokenizer shared by the bootstrap parsers.
+
+Each document is split into lines once; frontmatter fences, headings, ``Key: value`` lines
+and ``Depends on:`` lines are recorded in that pass so the parsers no longer re-scan the
+full text with one regex per field.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from src.services.parser.parser_utils import KEY_VALUE_LINE_LIMIT, parse_key_value_lines
+
+_DEPENDS_ON_PATTERN = re.compile(r"depends on:", re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
+class Heading:
+    line: int
+    level: int
+    text: str
+    indented: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class DependsOnLine:
+    line: int
+    value: str
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedDocument:
+    """Structural view of one markdown file, produced by ``tokenize_markdown``."""
+
+    lines: tuple[str, ...]
+    fenced_blocks: tuple[tuple[int, int], ...]
+    headings: tuple[Heading, ...]
+    key_values: dict[str, str]
+    depends_on: tuple[DependsOnLine, ...]
+
+    @property
+    def frontmatter_text(self) -> Optional[str]:
+        if not self.fenced_blocks:
+            return None
+        start, end = self.fenced_blocks[0]
+        start += 1
+        # Blank lines right after the opening fence are not part of the frontmatter.
+        while start < end and not self.lines[start].strip():
+            start += 1
+        return "\n".join(self.lines[start:end])
+
+    @property
+    def title(self) -> Optional[str]:
+        """Text of the first ``# Title`` line."""
+        for heading in self.headings:
+            if heading.level == 1 and not heading.indented and heading.text and self.lines[heading.line][1:2].isspace():
+                return heading.text
+        return None
+
+    def _body_line(self, idx: int) -> Optional[str]:
+        for start, end in self.fenced_blocks:
+            if start <= idx < end:
+                return None
+            if idx == end:
+                # Text after a closing fence (e.g. the last "-" of "----") stays in the body.
+                return self.lines[end][3:]
+        return self.lines[idx]
+
+    def body_lines(self) -> list[str]:
+        """Document lines with every ``---`` fenced block removed."""
+        if not self.fenced_blocks:
+            return list(self.lines)
+        body = (self._body_line(idx) for idx in range(len(self.lines)))
+        return [line for line in body if line is not None]
+
+    def section_lines(self, heading_text: str, min_level: int = 1) -> Optional[list[str]]:
+        """
+        Return the stripped, non-empty body lines under the first heading named ``heading_text``.
+
+        A section runs until the next line starting with ``#`` or ``Depends on:``, which task
+        documents use as a trailer after their acceptance criteria.
+        """
+        start: Optional[int] = None
+        for heading in self.headings:
+            if heading.level >= min_level and heading.text == heading_text and self._body_line(heading.line) is not None:
+                start = heading.line + 1
+                break
+        if start is None:
+            return None
+
+        section: list[str] = []
+        for idx in range(start, len(self.lines)):
+            line = self._body_line(idx)
+            if line is None:
+                continue
+            if line.startswith("#") or line[:11].lower() == "depends on:":
+                break
+            stripped = line.strip()
+            if stripped:
+                section.append(stripped)
+        return section
+
+    def first_depends_on(self) -> Optional[str]:
+        """
+        Value of the first ``Depends on:`` marker anywhere in the file.
+
+        A marker with nothing after it takes the next non-blank line, so lists written as
+        ``Depends on:`` followed by the codes on their own line keep working.
+        """
+        if not self.depends_on:
+            return None
+        entry = self.depends_on[0]
+        if entry.value:
+            return entry.value
+        for line in self.lines[entry.line + 1 :]:
+            if line.strip():
+                return line.strip()
+        return ""
+
+
+def _find_fenced_blocks(lines: list[str]) -> list[tuple[int, int]]:
+    # Mirrors re.sub(r'^---\s*\n(.*?)\n---', ...): an opening fence is "---" plus optional
+    # whitespace. Blank lines after it are skipped, then the block closes at the next line
+    # (at least one line later) that starts with "---".
+    blocks: list[tuple[int, int]] = []
+    idx = 0
+    total = len(lines)
+    while idx < total:
+        line = lines[idx]
+        if not (line.startswith("---") and not line[3:].strip()):
+            idx += 1
+            continue
+
+        last_blank = idx
+        while last_blank + 1 < total and not lines[last_blank + 1].strip():
+            last_blank += 1
+        close = next((j for j in range(last_blank + 2, total) if lines[j].startswith("---")), None)
+        if close is None and last_blank > idx and last_blank + 1 < total and lines[last_blank + 1].startswith("---"):
+            # Only blank lines between the fences.
+            close = last_blank + 1
+        if close is None:
+            break
+        blocks.append((idx, close))
+        idx = close + 1
+    return blocks
+
+
+def tokenize_markdown(content: str) -> ParsedDocument:
+    """Scan ``content`` once and record fenced blocks, headings, key/values and ``Depends on:`` lines."""
+    lines = content.split("\n")
+
+    headings: list[Heading] = []
+    depends_on: list[DependsOnLine] = []
+
+    for idx, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if stripped[0] == "#":
+            level = len(stripped) - len(stripped.lstrip("#"))
+            headings.append(
+                Heading(line=idx, level=level, text=stripped[level:].strip(), indented=line[0] != "#")
+            )
+
+        match = _DEPENDS_ON_PATTERN.search(stripped)
+        if match:
+            depends_on.append(DependsOnLine(line=idx, value=stripped[match.end() :].strip()))
+
+    return ParsedDocument(
+        lines=tuple(lines),
+        fenced_blocks=tuple(_find_fenced_blocks(lines)),
+        headings=tuple(headings),
+        key_values=parse_key_value_lines(lines[:KEY_VALUE_LINE_LIMIT]),
+        depends_on=tuple(depends_on),
+    )
@@ -0,0 +1,94 @@
+"""
+Process-pool fan-out for the per-file markdown parsers.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Protocol, Sequence
+
+from src.lib.resource_guard import usable_cores
+from src.services.doc_discovery import IndexedFile
+
+logger = logging.getLogger(__name__)
+
+# Below this many files the pool start-up cost outweighs the parsing work.
+MIN_PARALLEL_FILES = 64
+# Chunks per worker; more chunks balance uneven file sizes at the cost of more IPC.
+CHUNKS_PER_WORKER = 4
+
+
+class FileBatchParser(Protocol):
+    def _parse_files(self, files: Sequence[IndexedFile]) -> List[Any]: ...
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Translate a ``--jobs`` value into a worker count (``0`` means every usable core)."""
+    if jobs > 0:
+        return jobs
+    return usable_cores()
+
+
+def chunk_by_size(files: Sequence[IndexedFile], chunk_count: int) -> list[list[IndexedFile]]:
+    """
+    Split files into contiguous chunks of roughly equal byte size.
+
+    Chunks stay contiguous so that concatenating their results preserves the input order
+    and the first failing chunk always holds the first failing file.
+    """
+    if chunk_count <= 1 or len(files) <= 1:
+        return [list(files)] if files else []
+
+    total = sum(max(f.size, 1) for f in files)
+    budget = total / chunk_count
+    chunks: list[list[IndexedFile]] = []
+    current: list[IndexedFile] = []
+    current_bytes = 0
+    for indexed in files:
+        current.append(indexed)
+        current_bytes += max(indexed.size, 1)
+        if current_bytes >= budget and len(chunks) < chunk_count - 1:
+            chunks.append(current)
+            current = []
+            current_bytes = 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _parse_chunk(parser: FileBatchParser, files: Sequence[IndexedFile]) -> List[Any]:
+    return parser._parse_files(files)
+
+
+def parse_files(
+    parser: FileBatchParser,
+    files: Sequence[IndexedFile],
+    jobs: int = 1,
+    min_files: int = MIN_PARALLEL_FILES,
+) -> List[Any]:
+    """
+    Parse ``files`` with ``parser`` sequentially or across a process pool.
+
+    Results are merged in input order. Workers stop at the first failure in their chunk and
+    chunk futures are collected in order, so the raised error is the same one a sequential
+    run would raise (``MissingYAMLDependencyError`` unchanged, other failures as ``ValueError``).
+    """
+    workers = min(resolve_jobs(jobs), len(files))
+    if workers <= 1 or len(files) < min_files:
+        return parser._parse_files(files)
+
+    chunks = chunk_by_size(files, workers * CHUNKS_PER_WORKER)
+    logger.debug("Parsing %d files in %d chunks across %d workers", len(files), len(chunks), workers)
+
+    results: List[Any] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_parse_chunk, parser, chunk) for chunk in chunks]
+        try:
+            for future in futures:
+                results.extend(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+from src.lib.parse_cache import cached_yaml_load
 
 
 class MissingYAMLDependencyError(RuntimeError):
@@ -19,7 +21,7 @@ def parse_yaml_frontmatter(frontmatter_text: str) -> dict[str, Any]:
         ) from exc
 
     try:
-        loaded = yaml.safe_load(frontmatter_text)
+        loaded = cached_yaml_load(frontmatter_text, yaml.safe_load)
     except Exception as exc:
         raise ValueError(f"Invalid YAML frontmatter: {exc}") from exc
 
@@ -37,18 +39,20 @@ def _load_json(path: Path) -> list | dict:
         raise ValueError(f"Invalid JSON in {path}") from exc
 
 
-def parse_markdown_key_values(content: str) -> dict[str, str]:
-    metadata: dict[str, str] = {}
-    lines = content.split("\n")[:50]
+KEY_VALUE_LINE_LIMIT = 50
 
-    pattern = re.compile(r"^\s*[*_]{0,2}([a-zA-Z0-9 _-]+?)[*_]{0,2}:\s*(.+)$")
+_KEY_VALUE_PATTERN = re.compile(r"^\s*[*_]{0,2}([a-zA-Z0-9 _-]+?)[*_]{0,2}:\s*(.+)$")
+
+
+def parse_key_value_lines(lines: Iterable[str]) -> dict[str, str]:
+    metadata: dict[str, str] = {}
 
     for line in lines:
         line = line.strip()
         if line.startswith("#") or line.startswith("-") or line.startswith("`"):
             continue
 
-        match = pattern.match(line)
+        match = _KEY_VALUE_PATTERN.match(line)
         if match:
             key = match.group(1).strip()
             value = match.group(2).strip()
@@ -59,3 +63,7 @@ def parse_markdown_key_values(content: str) -> dict[str, str]:
             metadata[key] = value
 
     return metadata
+
+
+def parse_markdown_key_values(content: str) -> dict[str, str]:
+    return parse_key_value_lines(content.split("\n")[:KEY_VALUE_LINE_LIMIT])
@@ -6,11 +6,11 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from pathlib import Path
 from typing import Optional
 
 from src.models.entities import ProjectDTO
+from src.services.parser.markdown_document import ParsedDocument, tokenize_markdown
 from src.services.parser.parser_utils import parse_yaml_frontmatter
 
 logger = logging.getLogger(__name__)
@@ -28,8 +28,6 @@ class ProjectParser:
 
     def __init__(self, project_file: Path) -> None:
         self._project_file = project_file
-        self._title_pattern = re.compile(r'^#\s+(.+)$', re.MULTILINE)
-        self._frontmatter_pattern = re.compile(r'^---\s*\n(.*?)\n---', re.MULTILINE | re.DOTALL)
 
     def parse(self) -> ProjectDTO:
         """
@@ -66,18 +64,18 @@ class ProjectParser:
 
     def _parse_markdown(self) -> ProjectDTO:
         """Parse markdown project.md file."""
-        content = self._project_file.read_text(encoding='utf-8')
+        doc = tokenize_markdown(self._project_file.read_text(encoding='utf-8'))
         
         # Extract title from first # heading or filename
-        title = self._extract_title(content)
+        title = self._extract_title(doc)
         
         # Extract frontmatter metadata
-        metadata = self._extract_frontmatter(content)
+        metadata = self._extract_frontmatter(doc)
         
         # Extract description from frontmatter or content
         description = metadata.get('description', '')
         if not description:
-            description = self._extract_description_from_content(content)
+            description = self._extract_description_from_content(doc)
         
         # Generate project code from directory name or metadata
         project_code = metadata.get('id') or metadata.get('code') or self._generate_project_code()
@@ -93,20 +91,18 @@ class ProjectParser:
             metadata=metadata
         )
 
-    def _extract_title(self, content: str) -> str:
+    def _extract_title(self, doc: ParsedDocument) -> str:
         """Extract title from content or fallback to filename."""
-        match = self._title_pattern.search(content)
-        if match:
-            return match.group(1).strip()
+        if doc.title:
+            return doc.title
         
         # Fallback to filename without extension
         return self._project_file.stem.replace('-', ' ').replace('_', ' ').title()
 
-    def _extract_frontmatter(self, content: str) -> dict[str, str]:
+    def _extract_frontmatter(self, doc: ParsedDocument) -> dict[str, str]:
         """Extract YAML frontmatter from markdown content."""
-        match = self._frontmatter_pattern.search(content)
-        if match:
-            frontmatter_text = match.group(1)
+        frontmatter_text = doc.frontmatter_text
+        if frontmatter_text is not None:
             try:
                 return parse_yaml_frontmatter(frontmatter_text)
             except ValueError as e:
@@ -124,13 +120,10 @@ class ProjectParser:
                 metadata[key.strip()] = value.strip().strip('"\'')
         return metadata
 
-    def _extract_description_from_content(self, content: str) -> str:
+    def _extract_description_from_content(self, doc: ParsedDocument) -> str:
         """Extract description from content paragraphs."""
-        # Remove frontmatter
-        content = self._frontmatter_pattern.sub('', content).strip()
-        
-        # Find first paragraph after title
-        lines = content.split('\n')
+        # Find first paragraph after title, ignoring frontmatter
+        lines = doc.body_lines()
         description_lines = []
         
         skip_next_line = False
@@ -3,12 +3,15 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
+from typing import Optional, Sequence
 
 from src.models.entities import SpecificationDTO
+from src.services.doc_discovery import IndexedFile, scan_documents
+from src.services.parser.markdown_document import ParsedDocument, tokenize_markdown
+from src.services.parser.parallel import parse_files
 from src.services.parser.parser_utils import (
     MissingYAMLDependencyError,
     _load_json,
-    parse_markdown_key_values,
     parse_yaml_frontmatter,
 )
 
@@ -18,15 +21,17 @@ logger = logging.getLogger(__name__)
 class SpecificationParser:
     """Parses specification metadata from markdown files in specs/ directory."""
 
-    def __init__(self, specs_dir: Path, search_recursive: bool = False) -> None:
+    def __init__(
+        self,
+        specs_dir: Path,
+        search_recursive: bool = False,
+        files: Optional[Sequence[IndexedFile]] = None,
+        jobs: int = 1,
+    ) -> None:
         self._specs_dir = specs_dir
         self._search_recursive = search_recursive
-        self._title_pattern = re.compile(r'^#\s+(.+)$', re.MULTILINE)
-        self._frontmatter_pattern = re.compile(r'^---\s*\n(.*?)\n---', re.MULTILINE | re.DOTALL)
-
-    @staticmethod
-    def _is_numbered_prefix_dir(path: Path) -> bool:
-        return path.is_dir() and bool(re.match(r"^\d+", path.name))
+        self._files = files
+        self._jobs = jobs
 
     def parse(self) -> list[SpecificationDTO]:
         specs: list[SpecificationDTO] = []
@@ -35,47 +40,36 @@ class SpecificationParser:
             logger.warning(f"Specs directory not found: {self._specs_dir}")
             return specs
 
-        # Determine search pattern
-        # If recursive, look for md in any subdirectory called 'specs' or 'spec'
-        pattern = "**/specs/*.md" if self._search_recursive else "*.md"
-
-        for pattern in (["**/specs/*.md", "**/spec.md"] if self._search_recursive else ["*.md"]):
-            for spec_file in self._specs_dir.glob(pattern):
-                # Legacy check: skip direct children if they are numbered prefix (handled below)
-                if not self._search_recursive and spec_file.parent.name.isdigit():
-                    continue
-
-                try:
-                    spec = self._parse_spec_file(spec_file)
-                    specs.append(spec)
-                except MissingYAMLDependencyError:
-                    raise
-                except Exception as e:
-                    raise ValueError(f"Failed to parse spec file {spec_file}: {e}") from e
-
-        # Handle legacy flat structure with numbered subdirs if not recursive
-        if not self._search_recursive:
-            for spec_dir in self._specs_dir.iterdir():
-                if self._is_numbered_prefix_dir(spec_dir):
-                    for spec_file in spec_dir.glob("*.md"):
-                        try:
-                            spec = self._parse_spec_file(spec_file)
-                            specs.append(spec)
-                        except MissingYAMLDependencyError:
-                            raise
-                        except Exception as e:
-                            raise ValueError(f"Failed to parse spec file {spec_file}: {e}") from e
+        # Flat layouts: *.md plus numbered subdirectories; nested layouts: **/specs/*.md and **/spec.md.
+        files = self._files
+        if files is None:
+            files = scan_documents(self._specs_dir, "specs", recursive=self._search_recursive)
+
+        specs = parse_files(self, files, self._jobs)
 
         if not specs and (self._specs_dir / "specs.json").exists():
             return self._parse_json_specs()
 
         return specs
 
+    def _parse_files(self, files: Sequence[IndexedFile]) -> list[SpecificationDTO]:
+        specs: list[SpecificationDTO] = []
+        for indexed in files:
+            spec_file = indexed.path
+            try:
+                specs.append(self._parse_spec_file(spec_file))
+            except MissingYAMLDependencyError:
+                raise
+            except Exception as e:
+                raise ValueError(f"Failed to parse spec file {spec_file}: {e}") from e
+        return specs
+
     def _parse_spec_file(self, spec_file: Path) -> SpecificationDTO:
-        content = spec_file.read_text(encoding="utf-8")
+        text = spec_file.read_text(encoding="utf-8")
+        doc = tokenize_markdown(text)
 
-        title = self._extract_title(content, spec_file)
-        metadata = self._extract_frontmatter(content)
+        title = self._extract_title(doc, spec_file)
+        metadata = self._extract_frontmatter(doc)
 
         feature_code = metadata.get("feature_code", "")
         if not feature_code:
@@ -97,6 +91,7 @@ class SpecificationParser:
             title=str(title),
             path=str(spec_file.relative_to(self._specs_dir.parent)),
             metadata=metadata,
+            body="\n".join(doc.body_lines()),
         )
 
     def _parse_json_specs(self) -> list[SpecificationDTO]:
@@ -108,31 +103,29 @@ class SpecificationParser:
                 title=item["title"],
                 path=item.get("path", ""),
                 metadata=item.get("metadata", {}),
+                body=item.get("body", ""),
             )
             for item in data
         ]
 
-    def _extract_title(self, content: str, spec_file: Path) -> str:
-        match = self._title_pattern.search(content)
-        if match:
-            return match.group(1).strip()
+    def _extract_title(self, doc: ParsedDocument, spec_file: Path) -> str:
+        if doc.title:
+            return doc.title
 
         return spec_file.stem.replace("-", " ").replace("_", " ").title()
 
-    def _extract_frontmatter(self, content: str) -> dict[str, str]:
+    def _extract_frontmatter(self, doc: ParsedDocument) -> dict[str, str]:
         metadata: dict[str, str] = {}
 
-        match = self._frontmatter_pattern.search(content)
-        if match:
-            frontmatter_text = match.group(1)
+        frontmatter_text = doc.frontmatter_text
+        if frontmatter_text is not None:
             try:
                 metadata = parse_yaml_frontmatter(frontmatter_text)
             except ValueError as e:
                 logger.warning(f"Failed to parse YAML frontmatter: {e}")
                 metadata = self._parse_simple_frontmatter(frontmatter_text)
 
-        markdown_metadata = parse_markdown_key_values(content)
-        for k, v in markdown_metadata.items():
+        for k, v in doc.key_values.items():
             if k not in metadata:
                 metadata[k] = v
 
@@ -3,13 +3,15 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from src.models.entities import TaskDTO
+from src.services.doc_discovery import IndexedFile, scan_documents
+from src.services.parser.markdown_document import ParsedDocument, tokenize_markdown
+from src.services.parser.parallel import parse_files
 from src.services.parser.parser_utils import (
     MissingYAMLDependencyError,
     _load_json,
-    parse_markdown_key_values,
     parse_yaml_frontmatter,
 )
 
@@ -19,21 +21,18 @@ logger = logging.getLogger(__name__)
 class TaskParser:
     """Parses task metadata and dependencies from markdown files in tasks/ directory."""
 
-    def __init__(self, tasks_dir: Path, search_recursive: bool = False) -> None:
+    def __init__(
+        self,
+        tasks_dir: Path,
+        search_recursive: bool = False,
+        files: Optional[Sequence[IndexedFile]] = None,
+        jobs: int = 1,
+    ) -> None:
         self._tasks_dir = tasks_dir
         self._search_recursive = search_recursive
-        self._title_pattern = re.compile(r'^#\s+(.+)$', re.MULTILINE)
-        self._frontmatter_pattern = re.compile(r'^---\s*\n(.*?)\n---', re.MULTILINE | re.DOTALL)
-        self._acceptance_pattern = re.compile(
-            r'## Acceptance Criteria\s*\n(.*?)(?=\n##|\n#|\n(?i:depends on:)\s*|\Z)',
-            re.MULTILINE | re.DOTALL,
-        )
-        self._dependency_pattern = re.compile(r'Depends on:\s*([^\n]+)', re.IGNORECASE)
-        self._task_code_heading_pattern = re.compile(r'^#\s*([A-Za-z]+\d+|[A-Za-z]+-\d+)\b', re.MULTILINE)
-
-    @staticmethod
-    def _is_numbered_prefix_dir(path: Path) -> bool:
-        return path.is_dir() and bool(re.match(r"^\d+", path.name))
+        self._files = files
+        self._jobs = jobs
+        self._task_code_heading_pattern = re.compile(r'([A-Za-z]+\d+|[A-Za-z]+-\d+)\b')
 
     def parse(self) -> List[TaskDTO]:
         tasks: list[TaskDTO] = []
@@ -42,50 +41,35 @@ class TaskParser:
             logger.warning(f"Tasks directory not found: {self._tasks_dir}")
             return tasks
 
-        # Determine search pattern
-        # If recursive, we look for tasks in any subdirectory called 'tasks'
-        pattern = "**/tasks/*.md" if self._search_recursive else "*.md"
+        # Flat layouts: *.md plus numbered subdirectories; nested layouts: any **/tasks/*.md.
+        files = self._files
+        if files is None:
+            files = scan_documents(self._tasks_dir, "tasks", recursive=self._search_recursive)
 
-        for task_file in self._tasks_dir.glob(pattern):
-            # If not recursive, skip numbered prefix directories (already handled separately or intended to be skipped)
-            # If recursive, we want everything but may still want to skip some things?
-            # Workflows put them in specs/NUMBER-name/tasks/ - we want those.
-            
-            # Legacy check: skip direct children if they are numbered prefix (handled below)
-            if not self._search_recursive and task_file.parent.name.isdigit():
-                continue
+        tasks = parse_files(self, files, self._jobs)
+
+        if not tasks and (self._tasks_dir / "tasks.json").exists():
+            return self._parse_json_tasks()
+
+        return tasks
 
+    def _parse_files(self, files: Sequence[IndexedFile]) -> List[TaskDTO]:
+        tasks: list[TaskDTO] = []
+        for indexed in files:
+            task_file = indexed.path
             try:
-                task = self._parse_task_file(task_file)
-                tasks.append(task)
+                tasks.append(self._parse_task_file(task_file))
             except MissingYAMLDependencyError:
                 raise
             except Exception as e:
                 raise ValueError(f"Failed to parse task file {task_file}: {e}") from e
-
-        # Handle legacy flat structure with numbered subdirs if not recursive
-        if not self._search_recursive:
-            for task_dir in self._tasks_dir.iterdir():
-                if self._is_numbered_prefix_dir(task_dir):
-                    for task_file in task_dir.glob("*.md"):
-                        try:
-                            task = self._parse_task_file(task_file)
-                            tasks.append(task)
-                        except MissingYAMLDependencyError:
-                            raise
-                        except Exception as e:
-                            raise ValueError(f"Failed to parse task file {task_file}: {e}") from e
-
-        if not tasks and (self._tasks_dir / "tasks.json").exists():
-            return self._parse_json_tasks()
-
         return tasks
 
     def _parse_task_file(self, task_file: Path) -> TaskDTO:
-        content = task_file.read_text(encoding="utf-8")
+        doc = tokenize_markdown(task_file.read_text(encoding="utf-8"))
 
-        title = self._extract_title(content, task_file)
-        metadata = self._extract_frontmatter(content)
+        title = self._extract_title(doc, task_file)
+        metadata = self._extract_frontmatter(doc)
 
         feature_code = metadata.get("feature_code", "")
         if not feature_code:
@@ -98,7 +82,7 @@ class TaskParser:
         status = str(metadata.get("status", "pending"))
         task_type = str(metadata.get("task_type", "implementation"))
 
-        raw_acceptance = self._extract_acceptance_criteria(content)
+        raw_acceptance = self._extract_acceptance_criteria(doc)
         if not raw_acceptance:
             raw_acceptance = metadata.get("acceptance", "")
             
@@ -107,11 +91,11 @@ class TaskParser:
         else:
             acceptance = str(raw_acceptance)
 
-        dependencies = self._extract_dependencies(content)
+        dependencies = self._extract_dependencies(doc)
         if dependencies:
             metadata["dependencies"] = dependencies
 
-        heading_code = self._extract_task_code_from_heading(content)
+        heading_code = self._extract_task_code_from_heading(doc)
         
         task_code = metadata.get("code")
         if not task_code:
@@ -146,27 +130,24 @@ class TaskParser:
             )
         return tasks
 
-    def _extract_title(self, content: str, task_file: Path) -> str:
-        match = self._title_pattern.search(content)
-        if match:
-            return match.group(1).strip()
+    def _extract_title(self, doc: ParsedDocument, task_file: Path) -> str:
+        if doc.title:
+            return doc.title
 
         return task_file.stem.replace("-", " ").replace("_", " ").title()
 
-    def _extract_frontmatter(self, content: str) -> dict[str, str]:
+    def _extract_frontmatter(self, doc: ParsedDocument) -> dict[str, str]:
         metadata: dict = {}
 
-        match = self._frontmatter_pattern.search(content)
-        if match:
-            frontmatter_text = match.group(1)
+        frontmatter_text = doc.frontmatter_text
+        if frontmatter_text is not None:
             try:
                 metadata = parse_yaml_frontmatter(frontmatter_text)
             except ValueError as e:
                 logger.warning(f"Failed to parse YAML frontmatter: {e}")
                 metadata = self._parse_simple_frontmatter(frontmatter_text)
 
-        markdown_metadata = parse_markdown_key_values(content)
-        for k, v in markdown_metadata.items():
+        for k, v in doc.key_values.items():
             if k not in metadata:
                 metadata[k] = v
 
@@ -187,23 +168,15 @@ class TaskParser:
                 metadata[key.strip()] = value.strip().strip('"\'')
         return metadata
 
-    def _extract_acceptance_criteria(self, content: str) -> str:
-        content = self._frontmatter_pattern.sub("", content).strip()
-
-        match = self._acceptance_pattern.search(content)
-        if match:
-            criteria_text = match.group(1).strip()
-            lines = [line.strip() for line in criteria_text.split("\n") if line.strip()]
-            return "\n".join(lines)
+    def _extract_acceptance_criteria(self, doc: ParsedDocument) -> str:
+        lines = doc.section_lines("Acceptance Criteria", min_level=2)
+        return "\n".join(lines) if lines else ""
 
-        return ""
-
-    def _extract_dependencies(self, content: str) -> List[str]:
+    def _extract_dependencies(self, doc: ParsedDocument) -> List[str]:
         dependencies: list[str] = []
 
-        match = self._dependency_pattern.search(content)
-        if match:
-            deps_text = match.group(1).strip()
+        deps_text = doc.first_depends_on()
+        if deps_text:
             deps = [dep.strip() for dep in deps_text.split(",")]
             dependencies.extend([dep for dep in deps if dep])
 
@@ -230,11 +203,14 @@ class TaskParser:
         # 3. Fallback to stem
         return task_file.stem.lower().replace("-", "").replace("_", "")
 
-    def _extract_task_code_from_heading(self, content: str) -> Optional[str]:
-        match = self._task_code_heading_pattern.search(content)
-        if not match:
-            return None
-        return match.group(1).strip().upper()
+    def _extract_task_code_from_heading(self, doc: ParsedDocument) -> Optional[str]:
+        for heading in doc.headings:
+            if heading.level != 1 or heading.indented:
+                continue
+            match = self._task_code_heading_pattern.match(heading.text)
+            if match:
+                return match.group(1).strip().upper()
+        return None
 
     def _generate_task_code(self, task_file: Path) -> str:
         return task_file.stem.lower().replace(" ", "-").replace("_", "-")
@@ -1,37 +1,60 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import json
 import logging
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 from src.models.entities import (
     AIJobDTO,
     FeatureDTO,
     ProjectDTO,
+    SearchHitDTO,
+    SourceFileDTO,
     SpecificationDTO,
     TaskDTO,
     TaskDependencyDTO,
     TaskRunDTO,
 )
+from src.services.data_store_protocol import DEFAULT_ITER_BATCH_SIZE
+from src.services.postgres_pool import PostgresConnectionPool, PostgresPoolConfig
+from src.services.postgres_staging import BatchSource
 
 logger = logging.getLogger(__name__)
 
+TASK_CODE_INDEX = "tasks_metadata_code_key"
+
+# Server-side cursor names must be unique per session; nested iterators share a connection.
+_cursor_ids = itertools.count(1)
+
 
 class PostgresGateway:
-    def __init__(self, connection_string: str) -> None:
+    def __init__(self, connection_string: str, pool_config: PostgresPoolConfig | None = None) -> None:
         self._is_postgres = True
         self._connection_string = connection_string
         self._pg_column_cache: dict[tuple[str, str], bool] = {}
         self._active_conn = None
+        self._pool = PostgresConnectionPool(connection_string, pool_config)
 
     def _get_connection(self):
         if self._active_conn is not None:
             return contextlib.nullcontext(self._active_conn)
 
-        import psycopg2
+        return self._pool.connection()
+
+    def close(self) -> None:
+        """Close every pooled connection; the pool reconnects lazily if the gateway is used again."""
+        self._pool.close()
 
-        return psycopg2.connect(self._connection_string)
+    def describe_storage(self) -> dict[str, str]:
+        config = self._pool.config
+        return {
+            "backend": "postgres",
+            "pool_min_size": str(config.min_size),
+            "pool_max_size": str(config.max_size),
+            "statement_timeout_ms": "server default" if config.statement_timeout_ms is None else str(config.statement_timeout_ms),
+        }
 
     @contextlib.contextmanager
     def transaction(self):
@@ -167,33 +190,6 @@ class PostgresGateway:
                 "Refusing to fall back to name-based matching."
             )
 
-    def _postgres_select_one(self, cursor, sql: str, params: tuple, *, entity: str, key: str):
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        return self._postgres_single_row(rows, entity=entity, code=key)
-
-    @staticmethod
-    def _postgres_single_row(rows, *, entity: str, code: str):
-        if not rows:
-            return None
-
-        if len(rows) > 1:
-            raise RuntimeError(
-                f"Ambiguous Postgres match for {entity} code='{code}': expected 1 row, got {len(rows)}. "
-                "Refusing to link using heuristics."
-            )
-        return rows[0]
-
-    def _get_ids_by_codes(self, cursor, table: str, codes: Sequence[str]) -> dict[str, str]:
-        normalized = [c.lower() for c in codes if c]
-        if not normalized:
-            return {}
-
-        sql = f"SELECT metadata->>'code' AS code, id FROM {table} WHERE metadata->>'code' = ANY(%s)"
-        cursor.execute(sql, (normalized,))
-        rows = cursor.fetchall() or []
-        return {row[0]: row[1] for row in rows if row and len(row) >= 2 and row[0]}
-
     def _get_id_by_code(self, table: str, code: str) -> str | None:
         if not code:
             return None
@@ -212,232 +208,325 @@ class PostgresGateway:
 
         return None
 
+    @staticmethod
+    def _ambiguous_match(entity: str, key: str, count: int) -> RuntimeError:
+        return RuntimeError(
+            f"Ambiguous Postgres match for {entity} code='{key}': expected 1 row, got {count}. "
+            "Refusing to link using heuristics."
+        )
+
+    def _postgres_count_by_name(self, source: BatchSource, column: str, table: str) -> dict[str, int]:
+        """Count rows in ``table`` whose name matches each distinct ``column`` value of the batch."""
+        rows = source.execute(
+            f"""
+            SELECT n.{column}, COUNT(x.id)
+            FROM (SELECT DISTINCT s.{column} FROM {{source}}) n
+            LEFT JOIN {table} x ON x.name = n.{column}
+            GROUP BY n.{column}
+            """,
+            fetch=True,
+        )
+        return {row[0]: row[1] for row in rows or []}
+
+    def _postgres_require_unambiguous(self, source: BatchSource, sql: str, *, entity: str) -> None:
+        """Raise if ``sql`` (returning key, count) finds a key that already matches several rows."""
+        rows = source.execute(sql, fetch=True) or []
+        if rows:
+            raise self._ambiguous_match(entity, rows[0][0], rows[0][1])
+
+    @staticmethod
+    def _postgres_require_parent(count: int, *, entity: str, missing_message: str, key: str) -> None:
+        if count == 0:
+            raise RuntimeError(missing_message)
+        if count > 1:
+            raise PostgresGateway._ambiguous_match(entity, key, count)
+
     def create_or_update_projects(self, projects: Sequence[ProjectDTO]) -> None:
         logger.info(f"Upserting {len(projects)} projects (Mode: Postgres)")
+        if not projects:
+            return
+
+        by_name = {p.name: p for p in projects}
 
         with self._get_connection() as conn:
             with conn.cursor() as cursor:
-                for p in projects:
-                    row = self._postgres_select_one(
-                        cursor,
-                        "SELECT id FROM projects WHERE name = %s",
-                        (p.name,),
-                        entity="project",
-                        key=p.name,
-                    )
-
-                    if row:
-                        cursor.execute(
-                            """
-                            UPDATE projects
-                            SET name = %s,
-                                description = %s
-                            WHERE id = %s
-                            """,
-                            (p.name, p.description, row[0]),
-                        )
-                    else:
-                        cursor.execute(
-                            """
-                            INSERT INTO projects (name, description, status)
-                            VALUES (%s, %s, 'active')
-                            """,
-                            (p.name, p.description),
-                        )
+                source = BatchSource(
+                    cursor,
+                    "speckit_stage_projects",
+                    [("name", "text"), ("description", "text")],
+                    ((p.name, p.description) for p in by_name.values()),
+                )
+                self._postgres_require_unambiguous(
+                    source,
+                    """
+                    SELECT p.name, COUNT(*) FROM projects p
+                    JOIN {source} ON s.name = p.name
+                    GROUP BY p.name HAVING COUNT(*) > 1
+                    """,
+                    entity="project",
+                )
+                source.execute(
+                    """
+                    UPDATE projects p
+                    SET name = s.name,
+                        description = s.description
+                    FROM {source}
+                    WHERE p.name = s.name
+                    """
+                )
+                source.execute(
+                    """
+                    INSERT INTO projects (name, description, status)
+                    SELECT s.name, s.description, 'active'
+                    FROM {source}
+                    WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.name = s.name)
+                    """
+                )
+                source.close()
 
             if self._active_conn is None:
                 conn.commit()
 
     def create_or_update_features(self, features: Sequence[FeatureDTO]) -> None:
+        if not features:
+            return
+
+        def _priority(value) -> int:
+            try:
+                return int(str(value).replace("P", ""))
+            except Exception:
+                return 0
+
+        by_key = {(f.project_code, f.name): f for f in features}
+
         with self._get_connection() as conn:
             with conn.cursor() as cursor:
-                for f in features:
-                    proj_row = self._postgres_select_one(
-                        cursor,
-                        "SELECT id FROM projects WHERE name = %s",
-                        (f.project_code,),
+                source = BatchSource(
+                    cursor,
+                    "speckit_stage_features",
+                    [("project_name", "text"), ("name", "text"), ("description", "text"), ("priority", "integer")],
+                    ((f.project_code, f.name, f.description, _priority(f.priority)) for f in by_key.values()),
+                )
+                project_counts = self._postgres_count_by_name(source, "project_name", "projects")
+                for f in by_key.values():
+                    self._postgres_require_parent(
+                        project_counts.get(f.project_code, 0),
                         entity="project",
                         key=f.project_code,
+                        missing_message=f"Project not found for feature '{f.name}' (project_code='{f.project_code}').",
                     )
-                    if not proj_row:
-                        raise RuntimeError(
-                            f"Project not found for feature '{f.name}' (project_code='{f.project_code}')."
-                        )
-                    p_id = proj_row[0]
-
-                    prio = 0
-                    try:
-                        prio = int(str(f.priority).replace("P", ""))
-                    except Exception:
-                        prio = 0
-
-                    row = self._postgres_select_one(
-                        cursor,
-                        "SELECT id FROM features WHERE project_id = %s AND name = %s",
-                        (p_id, f.name),
-                        entity="feature",
-                        key=f.name,
-                    )
-
-                    if row:
-                        cursor.execute(
-                            """
-                            UPDATE features
-                            SET name = %s,
-                                description = %s,
-                                priority = %s
-                            WHERE id = %s
-                            """,
-                            (f.name, f.description, prio, row[0]),
-                        )
-                    else:
-                        cursor.execute(
-                            """
-                            INSERT INTO features (name, description, priority, project_id, status)
-                            VALUES (%s, %s, %s, %s, 'planned')
-                            """,
-                            (f.name, f.description, prio, p_id),
-                        )
+                self._postgres_require_unambiguous(
+                    source,
+                    """
+                    SELECT f.name, COUNT(*) FROM features f
+                    JOIN projects p ON p.id = f.project_id
+                    JOIN {source} ON s.project_name = p.name AND s.name = f.name
+                    GROUP BY f.project_id, f.name HAVING COUNT(*) > 1
+                    """,
+                    entity="feature",
+                )
+                source.execute(
+                    """
+                    UPDATE features f
+                    SET name = s.name,
+                        description = s.description,
+                        priority = s.priority
+                    FROM {source}
+                    JOIN projects p ON p.name = s.project_name
+                    WHERE f.project_id = p.id AND f.name = s.name
+                    """
+                )
+                source.execute(
+                    """
+                    INSERT INTO features (name, description, priority, project_id, status)
+                    SELECT s.name, s.description, s.priority, p.id, 'planned'
+                    FROM {source}
+                    JOIN projects p ON p.name = s.project_name
+                    WHERE NOT EXISTS (SELECT 1 FROM features f WHERE f.project_id = p.id AND f.name = s.name)
+                    """
+                )
+                source.close()
 
             if self._active_conn is None:
                 conn.commit()
 
     def create_or_update_specs(self, specs: Sequence[SpecificationDTO]) -> None:
+        if not specs:
+            return
+
+        by_key = {(s.feature_code, s.title): s for s in specs}
+
         with self._get_connection() as conn:
             with conn.cursor() as cursor:
-                for s in specs:
-                    feat_row = self._postgres_select_one(
-                        cursor,
-                        "SELECT id FROM features WHERE name = %s",
-                        (s.feature_code,),
+                source = BatchSource(
+                    cursor,
+                    "speckit_stage_specs",
+                    [("feature_name", "text"), ("name", "text"), ("file_path", "text")],
+                    ((s.feature_code, s.title, s.path) for s in by_key.values()),
+                )
+                feature_counts = self._postgres_count_by_name(source, "feature_name", "features")
+                for s in by_key.values():
+                    self._postgres_require_parent(
+                        feature_counts.get(s.feature_code, 0),
                         entity="feature",
                         key=s.feature_code,
+                        missing_message=f"Feature not found for spec '{s.title}' (feature_code='{s.feature_code}').",
                     )
-                    if not feat_row:
-                        raise RuntimeError(f"Feature not found for spec '{s.title}' (feature_code='{s.feature_code}').")
-                    f_id = feat_row[0]
-
-                    row = self._postgres_select_one(
-                        cursor,
-                        "SELECT id FROM specs WHERE feature_id = %s AND name = %s",
-                        (f_id, s.title),
-                        entity="spec",
-                        key=s.title,
-                    )
-
-                    if row:
-                        cursor.execute(
-                            "UPDATE specs SET name = %s, file_path = %s WHERE id = %s",
-                            (s.title, s.path, row[0]),
-                        )
-                    else:
-                        cursor.execute(
-                            "INSERT INTO specs (name, file_path, feature_id, status) VALUES (%s, %s, %s, 'draft')",
-                            (s.title, s.path, f_id),
-                        )
+                self._postgres_require_unambiguous(
+                    source,
+                    """
+                    SELECT sp.name, COUNT(*) FROM specs sp
+                    JOIN features f ON f.id = sp.feature_id
+                    JOIN {source} ON s.feature_name = f.name AND s.name = sp.name
+                    GROUP BY sp.feature_id, sp.name HAVING COUNT(*) > 1
+                    """,
+                    entity="spec",
+                )
+                source.execute(
+                    """
+                    UPDATE specs sp
+                    SET name = s.name,
+                        file_path = s.file_path
+                    FROM {source}
+                    JOIN features f ON f.name = s.feature_name
+                    WHERE sp.feature_id = f.id AND sp.name = s.name
+                    """
+                )
+                source.execute(
+                    """
+                    INSERT INTO specs (name, file_path, feature_id, status)
+                    SELECT s.name, s.file_path, f.id, 'draft'
+                    FROM {source}
+                    JOIN features f ON f.name = s.feature_name
+                    WHERE NOT EXISTS (SELECT 1 FROM specs sp WHERE sp.feature_id = f.id AND sp.name = s.name)
+                    """
+                )
+                source.close()
 
             if self._active_conn is None:
                 conn.commit()
 
     def create_or_update_tasks(self, tasks: Sequence[TaskDTO]) -> None:
-        from psycopg2.extras import Json
+        """
+        Upsert tasks set-wise: one `UPDATE ... FROM` and one `INSERT ... SELECT` reconcile the
+        batch into `tasks`, reading it inline or from a COPY staging table (see `BatchSource`).
+
+        Rows are matched on `metadata->>'code'`; run with `--ensure-indexes` so that lookup is
+        backed by a unique expression index rather than a sequential scan.
+        """
+        if not tasks:
+            return
+
+        # A code listed twice is written once, with its last definition (as the per-row loop did).
+        by_code = {t.code: t for t in tasks}
+
+        def _rows():
+            for t in by_code.values():
+                meta = dict(t.metadata or {})
+                meta["code"] = t.code
+                yield (t.code, t.feature_code, t.title, t.status, t.acceptance, json.dumps(meta, default=str), t.step_order)
 
         with self._get_connection() as conn:
             with conn.cursor() as cursor:
-                for t in tasks:
-                    self._postgres_require_metadata_code(cursor, "tasks")
-
-                    feat_row = self._postgres_select_one(
-                        cursor,
-                        "SELECT id, project_id FROM features WHERE name = %s",
-                        (t.feature_code,),
+                self._postgres_require_metadata_code(cursor, "tasks")
+                source = BatchSource(
+                    cursor,
+                    "speckit_stage_tasks",
+                    [
+                        ("code", "text"),
+                        ("feature_name", "text"),
+                        ("name", "text"),
+                        ("status", "text"),
+                        ("description", "text"),
+                        ("metadata", "jsonb"),
+                        ("step_order", "integer"),
+                    ],
+                    _rows(),
+                )
+                feature_counts = self._postgres_count_by_name(source, "feature_name", "features")
+                for t in by_code.values():
+                    self._postgres_require_parent(
+                        feature_counts.get(t.feature_code, 0),
                         entity="feature",
                         key=t.feature_code,
+                        missing_message=f"Feature not found for task code='{t.code}' (feature_code='{t.feature_code}').",
                     )
-                    if not feat_row:
-                        raise RuntimeError(
-                            f"Feature not found for task code='{t.code}' (feature_code='{t.feature_code}')."
-                        )
-                    feature_id, project_id = feat_row[0], feat_row[1]
-
-                    meta = dict(t.metadata or {})
-                    meta["code"] = t.code
-
-                    cursor.execute("SELECT id FROM tasks WHERE metadata->>'code' = %s", (t.code,))
-                    row = cursor.fetchone()
-
-                    if row:
-                        cursor.execute(
-                            """
-                            UPDATE tasks
-                            SET name = %s,
-                                status = %s,
-                                description = %s,
-                                metadata = %s,
-                                feature_id = %s,
-                                project_id = %s,
-                                step_order = %s
-                            WHERE id = %s
-                            """,
-                            (
-                                t.title,
-                                t.status,
-                                t.acceptance,
-                                Json(meta),
-                                feature_id,
-                                project_id,
-                                t.step_order,
-                                row[0],
-                            ),
-                        )
-                    else:
-                        cursor.execute(
-                            """
-                            INSERT INTO tasks (name, status, description, metadata, feature_id, project_id, step_order)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s)
-                            """,
-                            (t.title, t.status, t.acceptance, Json(meta), feature_id, project_id, t.step_order),
-                        )
+                source.execute(
+                    """
+                    UPDATE tasks AS t
+                    SET name = s.name,
+                        status = s.status,
+                        description = s.description,
+                        metadata = s.metadata,
+                        feature_id = f.id,
+                        project_id = f.project_id,
+                        step_order = s.step_order
+                    FROM {source}
+                    JOIN features f ON f.name = s.feature_name
+                    WHERE t.metadata->>'code' = s.code
+                    """
+                )
+                source.execute(
+                    """
+                    INSERT INTO tasks (name, status, description, metadata, feature_id, project_id, step_order)
+                    SELECT s.name, s.status, s.description, s.metadata, f.id, f.project_id, s.step_order
+                    FROM {source}
+                    JOIN features f ON f.name = s.feature_name
+                    WHERE NOT EXISTS (SELECT 1 FROM tasks t WHERE t.metadata->>'code' = s.code)
+                    """
+                )
+                source.close()
 
             if self._active_conn is None:
                 conn.commit()
 
+    def ensure_indexes(self) -> None:
+        """Create the unique expression index that backs `metadata->>'code'` task lookups."""
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        f"CREATE UNIQUE INDEX IF NOT EXISTS {TASK_CODE_INDEX} ON tasks ((metadata->>'code'))"
+                    )
+                if self._active_conn is None:
+                    conn.commit()
+        except Exception as exc:
+            raise RuntimeError(
+                f"Could not create unique index {TASK_CODE_INDEX} on tasks ((metadata->>'code')): {exc}\n"
+                "If several tasks share a metadata code, remove the duplicates and re-run with --ensure-indexes."
+            ) from exc
+
     def create_task_dependencies(self, dependencies: Iterable[TaskDependencyDTO]) -> None:
         deps_list = list(dependencies)
         if not deps_list:
             return
 
-        from psycopg2.extras import execute_batch
+        # Codes are matched lower-cased, as before; pairs whose tasks are unknown are skipped.
+        pairs = {
+            (d.depends_on.lower(), d.task_code.lower()) for d in deps_list if d.depends_on and d.task_code
+        }
+        if not pairs:
+            return
 
         with self._get_connection() as conn:
             with conn.cursor() as cursor:
-                codes: list[str] = []
-                for d in deps_list:
-                    if d.depends_on:
-                        codes.append(d.depends_on.lower())
-                    if d.task_code:
-                        codes.append(d.task_code.lower())
-
-                id_by_code = self._get_ids_by_codes(cursor, "tasks", codes)
-
-                data: list[tuple[str, str]] = []
-                for d in deps_list:
-                    pred_id = id_by_code.get((d.depends_on or "").lower())
-                    succ_id = id_by_code.get((d.task_code or "").lower())
-                    if pred_id and succ_id:
-                        data.append((pred_id, succ_id))
-
-                if data:
-                    execute_batch(
-                        cursor,
-                        """
-                        INSERT INTO task_dependencies (predecessor_id, successor_id)
-                        VALUES (%s, %s)
-                        ON CONFLICT (predecessor_id, successor_id) DO NOTHING
-                        """,
-                        data,
-                        page_size=1000,
-                    )
+                source = BatchSource(
+                    cursor,
+                    "speckit_stage_dependencies",
+                    [("predecessor_code", "text"), ("successor_code", "text")],
+                    sorted(pairs),
+                )
+                source.execute(
+                    """
+                    INSERT INTO task_dependencies (predecessor_id, successor_id)
+                    SELECT DISTINCT pred.id, succ.id
+                    FROM {source}
+                    JOIN tasks pred ON pred.metadata->>'code' = s.predecessor_code
+                    JOIN tasks succ ON succ.metadata->>'code' = s.successor_code
+                    ON CONFLICT (predecessor_id, successor_id) DO NOTHING
+                    """
+                )
+                source.close()
 
             if self._active_conn is None:
                 conn.commit()
@@ -504,123 +593,214 @@ class PostgresGateway:
             if self._active_conn is None:
                 conn.commit()
 
-    def get_task(self, code: str) -> TaskDTO | None:
-        from psycopg2.extras import DictCursor
+    def get_source_manifest(self) -> list[SourceFileDTO]:
+        raise RuntimeError(
+            "Incremental bootstrap is not supported on the PostgreSQL backend: the schema contract has no "
+            "source manifest table. Re-run without --incremental."
+        )
 
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor(cursor_factory=DictCursor) as cursor:
-                    cursor.execute(
-                        "SELECT t.*, f.name AS feature_name "
-                        "FROM tasks t "
-                        "JOIN features f ON t.feature_id = f.id "
-                        "WHERE t.metadata->>'code' = %s",
-                        (code,),
-                    )
-                    row = cursor.fetchone()
-                    if not row:
-                        return None
+    def replace_source_manifest(self, entries: Sequence[SourceFileDTO]) -> None:
+        raise RuntimeError(
+            "Incremental bootstrap is not supported on the PostgreSQL backend: the schema contract has no "
+            "source manifest table. Re-run without --incremental."
+        )
 
-                    meta = row["metadata"] if "metadata" in row else None
-                    if meta is None:
-                        meta = {}
-                    elif isinstance(meta, str):
-                        meta = json.loads(meta) if meta else {}
-
-                    feature_code = row.get("feature_name") or meta.get("feature_code", "")
-
-                    return TaskDTO(
-                        code=code,
-                        feature_code=feature_code,
-                        title=row.get("name", ""),
-                        status=row.get("status", ""),
-                        task_type="implementation",
-                        acceptance=row.get("description", ""),
-                        step_order=row.get("step_order"),
-                        metadata=meta,
-                    )
-        except Exception as e:
-            logger.error(f"Postgres get_task failed: {e}")
-            return None
+    def search(self, query: str, entity_type: str | None = None, limit: int = 20) -> list[SearchHitDTO]:
+        raise RuntimeError(
+            "Full-text search is not supported on the PostgreSQL backend: the schema contract has no "
+            "search index. Run `speckit search` against the SQLite store."
+        )
 
-    def get_project(self, code: str) -> ProjectDTO | None:
+    def rebuild_search_index(self) -> None:
+        raise RuntimeError(
+            "Full-text search is not supported on the PostgreSQL backend: the schema contract has no "
+            "search index. Run `speckit search` against the SQLite store."
+        )
+
+    _TASK_SELECT = (
+        "SELECT t.*, t.metadata->>'code' AS task_code, f.name AS feature_name "
+        "FROM tasks t "
+        "JOIN features f ON t.feature_id = f.id "
+    )
+    _FEATURE_SELECT = "SELECT f.*, p.name AS project_name FROM features f JOIN projects p ON f.project_id = p.id "
+    _SPEC_SELECT = "SELECT s.*, f.name AS feature_name FROM specs s JOIN features f ON s.feature_id = f.id "
+
+    @staticmethod
+    def _row_to_task(row, code: str) -> TaskDTO:
+        meta = row["metadata"] if "metadata" in row else None
+        if meta is None:
+            meta = {}
+        elif isinstance(meta, str):
+            meta = json.loads(meta) if meta else {}
+
+        feature_code = row.get("feature_name") or meta.get("feature_code", "")
+
+        return TaskDTO(
+            code=code,
+            feature_code=feature_code,
+            title=row.get("name", ""),
+            status=row.get("status", ""),
+            task_type="implementation",
+            acceptance=row.get("description", ""),
+            step_order=row.get("step_order"),
+            metadata=meta,
+        )
+
+    @staticmethod
+    def _row_to_project(row, code: str) -> ProjectDTO:
+        return ProjectDTO(
+            code=row.get("name", code),
+            name=row.get("name", ""),
+            description=row.get("description", "") or "",
+            repository_path=None,
+            metadata={},
+        )
+
+    @staticmethod
+    def _row_to_feature(row, code: str) -> FeatureDTO:
+        prio = row.get("priority")
+        priority = f"P{prio}" if isinstance(prio, int) and prio > 0 else "P2"
+
+        return FeatureDTO(
+            code=row.get("name", code),
+            project_code=row.get("project_name", ""),
+            name=row.get("name", ""),
+            description=row.get("description", "") or "",
+            priority=priority,
+            metadata={},
+        )
+
+    @staticmethod
+    def _row_to_spec(row, code: str) -> SpecificationDTO:
+        return SpecificationDTO(
+            code=row.get("name", code),
+            feature_code=row.get("feature_name", ""),
+            title=row.get("name", ""),
+            path=row.get("file_path", "") or "",
+            metadata={},
+        )
+
+    def _get_one(self, sql: str, code: str, to_dto, entity: str):
         from psycopg2.extras import DictCursor
 
         try:
             with self._get_connection() as conn:
                 with conn.cursor(cursor_factory=DictCursor) as cursor:
-                    cursor.execute("SELECT * FROM projects WHERE name = %s", (code,))
+                    cursor.execute(sql, (code,))
                     row = cursor.fetchone()
                     if not row:
                         return None
-
-                    return ProjectDTO(
-                        code=row.get("name", code),
-                        name=row.get("name", ""),
-                        description=row.get("description", "") or "",
-                        repository_path=None,
-                        metadata={},
-                    )
+                    return to_dto(row, code)
         except Exception as e:
-            logger.error(f"Postgres get_project failed: {e}")
+            logger.error(f"Postgres get_{entity} failed: {e}")
             return None
 
-    def get_feature(self, code: str) -> FeatureDTO | None:
+    def _get_many(self, sql: str, key_column: str, codes: Iterable[str], to_dto, entity: str) -> dict:
+        """Resolve many identifiers with one `= ANY(%s)` query; the first row per key wins, as in `_get_one`."""
         from psycopg2.extras import DictCursor
 
+        unique_codes = list(dict.fromkeys(c for c in codes if c))
+        if not unique_codes:
+            return {}
+
+        found: dict = {}
         try:
             with self._get_connection() as conn:
                 with conn.cursor(cursor_factory=DictCursor) as cursor:
-                    cursor.execute(
-                        "SELECT f.*, p.name AS project_name "
-                        "FROM features f "
-                        "JOIN projects p ON f.project_id = p.id "
-                        "WHERE f.name = %s",
-                        (code,),
-                    )
-                    row = cursor.fetchone()
-                    if not row:
-                        return None
+                    cursor.execute(sql, (unique_codes,))
+                    for row in cursor.fetchall() or []:
+                        key = row.get(key_column)
+                        if key and key not in found:
+                            found[key] = to_dto(row, key)
+        except Exception as e:
+            logger.error(f"Postgres get_{entity}s_by_codes failed: {e}")
+            return {}
+        return found
 
-                    prio = row.get("priority")
-                    priority = f"P{prio}" if isinstance(prio, int) and prio > 0 else "P2"
+    def get_task(self, code: str) -> TaskDTO | None:
+        return self._get_one(self._TASK_SELECT + "WHERE t.metadata->>'code' = %s", code, self._row_to_task, "task")
 
-                    return FeatureDTO(
-                        code=row.get("name", code),
-                        project_code=row.get("project_name", ""),
-                        name=row.get("name", ""),
-                        description=row.get("description", "") or "",
-                        priority=priority,
-                        metadata={},
-                    )
-        except Exception as e:
-            logger.error(f"Postgres get_feature failed: {e}")
-            return None
+    def get_project(self, code: str) -> ProjectDTO | None:
+        return self._get_one("SELECT * FROM projects WHERE name = %s", code, self._row_to_project, "project")
+
+    def get_feature(self, code: str) -> FeatureDTO | None:
+        return self._get_one(self._FEATURE_SELECT + "WHERE f.name = %s", code, self._row_to_feature, "feature")
 
     def get_spec(self, code: str) -> SpecificationDTO | None:
-        from psycopg2.extras import DictCursor
+        return self._get_one(self._SPEC_SELECT + "WHERE s.name = %s", code, self._row_to_spec, "spec")
 
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor(cursor_factory=DictCursor) as cursor:
-                    cursor.execute(
-                        "SELECT s.*, f.name AS feature_name "
-                        "FROM specs s "
-                        "JOIN features f ON s.feature_id = f.id "
-                        "WHERE s.name = %s",
-                        (code,),
-                    )
-                    row = cursor.fetchone()
-                    if not row:
-                        return None
+    def get_tasks_by_codes(self, codes: Iterable[str]) -> dict[str, TaskDTO]:
+        return self._get_many(
+            self._TASK_SELECT + "WHERE t.metadata->>'code' = ANY(%s)", "task_code", codes, self._row_to_task, "task"
+        )
 
-                    return SpecificationDTO(
-                        code=row.get("name", code),
-                        feature_code=row.get("feature_name", ""),
-                        title=row.get("name", ""),
-                        path=row.get("file_path", "") or "",
-                        metadata={},
-                    )
-        except Exception as e:
-            logger.error(f"Postgres get_spec failed: {e}")
-            return None
+    def get_projects_by_codes(self, codes: Iterable[str]) -> dict[str, ProjectDTO]:
+        return self._get_many(
+            "SELECT * FROM projects WHERE name = ANY(%s)", "name", codes, self._row_to_project, "project"
+        )
+
+    def get_features_by_codes(self, codes: Iterable[str]) -> dict[str, FeatureDTO]:
+        return self._get_many(
+            self._FEATURE_SELECT + "WHERE f.name = ANY(%s)", "name", codes, self._row_to_feature, "feature"
+        )
+
+    def get_specs_by_codes(self, codes: Iterable[str]) -> dict[str, SpecificationDTO]:
+        return self._get_many(self._SPEC_SELECT + "WHERE s.name = ANY(%s)", "name", codes, self._row_to_spec, "spec")
+
+    def _iter_rows(self, sql: str, params: Sequence[object] | None, batch_size: int, entity: str) -> Iterator:
+        """
+        Stream `sql` through a named (server-side) cursor, `batch_size` rows per FETCH.
+
+        Unlike the single-entity getters, failures are raised: a silently truncated stream
+        would look like a complete export. The connection stays checked out until the
+        iterator is exhausted or closed.
+        """
+        from psycopg2.extras import DictCursor
+
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        with self._get_connection() as conn:
+            with conn.cursor(name=f"speckit_iter_{entity}_{next(_cursor_ids)}", cursor_factory=DictCursor) as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(sql, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+
+    def iter_tasks(
+        self, feature_code: str | None = None, status: str | None = None, batch_size: int = DEFAULT_ITER_BATCH_SIZE
+    ) -> Iterator[TaskDTO]:
+        clauses, params = [], []
+        if feature_code is not None:
+            clauses.append("f.name = %s")
+            params.append(feature_code)
+        if status is not None:
+            clauses.append("t.status = %s")
+            params.append(status)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        sql = self._TASK_SELECT + where + "ORDER BY t.metadata->>'code'"
+        for row in self._iter_rows(sql, params, batch_size, "tasks"):
+            yield self._row_to_task(row, row.get("task_code") or "")
+
+    def iter_features(
+        self, project_code: str | None = None, batch_size: int = DEFAULT_ITER_BATCH_SIZE
+    ) -> Iterator[FeatureDTO]:
+        if project_code is None:
+            sql, params = self._FEATURE_SELECT + "ORDER BY f.name", []
+        else:
+            sql, params = self._FEATURE_SELECT + "WHERE p.name = %s ORDER BY f.name", [project_code]
+        for row in self._iter_rows(sql, params, batch_size, "features"):
+            yield self._row_to_feature(row, row.get("name") or "")
+
+    def iter_dependencies(self, batch_size: int = DEFAULT_ITER_BATCH_SIZE) -> Iterator[TaskDependencyDTO]:
+        sql = (
+            "SELECT succ.metadata->>'code' AS task_code, pred.metadata->>'code' AS depends_on "
+            "FROM task_dependencies d "
+            "JOIN tasks succ ON d.successor_id = succ.id "
+            "JOIN tasks pred ON d.predecessor_id = pred.id "
+            "ORDER BY 1, 2"
+        )
+        for row in self._iter_rows(sql, None, batch_size, "dependencies"):
+            yield TaskDependencyDTO(task_code=row["task_code"], depends_on=row["depends_on"])
@@ -0,0 +1,151 @@
+"""
+Pooled PostgreSQL connections shared by the gateway's read and write paths.
+
+Without a pool every lookup outside a transaction paid a full TCP + auth handshake
+(`speckit context` does three). Connections are created lazily, checked before reuse
+and returned in a clean transaction state.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PostgresPoolConfig:
+    """Sizing and health-check settings for `PostgresConnectionPool`."""
+
+    min_size: int = 1
+    max_size: int = 4
+    # Applied to every pooled session via `-c statement_timeout=...`; None keeps the server default.
+    statement_timeout_ms: Optional[int] = None
+    # Connections idle for longer than this are pinged with `SELECT 1` before being handed out.
+    health_check_interval: float = 30.0
+    # How long a caller waits for a free connection once `max_size` are checked out.
+    acquire_timeout: float = 30.0
+    # psycopg2 connection class for pooled sessions (e.g. the round-trip counter in benchmarks/).
+    connection_factory: Optional[Any] = None
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0 or self.max_size < 1 or self.min_size > self.max_size:
+            raise ValueError(f"Invalid pool size: min_size={self.min_size}, max_size={self.max_size}")
+
+
+class PostgresConnectionPool:
+    """Thin wrapper over `psycopg2.pool.ThreadedConnectionPool` that blocks instead of failing when exhausted."""
+
+    def __init__(self, dsn: str, config: Optional[PostgresPoolConfig] = None) -> None:
+        self._dsn = dsn
+        self._config = config or PostgresPoolConfig()
+        self._pool = None
+        # Guards pool creation and `_last_used`, which every checkout and return touches.
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self._config.max_size)
+        self._last_used: dict[int, float] = {}
+
+    @property
+    def config(self) -> PostgresPoolConfig:
+        return self._config
+
+    def _ensure_pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    from psycopg2.pool import ThreadedConnectionPool
+
+                    kwargs = {}
+                    if self._config.statement_timeout_ms is not None:
+                        kwargs["options"] = f"-c statement_timeout={int(self._config.statement_timeout_ms)}"
+                    if self._config.connection_factory is not None:
+                        kwargs["connection_factory"] = self._config.connection_factory
+                    # Idle connections beyond min_size are closed by psycopg2 on return, so keep at
+                    # least one warm connection even when min_size is 0.
+                    self._pool = ThreadedConnectionPool(
+                        max(self._config.min_size, 1), self._config.max_size, self._dsn, **kwargs
+                    )
+        return self._pool
+
+    def _idle_since(self, conn) -> Optional[float]:
+        with self._lock:
+            return self._last_used.get(id(conn))
+
+    def _mark_returned(self, conn) -> None:
+        with self._lock:
+            self._last_used[id(conn)] = time.monotonic()
+
+    def _forget(self, conn) -> None:
+        with self._lock:
+            self._last_used.pop(id(conn), None)
+
+    def _is_healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        last_used = self._idle_since(conn)
+        if last_used is None or time.monotonic() - last_used < self._config.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception as exc:
+            logger.warning(f"Discarding unhealthy Postgres connection: {exc}")
+            return False
+
+    def _checkout(self):
+        pool = self._ensure_pool()
+        while True:
+            conn = pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+            self._forget(conn)
+            pool.putconn(conn, close=True)
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator:
+        """
+        Check out a connection; commit on success, roll back on error, then return it.
+
+        Mirrors the `with psycopg2.connect(...) as conn:` semantics the gateway relied on.
+        """
+        if not self._slots.acquire(timeout=self._config.acquire_timeout):
+            raise RuntimeError(
+                f"Timed out after {self._config.acquire_timeout:.0f}s waiting for a Postgres connection "
+                f"(pool max_size={self._config.max_size})."
+            )
+        conn = None
+        discard = False
+        try:
+            conn = self._checkout()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    discard = True
+                raise
+        finally:
+            if conn is not None:
+                discard = discard or bool(conn.closed)
+                self._mark_returned(conn)
+                self._pool.putconn(conn, close=discard)
+                if conn.closed:
+                    # Discarded, or closed by psycopg2 because more than min_size are idle.
+                    self._forget(conn)
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+            self._pool = None
+            self._last_used.clear()
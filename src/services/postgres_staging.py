@@ -0,0 +1,121 @@
+"""
+Batch sources for the PostgreSQL backend's set-based upserts.
+
+Reconcile statements read a batch as ``{source}``. Small batches are sent inline as
+``(VALUES ...)`` through ``execute_values``; batches of `STAGING_MIN_ROWS` or more are streamed
+into a session-local temporary table with a single ``COPY ... FROM STDIN`` first, so a batch
+costs a handful of round trips regardless of its size without paying for a temp table on the
+typical few-row write.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import Any, Iterable, Optional, Sequence
+
+# Below this many rows the temp table's catalog churn costs more than it saves.
+STAGING_MIN_ROWS = 1000
+
+# Flush the COPY buffer to the server in chunks rather than building one huge string.
+_COPY_BUFFER_SIZE = 1 << 20
+
+
+def _encode_copy_value(value: Any) -> str:
+    """Encode one value for COPY's text format (tab separated, ``\\N`` for NULL)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class _RowStream(io.TextIOBase):
+    """File-like adapter that encodes rows lazily as psycopg2 reads from it."""
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._rows = iter(rows)
+        self._pending = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        target = _COPY_BUFFER_SIZE if size is None or size < 0 else size
+        parts = [self._pending]
+        length = len(self._pending)
+        while length < target:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = "\t".join(_encode_copy_value(v) for v in row) + "\n"
+            parts.append(line)
+            length += len(line)
+        data = "".join(parts)
+        self._pending = data[target:]
+        return data[:target]
+
+    def readline(self, size: int = -1) -> str:  # pragma: no cover - psycopg2 only calls read()
+        return self.read(size)
+
+
+def copy_to_staging(cursor, table: str, columns: Sequence[tuple[str, str]], rows: Iterable[Sequence[Any]]) -> None:
+    """
+    Create temporary table ``table`` with ``columns`` (name, SQL type) and COPY ``rows`` into it.
+
+    The table is dropped on commit; callers reconciling several batches in one transaction
+    should call ``drop_staging`` once they are done with it.
+    """
+    column_ddl = ", ".join(f"{name} {sql_type}" for name, sql_type in columns)
+    column_list = ", ".join(name for name, _ in columns)
+    cursor.execute(f"CREATE TEMP TABLE {table} ({column_ddl}) ON COMMIT DROP")
+    cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN", _RowStream(rows), size=_COPY_BUFFER_SIZE)
+
+
+def drop_staging(cursor, table: str) -> None:
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+class BatchSource:
+    """
+    One batch of rows, readable by reconcile SQL as ``{source}`` (aliased ``s``).
+
+    Close it once the batch is reconciled so a staging table does not outlive the statement
+    group when several batches share a transaction.
+    """
+
+    def __init__(self, cursor, table: str, columns: Sequence[tuple[str, str]], rows: Iterable[Sequence[Any]]) -> None:
+        self._cursor = cursor
+        self._table = table
+        self._columns = columns
+        self._rows = list(rows)
+        self.staged = len(self._rows) >= STAGING_MIN_ROWS
+        if self.staged:
+            copy_to_staging(cursor, table, columns, self._rows)
+
+    def execute(self, sql: str, fetch: bool = False) -> Optional[list]:
+        if self.staged:
+            self._cursor.execute(sql.format(source=f"{self._table} s"))
+            return self._cursor.fetchall() if fetch else None
+
+        from psycopg2.extras import execute_values
+
+        names = ", ".join(name for name, _ in self._columns)
+        template = "(" + ", ".join(f"%s::{sql_type}" for _, sql_type in self._columns) + ")"
+        return execute_values(
+            self._cursor,
+            sql.format(source=f"(VALUES %s) AS s({names})"),
+            self._rows,
+            template=template,
+            page_size=STAGING_MIN_ROWS,
+            fetch=fetch,
+        )
+
+    def close(self) -> None:
+        if self.staged:
+            drop_staging(self._cursor, self._table)
@@ -0,0 +1,168 @@
+"""
+Per-file content manifest used by incremental bootstrap runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, Optional, Sequence, TypeVar
+
+from src.models.entities import SourceFileDTO
+from src.services.doc_discovery import IndexedFile
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IncrementalTracker:
+    """
+    Compares the documentation index against the manifest stored by the previous run.
+
+    A file is unchanged when its size and mtime match the manifest, or when its content
+    hash matches after a stat mismatch (fresh checkouts touch mtimes but not content).
+    Unchanged entities are rehydrated from the store; everything else is re-parsed.
+    """
+
+    def __init__(self, docs_root: Path, previous: Iterable[SourceFileDTO]) -> None:
+        self._docs_root = docs_root
+        self._previous = {entry.path: entry for entry in previous}
+        self._entries: dict[str, SourceFileDTO] = {}
+        self._changed_codes: dict[str, set[str]] = {}
+        self._changed_file_count = 0
+        self._unchanged_file_count = 0
+
+    @property
+    def changed_file_count(self) -> int:
+        return self._changed_file_count
+
+    @property
+    def unchanged_file_count(self) -> int:
+        return self._unchanged_file_count
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.relative_to(self._docs_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _lookup_unchanged(self, indexed: IndexedFile, entity_type: str) -> tuple[str, Optional[SourceFileDTO]]:
+        """Return the file's content hash and the matching manifest entry (if the file is unchanged)."""
+        previous = self._previous.get(self._relative(indexed.path))
+        if previous is not None and previous.entity_type == entity_type:
+            if previous.size == indexed.size and previous.mtime_ns == indexed.mtime_ns:
+                return previous.sha256, previous
+            sha256 = file_sha256(indexed.path)
+            if sha256 == previous.sha256:
+                return sha256, previous
+            return sha256, None
+        return file_sha256(indexed.path), None
+
+    def _record(self, indexed: IndexedFile, sha256: str, entity_type: str, entity_code: Optional[str]) -> None:
+        rel = self._relative(indexed.path)
+        self._entries[rel] = SourceFileDTO(
+            path=rel,
+            size=indexed.size,
+            mtime_ns=indexed.mtime_ns,
+            sha256=sha256,
+            entity_type=entity_type,
+            entity_code=entity_code,
+        )
+
+    def track_file(self, indexed: Optional[IndexedFile], entity_type: str, entity_code: Optional[str]) -> bool:
+        """Record a file that is always parsed (e.g. project.md) and report whether it changed."""
+        if indexed is None:
+            return True
+        sha256, previous = self._lookup_unchanged(indexed, entity_type)
+        changed = previous is None or previous.entity_code != entity_code
+        self._record(indexed, sha256, entity_type, entity_code)
+        if changed:
+            self._changed_file_count += 1
+            if entity_code is not None:
+                self._changed_codes.setdefault(entity_type, set()).add(entity_code)
+        else:
+            self._unchanged_file_count += 1
+        return changed
+
+    def load(
+        self,
+        entity_type: str,
+        files: Sequence[IndexedFile],
+        parse: Callable[[Sequence[IndexedFile]], Sequence[T]],
+        rehydrate: Callable[[Sequence[str]], Mapping[str, T]],
+    ) -> list[T]:
+        """
+        Parse changed files and rehydrate unchanged ones, preserving index order.
+
+        ``rehydrate`` receives every unchanged file's entity code in one call and returns the
+        entities it still has; files whose entity is missing are parsed again. Parsers produce
+        exactly one DTO per markdown file, so parsed results are zipped back onto their source
+        files to record entity codes in the manifest.
+        """
+        changed_codes = self._changed_codes.setdefault(entity_type, set())
+
+        if not files:
+            # No markdown documents: the parser's legacy JSON fallback decides everything.
+            dtos = list(parse(files))
+            changed_codes.update(getattr(dto, "code") for dto in dtos)
+            return dtos
+
+        by_path: dict[Path, T] = {}
+        hashes: dict[Path, str] = {}
+        to_parse: list[IndexedFile] = []
+
+        unchanged: dict[Path, str] = {}
+        for indexed in files:
+            sha256, previous = self._lookup_unchanged(indexed, entity_type)
+            hashes[indexed.path] = sha256
+            if previous is not None and previous.entity_code:
+                unchanged[indexed.path] = previous.entity_code
+        rehydrated = rehydrate(list(unchanged.values())) if unchanged else {}
+
+        for indexed in files:
+            sha256 = hashes[indexed.path]
+            code = unchanged.get(indexed.path)
+            dto = rehydrated.get(code) if code is not None else None
+            if dto is None:
+                to_parse.append(indexed)
+                continue
+            by_path[indexed.path] = dto
+            self._record(indexed, sha256, entity_type, getattr(dto, "code"))
+            self._unchanged_file_count += 1
+
+        if to_parse:
+            parsed = list(parse(to_parse))
+            if len(parsed) != len(to_parse):
+                raise RuntimeError(
+                    f"Incremental parse of {entity_type} files returned {len(parsed)} entities "
+                    f"for {len(to_parse)} files."
+                )
+            for indexed, dto in zip(to_parse, parsed):
+                code = getattr(dto, "code")
+                by_path[indexed.path] = dto
+                changed_codes.add(code)
+                self._record(indexed, hashes[indexed.path], entity_type, code)
+            self._changed_file_count += len(to_parse)
+
+        logger.debug(
+            "Incremental %s: %d re-parsed, %d reused", entity_type, len(to_parse), len(files) - len(to_parse)
+        )
+        return [by_path[indexed.path] for indexed in files]
+
+    def is_changed(self, entity_type: str, code: str) -> bool:
+        return code in self._changed_codes.get(entity_type, set())
+
+    def entries(self) -> list[SourceFileDTO]:
+        return sorted(self._entries.values(), key=lambda entry: entry.path)
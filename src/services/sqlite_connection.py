@@ -0,0 +1,160 @@
+"""
+Long-lived SQLite connections for `SqliteGateway`.
+
+Opening a connection per call re-reads the schema and re-applies pragmas each time, and throws
+away sqlite3's prepared-statement cache. The manager keeps one connection per thread (sqlite3
+connections are bound to their creating thread) and configures it once from a pragma profile.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHED_STATEMENTS = 256
+
+# SQLite reports these pragmas as integers; map them back to the names used in profiles.
+_PRAGMA_VALUE_NAMES = {
+    "synchronous": {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"},
+    "temp_store": {0: "DEFAULT", 1: "FILE", 2: "MEMORY"},
+}
+
+
+@dataclass(frozen=True)
+class SqlitePragmaProfile:
+    """Pragmas applied to every connection the manager opens."""
+
+    name: str
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    # Negative values are KiB (-65536 = 64 MiB of page cache per connection).
+    cache_size: int = -65536
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+
+    def statements(self) -> list[str]:
+        return [
+            "PRAGMA foreign_keys = ON",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}",
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+        ]
+
+
+PRAGMA_PROFILES: dict[str, SqlitePragmaProfile] = {
+    # SQLite's own defaults (rollback journal, fsync on every commit): a committed run survives
+    # power loss.
+    "durable": SqlitePragmaProfile(
+        name="durable", journal_mode="DELETE", synchronous="FULL", mmap_size=0, cache_size=-2000, temp_store="DEFAULT"
+    ),
+    # Opt-in. WAL + synchronous=NORMAL: durable across application crashes, may lose the last
+    # transactions on power loss; readers never block the writer.
+    "tuned": SqlitePragmaProfile(name="tuned"),
+    # For throwaway stores (CI, benchmarks): no fsync at all.
+    "fast": SqlitePragmaProfile(name="fast", synchronous="OFF", cache_size=-262144),
+}
+DEFAULT_PRAGMA_PROFILE = "durable"
+
+
+def resolve_pragma_profile(profile: SqlitePragmaProfile | str | None) -> SqlitePragmaProfile:
+    if profile is None:
+        return PRAGMA_PROFILES[DEFAULT_PRAGMA_PROFILE]
+    if isinstance(profile, SqlitePragmaProfile):
+        return profile
+    try:
+        return PRAGMA_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown SQLite pragma profile '{profile}'. Choose from: {', '.join(PRAGMA_PROFILES)}.")
+
+
+class SqliteConnectionManager:
+    """Hands out one configured connection per thread and closes them all on `close()`."""
+
+    def __init__(
+        self,
+        storage_path: Path,
+        profile: SqlitePragmaProfile | str | None = None,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+    ) -> None:
+        self._storage_path = storage_path
+        self._profile = resolve_pragma_profile(profile)
+        self._cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._pid = os.getpid()
+        self._applied: Optional[dict[str, str]] = None
+
+    @property
+    def profile(self) -> SqlitePragmaProfile:
+        return self._profile
+
+    def _open(self) -> sqlite3.Connection:
+        # Each connection is only used by the thread that opened it; check_same_thread=False just
+        # lets `close()` release every thread's connection from the calling thread.
+        conn = sqlite3.connect(self._storage_path, cached_statements=self._cached_statements, check_same_thread=False)
+        for statement in self._profile.statements():
+            conn.execute(statement)
+        if self._applied is None:
+            self._applied = self._read_back(conn)
+            if self._applied["journal_mode"].upper() != self._profile.journal_mode.upper():
+                logger.warning(
+                    "SQLite journal_mode %s was requested but %s is active for %s",
+                    self._profile.journal_mode,
+                    self._applied["journal_mode"],
+                    self._storage_path,
+                )
+        return conn
+
+    def _read_back(self, conn: sqlite3.Connection) -> dict[str, str]:
+        applied = {"profile": self._profile.name}
+        for pragma in ("journal_mode", "synchronous", "mmap_size", "cache_size", "temp_store"):
+            row = conn.execute(f"PRAGMA {pragma}").fetchone()
+            value = row[0] if row else ""
+            applied[pragma] = _PRAGMA_VALUE_NAMES.get(pragma, {}).get(value, str(value))
+        applied["cached_statements"] = str(self._cached_statements)
+        return applied
+
+    def get(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use (and again after a fork)."""
+        if os.getpid() != self._pid:
+            # Connections must not be shared with a forked child; start over without closing
+            # the parent's handles.
+            self._local = threading.local()
+            self._connections = []
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def describe(self) -> dict[str, str]:
+        """The pragma values actually in effect (read back from SQLite, not just requested)."""
+        if self._applied is None:
+            self.get()
+        return dict(self._applied or {})
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as exc:  # pragma: no cover - defensive
+                logger.debug("Failed to close SQLite connection: %s", exc)
+        self._local = threading.local()
@@ -5,131 +5,83 @@ import json
 import logging
 import sqlite3
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 from src.models.entities import (
     AIJobDTO,
     FeatureDTO,
     ProjectDTO,
+    SearchHitDTO,
+    SourceFileDTO,
     SpecificationDTO,
     TaskDTO,
     TaskDependencyDTO,
     TaskRunDTO,
 )
+from src.services.data_store_protocol import DEFAULT_ITER_BATCH_SIZE
+from src.services.sqlite_connection import (
+    DEFAULT_CACHED_STATEMENTS,
+    SqliteConnectionManager,
+    SqlitePragmaProfile,
+)
+from src.services.sqlite_migrations import (
+    SCHEMA_VERSION,
+    SEARCH_INDEX_BACKFILL,
+    SEARCH_INDEX_TABLE,
+    SEARCH_KEYS_TABLE,
+    find_schema_drift,
+    has_search_index,
+    migrate,
+    schema_version,
+)
 
 logger = logging.getLogger(__name__)
 
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older builds) for `IN (...)` lookups.
+_MAX_IN_PARAMS = 500
+
+SEARCH_ENTITY_TYPES = ("task", "feature", "spec")
+
+
+def _fts_query(query: str) -> str:
+    """
+    Quote each term so punctuation in codes and paths (``T-001``, ``api/v2``) is not parsed as
+    FTS5 syntax. Terms are ANDed; a trailing ``*`` keeps prefix matching.
+    """
+    terms = []
+    for token in query.split():
+        prefix = token.endswith("*")
+        token = token.rstrip("*")
+        if token:
+            terms.append('"' + token.replace('"', '""') + '"' + ("*" if prefix else ""))
+    if not terms:
+        raise ValueError("Search query is empty.")
+    return " ".join(terms)
+
 
 class SqliteGateway:
-    def __init__(self, storage_path: Path | str) -> None:
+    def __init__(
+        self,
+        storage_path: Path | str,
+        pragma_profile: SqlitePragmaProfile | str | None = None,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+    ) -> None:
         self._is_postgres = False
         self._storage_path = Path(storage_path) if isinstance(storage_path, str) else storage_path
         self._active_conn: sqlite3.Connection | None = None
+        if self._storage_path.parent:
+            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connections = SqliteConnectionManager(self._storage_path, pragma_profile, cached_statements)
         self._init_sqlite_db()
 
     def _sqlite_connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._storage_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        # The connection is long-lived: `with conn:` commits or rolls back but never closes it.
+        return self._connections.get()
 
     def _init_sqlite_db(self) -> None:
-        if self._storage_path.parent:
-            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-
         with self._sqlite_connect() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS projects (
-                    code TEXT PRIMARY KEY,
-                    name TEXT,
-                    description TEXT,
-                    metadata TEXT
-                )
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS features (
-                    code TEXT PRIMARY KEY,
-                    project_code TEXT,
-                    name TEXT,
-                    description TEXT,
-                    priority TEXT,
-                    metadata TEXT,
-                    FOREIGN KEY(project_code) REFERENCES projects(code)
-                )
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS specs (
-                    code TEXT PRIMARY KEY,
-                    feature_code TEXT,
-                    title TEXT,
-                    path TEXT,
-                    metadata TEXT,
-                    FOREIGN KEY(feature_code) REFERENCES features(code)
-                )
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS tasks (
-                    code TEXT PRIMARY KEY,
-                    feature_code TEXT,
-                    title TEXT,
-                    status TEXT,
-                    task_type TEXT,
-                    acceptance TEXT,
-                    step_order INTEGER,
-                    metadata TEXT,
-                    FOREIGN KEY(feature_code) REFERENCES features(code)
-                )
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS task_dependencies (
-                    task_code TEXT,
-                    depends_on TEXT,
-                    PRIMARY KEY (task_code, depends_on),
-                    FOREIGN KEY(task_code) REFERENCES tasks(code) ON DELETE CASCADE,
-                    FOREIGN KEY(depends_on) REFERENCES tasks(code) ON DELETE CASCADE
-                )
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS task_runs (
-                    task_code TEXT PRIMARY KEY,
-                    status TEXT,
-                    metadata TEXT,
-                    FOREIGN KEY(task_code) REFERENCES tasks(code)
-                )
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS ai_jobs (
-                    task_code TEXT,
-                    job_type TEXT,
-                    prompt TEXT,
-                    metadata TEXT,
-                    PRIMARY KEY (task_code, job_type),
-                    FOREIGN KEY(task_code) REFERENCES tasks(code)
-                )
-            """
-            )
-
-            conn.commit()
+            self._schema_version = migrate(conn)
+            self._search_enabled = has_search_index(conn)
 
     def _log_entities(self, entity_type: str, entities: Sequence[object]) -> None:
         if not logger.isEnabledFor(logging.DEBUG):
@@ -137,32 +89,25 @@ class SqliteGateway:
         logger.debug("Persisting %s: %s", entity_type, [getattr(e, "code", None) for e in entities])
 
     def verify_schema(self) -> None:
-        required_schema = {
-            "projects": {"code", "name", "description", "metadata"},
-            "features": {"code", "project_code", "name", "description", "priority", "metadata"},
-            "specs": {"code", "feature_code", "title", "path", "metadata"},
-            "tasks": {"code", "feature_code", "title", "status", "task_type", "acceptance", "step_order", "metadata"},
-            "task_dependencies": {"task_code", "depends_on"},
-            "task_runs": {"task_code", "status", "metadata"},
-            "ai_jobs": {"task_code", "job_type", "prompt", "metadata"},
-        }
+        # _get_connection, not _sqlite_connect: inside transaction() a `with conn:` block on the
+        # shared connection would commit the caller's transaction early.
+        with self._get_connection() as conn:
+            # A store stamped with the current version was verified when it was migrated.
+            if schema_version(conn) == SCHEMA_VERSION:
+                return
+            drift = find_schema_drift(conn)
+        if drift:
+            raise Exception(drift)
 
-        with self._sqlite_connect() as conn:
-            cursor = conn.cursor()
-            for table, columns in required_schema.items():
-                try:
-                    cursor.execute(f"PRAGMA table_info({table})")
-                    rows = cursor.fetchall()
-                    if not rows:
-                        raise Exception(f"Schema drift detected: Missing table '{table}'")
+    def close(self) -> None:
+        """Close the long-lived connections; the gateway reconnects lazily if used again."""
+        self._connections.close()
 
-                    existing_cols = {row[1] for row in rows}
-                    missing_cols = columns - existing_cols
+    def describe_storage(self) -> dict[str, str]:
+        return {"backend": "sqlite", **self._connections.describe(), "schema_version": str(self._schema_version)}
 
-                    if missing_cols:
-                        raise Exception(f"Schema drift detected: Table '{table}' missing columns {missing_cols}")
-                except sqlite3.OperationalError as e:
-                    raise Exception(f"Schema check failed for {table}: {e}")
+    def ensure_indexes(self) -> None:
+        """No-op: every SQLite lookup table is keyed by `code` already."""
 
     @staticmethod
     def _retry_sqlite_operation(retries: int = 3, delay: float = 0.1):
@@ -213,17 +158,39 @@ class SqliteGateway:
             finally:
                 self._active_conn = None
 
-    def _execute_upsert(self, table: str, columns: list[str], data: list[tuple], unique_key: str = "code"):
-        if not data:
-            return
+    @staticmethod
+    def _upsert_sql(table: str, columns: list[str], key_columns: tuple[str, ...]) -> str:
+        """
+        Build an `INSERT ... ON CONFLICT DO UPDATE` that leaves unchanged rows untouched.
 
+        Unlike `INSERT OR REPLACE`, this never deletes the existing row, so `ON DELETE CASCADE`
+        children (task dependencies) survive and unchanged rows cost no page or index writes.
+        """
         cols_str = ", ".join(columns)
         placeholders = ", ".join(["?"] * len(columns))
-        sql = f"INSERT OR REPLACE INTO {table} ({cols_str}) VALUES ({placeholders})"
+        sql = f"INSERT INTO {table} ({cols_str}) VALUES ({placeholders}) ON CONFLICT({', '.join(key_columns)}) "
+
+        value_columns = [c for c in columns if c not in key_columns]
+        if not value_columns:
+            return sql + "DO NOTHING"
+        assignments = ", ".join(f"{c} = excluded.{c}" for c in value_columns)
+        changed = " OR ".join(f"{table}.{c} IS NOT excluded.{c}" for c in value_columns)
+        return sql + f"DO UPDATE SET {assignments} WHERE {changed}"
+
+    def _execute_upsert(
+        self, table: str, columns: list[str], data: list[tuple], unique_key: str | tuple[str, ...] = "code"
+    ):
+        if not data:
+            return
+
+        key_columns = (unique_key,) if isinstance(unique_key, str) else tuple(unique_key)
+        sql = self._upsert_sql(table, columns, key_columns)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.executemany(sql, data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Upserted %s: %s of %d row(s) written", table, cursor.rowcount, len(data))
             if self._active_conn is None:
                 conn.commit()
 
@@ -269,10 +236,11 @@ class SqliteGateway:
                 str(s.title) if s.title is not None else None,
                 str(s.path) if s.path is not None else None,
                 json.dumps(s.metadata),
+                s.body or None,
             )
             for s in specs
         ]
-        self._execute_upsert("specs", ["code", "feature_code", "title", "path", "metadata"], data)
+        self._execute_upsert("specs", ["code", "feature_code", "title", "path", "metadata", "body"], data)
 
     @_retry_sqlite_operation()
     def create_or_update_tasks(self, tasks: Sequence[TaskDTO]) -> None:
@@ -330,74 +298,235 @@ class SqliteGateway:
             "ai_jobs",
             ["task_code", "job_type", "prompt", "metadata"],
             data,
-            unique_key="task_code",
+            unique_key=("task_code", "job_type"),
         )
 
-    def get_task(self, code: str) -> TaskDTO | None:
+    def get_source_manifest(self) -> list[SourceFileDTO]:
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks WHERE code = ?", (code,))
-            row = cursor.fetchone()
-            if row:
-                return TaskDTO(
-                    code=row["code"],
-                    feature_code=row["feature_code"],
-                    title=row["title"],
-                    status=row["status"],
-                    task_type=row["task_type"],
-                    acceptance=row["acceptance"],
-                    step_order=row["step_order"],
-                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            cursor.execute("SELECT path, size, mtime_ns, sha256, entity_type, entity_code FROM source_manifest")
+            return [
+                SourceFileDTO(
+                    path=row[0],
+                    size=row[1],
+                    mtime_ns=row[2],
+                    sha256=row[3],
+                    entity_type=row[4],
+                    entity_code=row[5],
                 )
-        return None
+                for row in cursor.fetchall()
+            ]
 
-    def get_project(self, code: str) -> ProjectDTO | None:
+    def replace_source_manifest(self, entries: Sequence[SourceFileDTO]) -> None:
+        data = [(e.path, e.size, e.mtime_ns, e.sha256, e.entity_type, e.entity_code) for e in entries]
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM projects WHERE code = ?", (code,))
-            row = cursor.fetchone()
-            if row:
-                meta = json.loads(row["metadata"]) if row["metadata"] else {}
-                return ProjectDTO(
-                    code=row["code"],
-                    name=row["name"],
-                    description=row["description"],
-                    repository_path=meta.get("repository_path") or meta.get("repository"),
-                    metadata=meta,
+            cursor.execute("DELETE FROM source_manifest")
+            if data:
+                cursor.executemany(
+                    "INSERT INTO source_manifest (path, size, mtime_ns, sha256, entity_type, entity_code) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    data,
                 )
-        return None
+            if self._active_conn is None:
+                conn.commit()
 
-    def get_feature(self, code: str) -> FeatureDTO | None:
+    @staticmethod
+    def _row_to_task(row: sqlite3.Row) -> TaskDTO:
+        return TaskDTO(
+            code=row["code"],
+            feature_code=row["feature_code"],
+            title=row["title"],
+            status=row["status"],
+            task_type=row["task_type"],
+            acceptance=row["acceptance"],
+            step_order=row["step_order"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+        )
+
+    @staticmethod
+    def _row_to_project(row: sqlite3.Row) -> ProjectDTO:
+        meta = json.loads(row["metadata"]) if row["metadata"] else {}
+        return ProjectDTO(
+            code=row["code"],
+            name=row["name"],
+            description=row["description"],
+            repository_path=meta.get("repository_path") or meta.get("repository"),
+            metadata=meta,
+        )
+
+    @staticmethod
+    def _row_to_feature(row: sqlite3.Row) -> FeatureDTO:
+        return FeatureDTO(
+            code=row["code"],
+            project_code=row["project_code"],
+            name=row["name"],
+            description=row["description"],
+            priority=row["priority"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+        )
+
+    @staticmethod
+    def _row_to_spec(row: sqlite3.Row) -> SpecificationDTO:
+        return SpecificationDTO(
+            code=row["code"],
+            feature_code=row["feature_code"],
+            title=row["title"],
+            path=row["path"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            body=row["body"] or "",
+        )
+
+    def _get_one_by_code(self, table: str, code: str, to_dto):
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM features WHERE code = ?", (code,))
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(f"SELECT * FROM {table} WHERE code = ?", (code,))
             row = cursor.fetchone()
             if row:
-                return FeatureDTO(
-                    code=row["code"],
-                    project_code=row["project_code"],
-                    name=row["name"],
-                    description=row["description"],
-                    priority=row["priority"],
-                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                )
+                return to_dto(row)
         return None
 
+    def _get_many_by_code(self, table: str, codes: Iterable[str], to_dto) -> dict:
+        unique_codes = list(dict.fromkeys(c for c in codes if c))
+        found: dict = {}
+        if not unique_codes:
+            return found
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            for start in range(0, len(unique_codes), _MAX_IN_PARAMS):
+                chunk = unique_codes[start : start + _MAX_IN_PARAMS]
+                placeholders = ", ".join(["?"] * len(chunk))
+                cursor.execute(f"SELECT * FROM {table} WHERE code IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    found[row["code"]] = to_dto(row)
+        return found
+
+    def get_task(self, code: str) -> TaskDTO | None:
+        return self._get_one_by_code("tasks", code, self._row_to_task)
+
+    def get_project(self, code: str) -> ProjectDTO | None:
+        return self._get_one_by_code("projects", code, self._row_to_project)
+
+    def get_feature(self, code: str) -> FeatureDTO | None:
+        return self._get_one_by_code("features", code, self._row_to_feature)
+
     def get_spec(self, code: str) -> SpecificationDTO | None:
+        return self._get_one_by_code("specs", code, self._row_to_spec)
+
+    def get_tasks_by_codes(self, codes: Iterable[str]) -> dict[str, TaskDTO]:
+        return self._get_many_by_code("tasks", codes, self._row_to_task)
+
+    def get_projects_by_codes(self, codes: Iterable[str]) -> dict[str, ProjectDTO]:
+        return self._get_many_by_code("projects", codes, self._row_to_project)
+
+    def get_features_by_codes(self, codes: Iterable[str]) -> dict[str, FeatureDTO]:
+        return self._get_many_by_code("features", codes, self._row_to_feature)
+
+    def get_specs_by_codes(self, codes: Iterable[str]) -> dict[str, SpecificationDTO]:
+        return self._get_many_by_code("specs", codes, self._row_to_spec)
+
+    def _iter_rows(self, sql: str, params: Sequence[object], batch_size: int) -> Iterator[sqlite3.Row]:
+        """
+        Stream `sql` in `fetchmany` batches so only `batch_size` rows are held at a time.
+
+        The connection stays in use until the iterator is exhausted or closed; do not write to
+        the tables being read from inside the loop.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM specs WHERE code = ?", (code,))
-            row = cursor.fetchone()
-            if row:
-                return SpecificationDTO(
+            cursor.row_factory = sqlite3.Row
+            try:
+                cursor.execute(sql, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+
+    def iter_tasks(
+        self, feature_code: str | None = None, status: str | None = None, batch_size: int = DEFAULT_ITER_BATCH_SIZE
+    ) -> Iterator[TaskDTO]:
+        clauses, params = [], []
+        if feature_code is not None:
+            clauses.append("feature_code = ?")
+            params.append(feature_code)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        for row in self._iter_rows(f"SELECT * FROM tasks{where} ORDER BY code", params, batch_size):
+            yield self._row_to_task(row)
+
+    def iter_features(
+        self, project_code: str | None = None, batch_size: int = DEFAULT_ITER_BATCH_SIZE
+    ) -> Iterator[FeatureDTO]:
+        if project_code is None:
+            sql, params = "SELECT * FROM features ORDER BY code", []
+        else:
+            sql, params = "SELECT * FROM features WHERE project_code = ? ORDER BY code", [project_code]
+        for row in self._iter_rows(sql, params, batch_size):
+            yield self._row_to_feature(row)
+
+    def iter_dependencies(self, batch_size: int = DEFAULT_ITER_BATCH_SIZE) -> Iterator[TaskDependencyDTO]:
+        sql = "SELECT task_code, depends_on FROM task_dependencies ORDER BY task_code, depends_on"
+        for row in self._iter_rows(sql, (), batch_size):
+            yield TaskDependencyDTO(task_code=row["task_code"], depends_on=row["depends_on"])
+
+    def _require_search_index(self) -> None:
+        if not self._search_enabled:
+            raise RuntimeError(
+                "Full-text search is unavailable: this SQLite build was compiled without FTS5, "
+                f"so the {SEARCH_INDEX_TABLE} table was not created."
+            )
+
+    def search(self, query: str, entity_type: str | None = None, limit: int = 20) -> list[SearchHitDTO]:
+        """Rank tasks, features and specs matching ``query`` with BM25 (codes and titles weigh more than bodies)."""
+        self._require_search_index()
+        if entity_type is not None and entity_type not in SEARCH_ENTITY_TYPES:
+            raise ValueError(f"Unknown entity type '{entity_type}'. Choose from: {', '.join(SEARCH_ENTITY_TYPES)}.")
+
+        sql = (
+            "SELECT entity_type, code, title, "
+            f"snippet({SEARCH_INDEX_TABLE}, -1, '[', ']', '...', 12) AS snippet, "
+            f"bm25({SEARCH_INDEX_TABLE}, 0.0, 4.0, 4.0, 1.0) AS score "
+            f"FROM {SEARCH_INDEX_TABLE} WHERE {SEARCH_INDEX_TABLE} MATCH ?"
+        )
+        params: list[object] = [_fts_query(query)]
+        if entity_type is not None:
+            sql += " AND entity_type = ?"
+            params.append(entity_type)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(int(limit))
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(sql, params)
+            # bm25() is lower-is-better; report scores the other way round.
+            return [
+                SearchHitDTO(
+                    entity_type=row["entity_type"],
                     code=row["code"],
-                    feature_code=row["feature_code"],
-                    title=row["title"],
-                    path=row["path"],
-                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+                    title=row["title"] or "",
+                    snippet=row["snippet"] or "",
+                    score=-row["score"],
                 )
-        return None
+                for row in cursor.fetchall()
+            ]
+
+    def rebuild_search_index(self) -> None:
+        """Repopulate the search index from the entity tables (e.g. if it was edited by hand)."""
+        self._require_search_index()
+        with self.transaction():
+            conn = self._active_conn
+            conn.execute(f"DELETE FROM {SEARCH_INDEX_TABLE}")
+            conn.execute(f"DELETE FROM {SEARCH_KEYS_TABLE}")
+            for statement in SEARCH_INDEX_BACKFILL:
+                conn.execute(statement)
@@ -0,0 +1,276 @@
+"""
+Versioned schema migrations for the SQLite store.
+
+The schema version lives in `PRAGMA user_version`. Each migration runs in its own transaction
+and bumps the version when it commits, so existing databases are upgraded in place and a
+store at `SCHEMA_VERSION` can skip structural verification entirely.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: tuple[str, ...]
+    # Optional capability check; when it fails migration stops at the previous version, so a build
+    # that supports it applies it the next time the store is opened.
+    requires: Optional[Callable[[sqlite3.Connection], bool]] = None
+
+
+_BASE_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS projects (
+        code TEXT PRIMARY KEY,
+        name TEXT,
+        description TEXT,
+        metadata TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS features (
+        code TEXT PRIMARY KEY,
+        project_code TEXT,
+        name TEXT,
+        description TEXT,
+        priority TEXT,
+        metadata TEXT,
+        FOREIGN KEY(project_code) REFERENCES projects(code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS specs (
+        code TEXT PRIMARY KEY,
+        feature_code TEXT,
+        title TEXT,
+        path TEXT,
+        metadata TEXT,
+        FOREIGN KEY(feature_code) REFERENCES features(code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        code TEXT PRIMARY KEY,
+        feature_code TEXT,
+        title TEXT,
+        status TEXT,
+        task_type TEXT,
+        acceptance TEXT,
+        step_order INTEGER,
+        metadata TEXT,
+        FOREIGN KEY(feature_code) REFERENCES features(code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS task_dependencies (
+        task_code TEXT,
+        depends_on TEXT,
+        PRIMARY KEY (task_code, depends_on),
+        FOREIGN KEY(task_code) REFERENCES tasks(code) ON DELETE CASCADE,
+        FOREIGN KEY(depends_on) REFERENCES tasks(code) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS task_runs (
+        task_code TEXT PRIMARY KEY,
+        status TEXT,
+        metadata TEXT,
+        FOREIGN KEY(task_code) REFERENCES tasks(code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ai_jobs (
+        task_code TEXT,
+        job_type TEXT,
+        prompt TEXT,
+        metadata TEXT,
+        PRIMARY KEY (task_code, job_type),
+        FOREIGN KEY(task_code) REFERENCES tasks(code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS source_manifest (
+        path TEXT PRIMARY KEY,
+        size INTEGER,
+        mtime_ns INTEGER,
+        sha256 TEXT,
+        entity_type TEXT,
+        entity_code TEXT
+    )
+    """,
+)
+
+_LOOKUP_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_features_project_code ON features(project_code)",
+    "CREATE INDEX IF NOT EXISTS idx_specs_feature_code ON specs(feature_code)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_feature_code ON tasks(feature_code)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)",
+    # Reverse edge: "which tasks depend on X" (the primary key only covers task_code first).
+    "CREATE INDEX IF NOT EXISTS idx_task_dependencies_depends_on ON task_dependencies(depends_on)",
+)
+
+SEARCH_INDEX_TABLE = "search_index"
+SEARCH_KEYS_TABLE = "search_keys"
+
+_SEARCH_SOURCES = (
+    # (table, entity_type, title column, body column)
+    ("tasks", "task", "title", "acceptance"),
+    ("features", "feature", "name", "description"),
+    ("specs", "spec", "title", "body"),
+)
+
+
+# FTS5 rowids come from `search_keys`, whose INTEGER PRIMARY KEY maps each (entity_type, code)
+# pair to a rowid that survives VACUUM; triggers find it through the unique index instead of
+# depending on the source table's implicit rowid.
+def _search_key(entity_type: str, ref: str) -> str:
+    return f"(SELECT id FROM {SEARCH_KEYS_TABLE} WHERE entity_type = '{entity_type}' AND code = {ref}.code)"
+
+
+def _search_triggers(table: str, entity_type: str, title: str, body: str) -> tuple[str, ...]:
+    insert_entry = (
+        f"INSERT OR IGNORE INTO {SEARCH_KEYS_TABLE} (entity_type, code) VALUES ('{entity_type}', new.code); "
+        f"INSERT INTO {SEARCH_INDEX_TABLE} (rowid, entity_type, code, title, body) "
+        f"VALUES ({_search_key(entity_type, 'new')}, '{entity_type}', new.code, new.{title}, new.{body});"
+    )
+    delete_entry = (
+        f"DELETE FROM {SEARCH_INDEX_TABLE} WHERE rowid = {_search_key(entity_type, 'old')}; "
+        f"DELETE FROM {SEARCH_KEYS_TABLE} WHERE entity_type = '{entity_type}' AND code = old.code;"
+    )
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN {insert_entry} END",
+        # Upserts SET every column, so only reindex when the indexed text actually changed.
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE OF code, {title}, {body} ON {table} "
+        f"WHEN old.code IS NOT new.code OR old.{title} IS NOT new.{title} OR old.{body} IS NOT new.{body} "
+        f"BEGIN {delete_entry} {insert_entry} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN {delete_entry} END",
+    )
+
+
+# Repopulates an empty index (and key table) from the entity tables.
+SEARCH_INDEX_BACKFILL = tuple(
+    statement
+    for table, entity_type, title, body in _SEARCH_SOURCES
+    for statement in (
+        f"INSERT OR IGNORE INTO {SEARCH_KEYS_TABLE} (entity_type, code) SELECT '{entity_type}', code FROM {table}",
+        f"INSERT INTO {SEARCH_INDEX_TABLE} (rowid, entity_type, code, title, body) "
+        f"SELECT k.id, '{entity_type}', t.code, t.{title}, t.{body} FROM {table} AS t "
+        f"JOIN {SEARCH_KEYS_TABLE} AS k ON k.entity_type = '{entity_type}' AND k.code = t.code",
+    )
+)
+
+_SEARCH_INDEX = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} USING fts5("
+    "entity_type UNINDEXED, code, title, body, tokenize = 'porter unicode61')",
+    f"CREATE TABLE IF NOT EXISTS {SEARCH_KEYS_TABLE} ("
+    "id INTEGER PRIMARY KEY, entity_type TEXT NOT NULL, code TEXT NOT NULL, UNIQUE (entity_type, code))",
+    *(statement for source in _SEARCH_SOURCES for statement in _search_triggers(*source)),
+    *SEARCH_INDEX_BACKFILL,
+)
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    return bool(conn.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0])
+
+
+def has_search_index(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_INDEX_TABLE,))
+    return row.fetchone() is not None
+
+
+# Append only: never edit a released migration, add a new one instead.
+MIGRATIONS: tuple[Migration, ...] = (
+    # Version 1 is the schema that unversioned stores were created with, so it is a no-op on them.
+    Migration(1, "Base tables", _BASE_TABLES),
+    Migration(2, "Foreign-key and lookup indexes", _LOOKUP_INDEXES),
+    Migration(3, "Spec bodies", ("ALTER TABLE specs ADD COLUMN body TEXT",)),
+    # Optional: SQLite builds without FTS5 stay at version 3 and `speckit search` reports the index
+    # as unavailable; the first build with FTS5 to open the store creates it.
+    Migration(4, "Full-text search index", _SEARCH_INDEX, requires=fts5_available),
+)
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+REQUIRED_COLUMNS: dict[str, set[str]] = {
+    "projects": {"code", "name", "description", "metadata"},
+    "features": {"code", "project_code", "name", "description", "priority", "metadata"},
+    "specs": {"code", "feature_code", "title", "path", "metadata"},
+    "tasks": {"code", "feature_code", "title", "status", "task_type", "acceptance", "step_order", "metadata"},
+    "task_dependencies": {"task_code", "depends_on"},
+    "task_runs": {"task_code", "status", "metadata"},
+    "ai_jobs": {"task_code", "job_type", "prompt", "metadata"},
+}
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def find_schema_drift(conn: sqlite3.Connection) -> Optional[str]:
+    """Return a description of the first missing table or column, or None if the schema matches."""
+    cursor = conn.cursor()
+    for table, columns in REQUIRED_COLUMNS.items():
+        try:
+            cursor.execute(f"PRAGMA table_info({table})")
+        except sqlite3.OperationalError as e:
+            return f"Schema check failed for {table}: {e}"
+        rows = cursor.fetchall()
+        if not rows:
+            return f"Schema drift detected: Missing table '{table}'"
+        missing_cols = columns - {row[1] for row in rows}
+        if missing_cols:
+            return f"Schema drift detected: Table '{table}' missing columns {missing_cols}"
+    return None
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Apply every pending migration and return the resulting schema version.
+
+    A store whose tables predate versioning (or were altered by hand) is only stamped once its
+    columns match `REQUIRED_COLUMNS`; otherwise it stays unversioned and `verify_schema` reports
+    the drift instead of the gateway failing to open.
+    """
+    current = schema_version(conn)
+    if current > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"SQLite store is at schema version {current}, newer than this release supports ({SCHEMA_VERSION}). "
+            "Upgrade speckit or point --storage-path at a different database."
+        )
+
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        try:
+            if migration.requires is not None and not migration.requires(conn):
+                logger.info(
+                    "Skipping SQLite migration %d (%s): not supported by this build",
+                    migration.version,
+                    migration.description,
+                )
+                return current
+            conn.execute("BEGIN")
+            for statement in migration.statements:
+                conn.execute(statement)
+            if find_schema_drift(conn) is not None:
+                conn.commit()
+                logger.warning(
+                    "SQLite schema does not match version %d; leaving the store unversioned", migration.version
+                )
+                return current
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+            conn.commit()
+        except sqlite3.OperationalError as exc:
+            conn.rollback()
+            logger.warning("SQLite migration %d (%s) failed: %s", migration.version, migration.description, exc)
+            return current
+        logger.debug("Applied SQLite migration %d: %s", migration.version, migration.description)
+        current = migration.version
+    return current
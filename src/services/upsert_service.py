@@ -9,6 +9,21 @@ from src.services.matchers.entity_matcher import EntityMatcher
 
 logger = logging.getLogger(__name__)
 
+# Entity codes listed at DEBUG per skipped/forced group; the INFO line carries only the count.
+LOG_SAMPLE_SIZE = 10
+
+
+def _log_matches(entity: str, skipped: Sequence[str], forced: Sequence[str]) -> None:
+    """One summary line per outcome instead of one per entity (a re-run matches every row)."""
+    for verb, codes in (("Forcing update of", forced), ("Skipping existing", skipped)):
+        if not codes:
+            continue
+        logger.info(f"{verb} {len(codes)} {entity}(s)", extra={"entity_type": entity.lower(), "count": len(codes)})
+        if logger.isEnabledFor(logging.DEBUG):
+            sample = codes[:LOG_SAMPLE_SIZE]
+            logger.debug(f"{verb} {entity}(s), first {len(sample)} of {len(codes)}: {', '.join(sample)}")
+
+
 class UpsertService:
     """Handles idempotent upsert operations for entities."""
 
@@ -18,62 +33,84 @@ class UpsertService:
 
     def upsert_projects(self, projects: Sequence[ProjectDTO], force: bool = False) -> None:
         to_upsert: list[ProjectDTO] = []
+        skipped: list[str] = []
+        forced: list[str] = []
+        self._matcher.prefetch_projects(projects)
         for project in projects:
             existing = self._matcher.find_existing_project(project)
             if existing:
                 if force:
-                    logger.info(f"Forcing update of Project {project.code}")
+                    forced.append(project.code)
                     to_upsert.append(project)
                 else:
-                    logger.info(f"Skipping Project {project.code} (exists)")
+                    skipped.append(project.code)
             else:
                 to_upsert.append(project)
 
+        _log_matches("Project", skipped, forced)
+        self._matcher.clear()
         if to_upsert:
             self._gateway.create_or_update_projects(to_upsert)
 
     def upsert_features(self, features: Sequence[FeatureDTO], force: bool = False) -> None:
         to_upsert: list[FeatureDTO] = []
+        skipped: list[str] = []
+        forced: list[str] = []
+        self._matcher.prefetch_features(features)
         for feature in features:
             existing = self._matcher.find_existing_feature(feature)
             if existing:
                 if force:
-                    logger.info(f"Forcing update of Feature {feature.code}")
+                    forced.append(feature.code)
                     to_upsert.append(feature)
                 else:
-                    logger.info(f"Skipping Feature {feature.code} (exists)")
+                    skipped.append(feature.code)
             else:
                 to_upsert.append(feature)
 
+        _log_matches("Feature", skipped, forced)
+        self._matcher.clear()
         if to_upsert:
             self._gateway.create_or_update_features(to_upsert)
 
     def upsert_specs(self, specs: Sequence[SpecificationDTO], force: bool = False) -> None:
         to_upsert: list[SpecificationDTO] = []
+        skipped: list[str] = []
+        forced: list[str] = []
+        self._matcher.prefetch_specs(specs)
         for spec in specs:
             existing = self._matcher.find_existing_spec(spec)
             if existing:
                 if force:
+                    forced.append(spec.code)
                     to_upsert.append(spec)
                 else:
-                    logger.info(f"Skipping Spec {spec.code}")
+                    skipped.append(spec.code)
             else:
                 to_upsert.append(spec)
 
+        _log_matches("Spec", skipped, forced)
+        self._matcher.clear()
         if to_upsert:
             self._gateway.create_or_update_specs(to_upsert)
 
     def upsert_tasks(self, tasks: Sequence[TaskDTO], force: bool = False) -> None:
         to_upsert: list[TaskDTO] = []
+        skipped: list[str] = []
+        forced: list[str] = []
+        self._matcher.prefetch_tasks(tasks)
         for task in tasks:
             existing = self._matcher.find_existing_task(task)
             if existing:
                 if force:
+                    forced.append(task.code)
                     to_upsert.append(task)
                 else:
-                    logger.info(f"Skipping Task {task.code}")
+                    skipped.append(task.code)
             else:
                 to_upsert.append(task)
 
+        _log_matches("Task", skipped, forced)
+        self._matcher.clear()
         if to_upsert:
             self._gateway.create_or_update_tasks(to_upsert)
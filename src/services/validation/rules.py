@@ -5,8 +5,9 @@ Validation rules for the bootstrap process.
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List, Sequence, Set
+from typing import Iterable, List, Optional, Sequence, Set
 
+from src.lib.dependency_graph import TaskGraph
 from src.models.entities import FeatureDTO, ProjectDTO, SpecificationDTO, TaskDTO, TaskDependencyDTO
 from src.services.validation_pipeline import ValidationIssue, Severity
 
@@ -267,50 +268,24 @@ class CircularDependencyRule:
 
     name = "circular_dependency_rule"
 
-    def __init__(self, tasks: Iterable[TaskDTO], dependencies: Iterable[TaskDependencyDTO]):
-        self.tasks = {t.code: t for t in tasks}
-        self.dependencies = list(dependencies)
+    def __init__(
+        self,
+        tasks: Iterable[TaskDTO],
+        dependencies: Iterable[TaskDependencyDTO],
+        graph: Optional[TaskGraph] = None,
+    ):
+        self.graph = graph if graph is not None else TaskGraph.from_tasks(tasks, dependencies)
 
     def run(self) -> Iterable[ValidationIssue]:
-        # Build adjacency list
-        graph: Dict[str, List[str]] = {}
-        for dep in self.dependencies:
-            if dep.task_code not in graph:
-                graph[dep.task_code] = []
-            graph[dep.task_code].append(dep.depends_on)
-
-        visited = set()
-        path = set()
-        
-        def detect_cycle(current_node: str, current_path: List[str]) -> List[str] | None:
-            visited.add(current_node)
-            path.add(current_node)
-            current_path.append(current_node)
-
-            for neighbor in graph.get(current_node, []):
-                if neighbor not in visited:
-                    cycle = detect_cycle(neighbor, current_path)
-                    if cycle:
-                        return cycle
-                elif neighbor in path:
-                     # Cycle detected
-                     return current_path[current_path.index(neighbor):] + [neighbor]
-            
-            path.remove(current_node)
-            current_path.pop()
-            return None
-
-        # Check for cycles
-        for task_code in list(graph.keys()):
-             if task_code not in visited:
-                cycle_nodes = detect_cycle(task_code, [])
-                if cycle_nodes:
-                     cycle_str = " -> ".join(cycle_nodes)
-                     yield ValidationIssue(
-                        severity=Severity.ERROR,
-                        message=f"Circular dependency detected: {cycle_str}",
-                        location=f"Task Cycle starting at {cycle_nodes[0]}"
-                    )
+        for group in self.graph.cycles():
+            message = f"Circular dependency detected: {' -> '.join(group.witness)}"
+            if len(group.members) > len(group.witness) - 1:
+                message += f" ({len(group.members)} tasks in the cycle group: {', '.join(group.members)})"
+            yield ValidationIssue(
+                severity=Severity.ERROR,
+                message=message,
+                location=f"Task Cycle starting at {group.witness[0]}"
+            )
 
 class MalformedDocRule:
     """Checks for general malformation issues (placeholders, missing required fields not caught by parser)."""
@@ -344,40 +319,36 @@ class DependencyStatusRule:
     
     name = "dependency_status_rule"
     
-    def __init__(self, tasks: Iterable[TaskDTO], dependencies: Iterable[TaskDependencyDTO]):
-        # Normalize task map keys to lowercase
-        self.tasks = {t.code.lower(): t for t in tasks}
-        self.dependencies = list(dependencies)
-        
+    def __init__(
+        self,
+        tasks: Iterable[TaskDTO],
+        dependencies: Iterable[TaskDependencyDTO],
+        graph: Optional[TaskGraph] = None,
+    ):
+        self.tasks = list(tasks)
+        self.graph = graph if graph is not None else TaskGraph.from_tasks(self.tasks, dependencies)
+
     def run(self) -> Iterable[ValidationIssue]:
-        # Map task_code -> list of dependency codes
-        dep_map: Dict[str, List[str]] = {}
-        for dep in self.dependencies:
-            # Normalize codes to lowercase
-            t_code = dep.task_code.lower()
-            d_code = dep.depends_on.lower()
-            
-            if t_code not in dep_map:
-                dep_map[t_code] = []
-            dep_map[t_code].append(d_code)
-            
-        for task_code, task in self.tasks.items():
+        # Task per graph node (codes match case-insensitively; the last duplicate wins).
+        by_node: List[Optional[TaskDTO]] = [None] * len(self.graph)
+        for task in self.tasks:
+            node = self.graph.id_of(task.code)
+            if node is not None:
+                by_node[node] = task
+
+        for node, task in enumerate(by_node):
             # We only care if the current task is 'ready' or 'completed'
             # If it's 'pending', it's allowed to wait.
-            if task.status.lower() in ('ready', 'completed'):
-                start_dependencies = dep_map.get(task_code, [])
-                
-                for dependency_code in start_dependencies:
-                    dependency_task = self.tasks.get(dependency_code)
-                    
-                    # If dependency is missing (handled by other rules?), skip
-                    if not dependency_task:
-                        continue
-                        
-                    # If dependency is NOT completed, this task cannot be ready/completed
-                    if dependency_task.status.lower() != 'completed':
-                         yield ValidationIssue(
-                            severity=Severity.ERROR,
-                            message=f"Task '{task.code}' is '{task.status}' but dependency '{dependency_code}' is '{dependency_task.status}'. Dependencies must be 'completed' before successor starts.",
-                            location=f"Task: {task.code}"
-                        )
+            if task is None or task.status.lower() not in ('ready', 'completed'):
+                continue
+
+            for dependency in self.graph.dependencies(node):
+                dependency_task = by_node[dependency]
+
+                # If dependency is NOT completed, this task cannot be ready/completed
+                if dependency_task.status.lower() != 'completed':
+                    yield ValidationIssue(
+                        severity=Severity.ERROR,
+                        message=f"Task '{task.code}' is '{task.status}' but dependency '{dependency_task.code.lower()}' is '{dependency_task.status}'. Dependencies must be 'completed' before successor starts.",
+                        location=f"Task: {task.code}"
+                    )
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, List, Protocol, Sequence
+from typing import Iterable, List, Optional, Protocol, Sequence
+
+from src.lib.stage_timing import StageTimer
 
 
 class Severity(str, Enum):
@@ -62,13 +64,18 @@ class ValidationPipeline:
     Minimal validation pipeline used to sequence rule evaluation.
     """
 
-    def __init__(self, rules: Sequence[ValidationRule]) -> None:
+    def __init__(self, rules: Sequence[ValidationRule], timer: Optional[StageTimer] = None) -> None:
         self._rules = list(rules)
+        self._timer = timer or StageTimer()
 
     def execute(self) -> ValidationResult:
         issues: List[ValidationIssue] = []
         for rule in self._rules:
-            issues.extend(rule.run())
+            # One span per rule; its item count is the number of issues the rule reported.
+            with self._timer.span(f"validate.{type(rule).__name__}") as span:
+                found = list(rule.run())
+                span.items = len(found)
+            issues.extend(found)
         return ValidationResult(issues=issues)
 
 
@@ -5,6 +5,7 @@ import yaml
 import logging
 
 from src.core.config import SpeckitConfig
+from src.lib.parse_cache import cached_yaml_load
 from src.validation.base import ValidationRule, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ class CrossReferenceRule(ValidationRule):
                         if content.startswith('---'):
                             parts = content.split('---', 2)
                             if len(parts) >= 2:
-                                data = yaml.safe_load(parts[1])
+                                data = cached_yaml_load(parts[1], yaml.safe_load)
                                 if isinstance(data, dict):
                                     spec_feature_code = data.get('feature_code')
                                     if spec_feature_code:
@@ -72,7 +73,7 @@ class CrossReferenceRule(ValidationRule):
                     if content.startswith('---'):
                         parts = content.split('---', 2)
                         if len(parts) >= 2:
-                            data = yaml.safe_load(parts[1])
+                            data = cached_yaml_load(parts[1], yaml.safe_load)
                             if isinstance(data, dict) and 'code' in data:
                                 codes.add(data['code'])
             except Exception:
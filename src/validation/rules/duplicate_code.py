@@ -5,6 +5,7 @@ import yaml
 import logging
 
 from src.core.config import SpeckitConfig
+from src.lib.parse_cache import cached_yaml_load
 from src.validation.base import ValidationRule, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -44,7 +45,7 @@ class DuplicateCodeRule(ValidationRule):
                     if content.startswith('---'):
                         parts = content.split('---', 2)
                         if len(parts) >= 2:
-                            data = yaml.safe_load(parts[1])
+                            data = cached_yaml_load(parts[1], yaml.safe_load)
                             if isinstance(data, dict) and key in data:
                                 # Case-insensitive collision detection
                                 code = str(data[key]).lower()
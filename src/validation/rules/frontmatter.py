@@ -5,6 +5,7 @@ import yaml
 import logging
 
 from src.core.config import SpeckitConfig
+from src.lib.parse_cache import cached_yaml_load
 from src.validation.base import ValidationRule, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -61,7 +62,7 @@ class FrontmatterRule(ValidationRule):
                     else:
                         frontmatter_content = parts[1]
                         try:
-                            data = yaml.safe_load(frontmatter_content)
+                            data = cached_yaml_load(frontmatter_content, yaml.safe_load)
                             if not isinstance(data, dict):
                                  errors.append(ValidationError(
                                     code="ERR_INVALID_FRONTMATTER_YAML",
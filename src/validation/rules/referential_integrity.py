@@ -6,6 +6,7 @@ import logging
 import re
 
 from src.core.config import SpeckitConfig
+from src.lib.parse_cache import cached_yaml_load
 from src.validation.base import ValidationRule, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,7 @@ class ReferentialIntegrityRule(ValidationRule):
                 if content.startswith('---'):
                     parts = content.split('---', 2)
                     if len(parts) >= 3:
-                        data = yaml.safe_load(parts[1])
+                        data = cached_yaml_load(parts[1], yaml.safe_load)
                         if isinstance(data, dict) and 'code' in data:
                             feature_codes.add(str(data['code']).lower())
             except Exception:
@@ -62,7 +63,7 @@ class ReferentialIntegrityRule(ValidationRule):
                 if content.startswith('---'):
                     parts = content.split('---', 2)
                     if len(parts) >= 3:
-                        data = yaml.safe_load(parts[1])
+                        data = cached_yaml_load(parts[1], yaml.safe_load)
                         if isinstance(data, dict) and 'feature_code' in data:
                             f_code = str(data['feature_code']).lower()
                             if f_code not in feature_codes:
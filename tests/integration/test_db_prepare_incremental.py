@@ -0,0 +1,209 @@
+"""
+Integration tests for incremental db_prepare runs driven by the source manifest.
+"""
+
+from __future__ import annotations
+
+import errno
+import sqlite3
+from pathlib import Path
+
+from src.cli.commands import db_prepare
+from src.lib.config_loader import BootstrapConfig
+from src.services.bootstrap_options import BootstrapOptions
+from src.services.bootstrap_orchestrator import BootstrapOrchestrator
+from src.services.data_store_gateway import DataStoreGateway
+from tests.fixtures.projects.full_project import create_full_project
+
+
+def _run(project_dir: Path, db_path: Path, **overrides):
+    gateway = DataStoreGateway(db_path)
+    orchestrator = BootstrapOrchestrator(project_dir, gateway)
+    options = BootstrapOptions(incremental=True, **overrides)
+    return orchestrator.run_bootstrap(options)
+
+
+def test_incremental_run_reuses_unchanged_documents(tmp_path: Path):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    db_path = tmp_path / "db.sqlite"
+
+    first = _run(project_dir, db_path)
+    assert first.success, first.error_message
+    assert first.unchanged_file_count == 0
+    assert first.changed_file_count > 0
+
+    second = _run(project_dir, db_path)
+    assert second.success, second.error_message
+    assert second.changed_file_count == 0
+    assert second.unchanged_file_count == first.changed_file_count
+    assert second.task_count == first.task_count
+    assert second.dependency_count == first.dependency_count
+    assert second.task_run_count == 0
+
+
+def test_incremental_run_reparses_only_changed_file(tmp_path: Path):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    db_path = tmp_path / "db.sqlite"
+
+    assert _run(project_dir, db_path).success
+
+    task_file = project_dir / "tasks" / "001-user-auth" / "user-login.md"
+    task_file.write_text(
+        task_file.read_text(encoding="utf-8").replace("# T002: User Login Endpoint", "# T002: Login Endpoint v2"),
+        encoding="utf-8",
+    )
+
+    summary = _run(project_dir, db_path, force=True)
+    assert summary.success, summary.error_message
+    assert summary.changed_file_count == 1
+    assert summary.task_run_count == 1
+
+    with sqlite3.connect(db_path) as conn:
+        title = conn.execute("SELECT title FROM tasks WHERE code = 'T002'").fetchone()[0]
+        manifest_rows = conn.execute("SELECT COUNT(*) FROM source_manifest").fetchone()[0]
+
+    assert title == "T002: Login Endpoint v2"
+    assert manifest_rows == summary.changed_file_count + summary.unchanged_file_count
+
+
+def test_incremental_run_writes_edits_to_existing_entities_without_force(tmp_path: Path):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    db_path = tmp_path / "db.sqlite"
+
+    assert _run(project_dir, db_path).success
+
+    task_file = project_dir / "tasks" / "001-user-auth" / "user-login.md"
+    task_file.write_text(
+        task_file.read_text(encoding="utf-8").replace("# T002: User Login Endpoint", "# T002: Login Endpoint v2"),
+        encoding="utf-8",
+    )
+
+    summary = _run(project_dir, db_path)
+    assert summary.success, summary.error_message
+    assert summary.changed_file_count == 1
+
+    with sqlite3.connect(db_path) as conn:
+        title = conn.execute("SELECT title FROM tasks WHERE code = 'T002'").fetchone()[0]
+    assert title == "T002: Login Endpoint v2"
+
+    # The edit was written, so the next run has nothing left to pick up.
+    assert _run(project_dir, db_path).changed_file_count == 0
+
+
+def test_incremental_run_writes_step_orders_moved_by_a_dependency_edit(tmp_path: Path):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    db_path = tmp_path / "db.sqlite"
+
+    assert _run(project_dir, db_path).success
+
+    dep_file = project_dir / "dependencies" / "task-dependencies.md"
+    dep_file.write_text(
+        dep_file.read_text(encoding="utf-8") + "\n### T003: Data Ingestion Pipeline\nDepends on: T002\n",
+        encoding="utf-8",
+    )
+
+    summary = _run(project_dir, db_path)
+    assert summary.success, summary.error_message
+
+    with sqlite3.connect(db_path) as conn:
+        step_order = conn.execute("SELECT step_order FROM tasks WHERE code = 'T003'").fetchone()[0]
+    assert step_order == 3
+
+
+def test_incremental_touch_without_content_change_is_unchanged(tmp_path: Path):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    db_path = tmp_path / "db.sqlite"
+
+    assert _run(project_dir, db_path).success
+
+    task_file = project_dir / "tasks" / "001-user-auth" / "user-login.md"
+    task_file.write_text(task_file.read_text(encoding="utf-8"), encoding="utf-8")
+
+    summary = _run(project_dir, db_path)
+    assert summary.success, summary.error_message
+    assert summary.changed_file_count == 0
+
+
+def test_long_lived_orchestrator_rehydrates_from_memory(tmp_path: Path, mocker):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    gateway = DataStoreGateway(tmp_path / "db.sqlite")
+    orchestrator = BootstrapOrchestrator(project_dir, gateway)
+    options = BootstrapOptions(incremental=True)
+
+    assert orchestrator.run_bootstrap(options).success
+
+    get_task = mocker.spy(gateway, "get_task")
+    second = orchestrator.run_bootstrap(options)
+
+    assert second.success, second.error_message
+    assert second.changed_file_count == 0
+    assert get_task.call_count == 0
+
+
+def test_incremental_run_rehydrates_with_bulk_reads(tmp_path: Path, mocker):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    db_path = tmp_path / "db.sqlite"
+    assert _run(project_dir, db_path).success
+
+    gateway = DataStoreGateway(db_path)
+    single = [mocker.spy(gateway, name) for name in ("get_feature", "get_spec", "get_task")]
+    bulk = mocker.spy(gateway, "get_tasks_by_codes")
+    summary = BootstrapOrchestrator(project_dir, gateway).run_bootstrap(BootstrapOptions(incremental=True))
+
+    assert summary.success, summary.error_message
+    assert summary.changed_file_count == 0
+    assert [spy.call_count for spy in single] == [0, 0, 0]
+    assert len(bulk.call_args_list[0].args[0]) == summary.task_count
+
+
+def test_watch_persists_edits_and_waits_out_lock_contention(tmp_path: Path, mocker):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    db_path = tmp_path / ".speckit" / "db.sqlite"
+    db_path.parent.mkdir()
+    task_file = project_dir / "tasks" / "001-user-auth" / "user-login.md"
+
+    real_lock = db_prepare.queue_lock
+    attempts = []
+
+    def flaky_lock(*args, **kwargs):
+        attempts.append(1)
+        if len(attempts) == 2:
+            # A plain OSError carrying the errno, rather than the BlockingIOError subclass.
+            exc = OSError("lock is held")
+            exc.errno = errno.EWOULDBLOCK
+            raise exc
+        return real_lock(*args, **kwargs)
+
+    def edit_then_stop(*_args):
+        if len(attempts) == 1:
+            task_file.write_text(
+                task_file.read_text(encoding="utf-8").replace("# T002: User Login Endpoint", "# T002: Login Endpoint v2"),
+                encoding="utf-8",
+            )
+            return {task_file}
+        if len(attempts) == 2:
+            return {task_file}
+        raise KeyboardInterrupt
+
+    mocker.patch.object(db_prepare, "queue_lock", side_effect=flaky_lock)
+    mocker.patch.object(db_prepare, "create_watcher")
+    mocker.patch.object(db_prepare, "wait_for_burst", side_effect=edit_then_stop)
+
+    db_prepare._watch(
+        BootstrapConfig(docs_root=project_dir, storage_path=db_path),
+        BootstrapOptions(incremental=True),
+        debounce_seconds=0,
+    )
+
+    assert len(attempts) == 3
+    with sqlite3.connect(db_path) as conn:
+        title = conn.execute("SELECT title FROM tasks WHERE code = 'T002'").fetchone()[0]
+    assert title == "T002: Login Endpoint v2"
@@ -25,6 +25,7 @@ from src.models.entities import (
     TaskRunDTO,
     AIJobDTO,
 )
+from src.lib.resource_guard import ResourceGuard, ResourceLimits
 from src.services.bootstrap_orchestrator import BootstrapOrchestrator
 from src.services.bootstrap_options import BootstrapOptions
 from src.services.data_store_gateway import DataStoreGateway
@@ -222,6 +223,35 @@ T002 depends on T001
         assert ai_job.job_type == "code-generation"
         assert "Generate user registration code" in ai_job.prompt
 
+    def test_bootstrap_records_stage_spans(self, temp_project_dir, mock_gateway):
+        """Each pipeline stage is timed and counted in the summary, in execution order."""
+        orchestrator = BootstrapOrchestrator(temp_project_dir, mock_gateway)
+
+        result = orchestrator.run_bootstrap(BootstrapOptions(dry_run=False))
+
+        stages = {span.name: span for span in result.stages}
+        names = [span.name for span in result.stages]
+        assert names[:4] == ["discovery", "parse.project", "parse.features", "parse.specs"]
+        assert names.index("step_orders") < names.index("upsert.projects") < names.index("persist")
+        assert "validate.CircularDependencyRule" in stages
+        assert stages["parse.tasks"].items == 1
+        assert stages["parse.tasks"].bytes_read > 0
+        assert stages["upsert.tasks"].items == 1
+        assert stages["task_runs"].items == 1
+        assert all(span.wall_seconds >= 0 and span.cpu_seconds >= 0 for span in result.stages)
+
+    def test_bootstrap_aborts_when_memory_limit_is_exceeded(self, temp_project_dir, mock_gateway):
+        """A breach seen by the resource guard fails the run before anything is persisted."""
+        guard = ResourceGuard(ResourceLimits(max_memory_mb=1))
+        orchestrator = BootstrapOrchestrator(temp_project_dir, mock_gateway, resource_guard=guard)
+
+        with guard.monitor():
+            result = orchestrator.run_bootstrap(BootstrapOptions(dry_run=False))
+
+        assert result.success is False
+        assert "Memory usage exceeded limit" in result.error_message
+        assert mock_gateway.persisted_tasks == []
+
     def test_bootstrap_dry_run_success(self, temp_project_dir, mock_gateway):
         """Test that dry-run mode validates without persisting."""
         orchestrator = BootstrapOrchestrator(temp_project_dir, mock_gateway)
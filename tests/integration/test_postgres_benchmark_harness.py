@@ -0,0 +1,31 @@
+"""
+Runs the PostgreSQL benchmark harness against a throwaway server.
+
+Skipped unless initdb/pg_ctl are installed (or SPECKIT_BENCH_PG_DSN points at a server).
+"""
+import json
+import os
+
+import pytest
+
+from benchmarks import postgres_harness
+
+pytest.importorskip("psycopg2")
+
+
+def test_harness_reports_round_trips_per_entity(tmp_path):
+    if not os.getenv("SPECKIT_BENCH_PG_DSN"):
+        try:
+            postgres_harness.find_pg_bin()
+        except FileNotFoundError as exc:
+            pytest.skip(str(exc))
+
+    output = tmp_path / "pg.json"
+    assert postgres_harness.main(["--sizes", "60", "--workdir", str(tmp_path / "work"), "--output", str(output)]) == 0
+
+    (case,) = json.loads(output.read_text())["results"]
+    tasks = case["initial"]["methods"]["create_or_update_tasks"]
+    assert tasks["rows"] == 60
+    # Set-based upsert: a fixed number of statements per batch, not one per row.
+    assert tasks["round_trips"] < 20
+    assert case["rerun"]["round_trips"]["total"] > 0
@@ -0,0 +1,96 @@
+"""
+Runs the set-based Postgres upserts against a real server, inline and through COPY staging.
+
+Skipped unless SPECKIT_BENCH_PG_DSN points at a server where a scratch database can be created.
+"""
+import contextlib
+import os
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from benchmarks import postgres_harness
+from src.models.entities import FeatureDTO, ProjectDTO, SpecificationDTO, TaskDependencyDTO, TaskDTO
+from src.services import postgres_staging
+from src.services.postgres_gateway import PostgresGateway
+
+
+@pytest.fixture
+def scratch_dsn():
+    admin_dsn = os.getenv("SPECKIT_BENCH_PG_DSN")
+    if not admin_dsn:
+        pytest.skip("SPECKIT_BENCH_PG_DSN is not set")
+    with postgres_harness.scratch_database(admin_dsn) as dsn:
+        yield dsn
+
+
+def _task(code: str, title: str) -> TaskDTO:
+    return TaskDTO(
+        code=code,
+        feature_code="Login",
+        title=title,
+        status="pending",
+        task_type="implementation",
+        acceptance="line one\nline\ttwo",
+        step_order=1,
+        metadata={},
+    )
+
+
+def _write(gateway: PostgresGateway, description: str, tasks: list[TaskDTO], dependencies: list[TaskDependencyDTO]):
+    gateway.create_or_update_projects([ProjectDTO(code="p", name="Proj", description=description)])
+    gateway.create_or_update_features(
+        [FeatureDTO(code="login", project_code="Proj", name="Login", description=description, priority="P2")]
+    )
+    gateway.create_or_update_specs(
+        [SpecificationDTO(code="s", feature_code="Login", title="Login spec", path=f"specs/{description}.md")]
+    )
+    gateway.create_or_update_tasks(tasks)
+    gateway.create_task_dependencies(dependencies)
+
+
+@pytest.mark.parametrize("staging_min_rows", [postgres_staging.STAGING_MIN_ROWS, 1], ids=["inline", "staged"])
+def test_upserts_update_existing_rows_and_insert_only_new_ones(scratch_dsn, monkeypatch, staging_min_rows):
+    monkeypatch.setattr(postgres_staging, "STAGING_MIN_ROWS", staging_min_rows)
+    gateway = PostgresGateway(scratch_dsn)
+    try:
+        _write(
+            gateway,
+            "first",
+            [_task("t1", "Start"), _task("t2", "Next")],
+            [TaskDependencyDTO(task_code="t2", depends_on="t1")],
+        )
+        _write(
+            gateway,
+            "second",
+            [_task("t1", "Start again"), _task("t3", "Last")],
+            # t1 -> t2 already exists: ON CONFLICT skips it instead of failing the batch.
+            [TaskDependencyDTO(task_code="T2", depends_on="T1"), TaskDependencyDTO(task_code="t3", depends_on="t2")],
+        )
+    finally:
+        gateway.close()
+
+    with contextlib.closing(psycopg2.connect(scratch_dsn)) as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT name, description FROM projects")
+        assert cursor.fetchall() == [("Proj", "second")]
+        cursor.execute("SELECT name, description, priority FROM features")
+        assert cursor.fetchall() == [("Login", "second", 2)]
+        cursor.execute("SELECT name, file_path FROM specs")
+        assert cursor.fetchall() == [("Login spec", "specs/second.md")]
+        cursor.execute("SELECT metadata->>'code', name, description FROM tasks ORDER BY 1")
+        assert cursor.fetchall() == [
+            ("t1", "Start again", "line one\nline\ttwo"),
+            ("t2", "Next", "line one\nline\ttwo"),
+            ("t3", "Last", "line one\nline\ttwo"),
+        ]
+        cursor.execute(
+            """
+            SELECT pred.metadata->>'code', succ.metadata->>'code'
+            FROM task_dependencies d
+            JOIN tasks pred ON pred.id = d.predecessor_id
+            JOIN tasks succ ON succ.id = d.successor_id
+            ORDER BY 1
+            """
+        )
+        assert cursor.fetchall() == [("t1", "t2"), ("t2", "t3")]
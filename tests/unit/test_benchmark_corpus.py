@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from benchmarks import bootstrap_scaling
+from benchmarks.corpus import LAYOUTS, CorpusSpec, generate_corpus
+from src.services.bootstrap_options import BootstrapOptions
+from src.services.bootstrap_orchestrator import BootstrapOrchestrator
+from src.services.data_store_gateway import DataStoreGateway
+
+
+def _snapshot(root):
+    return {str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob("*.md"))}
+
+
+def test_corpus_is_deterministic(tmp_path):
+    spec = CorpusSpec(tasks=40, features=4, dependency_density=1.5, seed=7)
+    generate_corpus(tmp_path / "a", spec)
+    generate_corpus(tmp_path / "b", spec)
+
+    assert _snapshot(tmp_path / "a") == _snapshot(tmp_path / "b")
+    generate_corpus(tmp_path / "c", CorpusSpec(tasks=40, features=4, dependency_density=1.5, seed=8))
+    assert _snapshot(tmp_path / "a") != _snapshot(tmp_path / "c")
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_each_layout_bootstraps_with_the_generated_counts(tmp_path, layout):
+    manifest = generate_corpus(
+        tmp_path / "docs", CorpusSpec(tasks=45, features=4, dependency_density=1.5, layout=layout)
+    )
+    gateway = DataStoreGateway(tmp_path / "db.sqlite")
+
+    summary = BootstrapOrchestrator(tmp_path / "docs", gateway).run_bootstrap(BootstrapOptions())
+
+    assert summary.success, summary.error_message
+    assert summary.validation_result.issues == []
+    assert (summary.feature_count, summary.spec_count, summary.task_count) == (4, 4, 45)
+    assert summary.dependency_count == manifest.dependencies > 0
+    assert manifest.files == 1 + 4 + 4 + 45
+
+
+def _result(stages):
+    return {"layout": "flat", "tasks": 1000, "stages": {k: {"seconds": v} for k, v in stages.items()}}
+
+
+def test_compare_flags_slowdowns_beyond_threshold_and_noise_floor():
+    baseline = [_result({"parse": 1.0, "persist": 0.01, "validate": 0.5})]
+    current = [_result({"parse": 1.3, "persist": 0.03, "validate": 0.55})]
+
+    regressions = bootstrap_scaling.compare(current, baseline, threshold=0.2, min_seconds=0.05)
+
+    assert [(r.case, r.stage) for r in regressions] == [("flat/1000", "parse")]
+    assert regressions[0].ratio == pytest.approx(1.3)
+
+
+def test_runner_writes_json_and_fails_on_regression(tmp_path):
+    output = tmp_path / "results.json"
+    args = ["--sizes", "60", "--layouts", "nested", "--output", str(output)]
+
+    assert bootstrap_scaling.main(args) == 0
+    report = json.loads(output.read_text())
+    (case,) = report["results"]
+    assert case["tasks"] == 60
+    assert set(case["stages"]) == set(bootstrap_scaling.STAGE_GROUPS)
+
+    for timing in case["stages"].values():
+        timing["seconds"] /= 100
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report))
+
+    assert bootstrap_scaling.main([*args, "--baseline", str(baseline), "--min-seconds", "0"]) == 1
+    assert json.loads(output.read_text())["regressions"]
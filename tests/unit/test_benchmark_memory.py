@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from benchmarks import bootstrap_memory
+from benchmarks.bootstrap_memory import fit_line
+
+
+def test_fit_line_recovers_per_task_cost_and_budget_ceiling():
+    fit = fit_line([(1000, 30.0), (5000, 50.0), (10000, 75.0)])
+
+    assert fit.slope == pytest.approx(0.005, rel=0.01)
+    assert fit.solve(4096) == pytest.approx((4096 - fit.intercept) / fit.slope)
+    assert fit_line([(1, 5.0), (2, 5.0)]).solve(100) is None
+    with pytest.raises(ValueError):
+        fit_line([(1000, 30.0)])
+
+
+def test_compare_flags_per_task_cost_growth():
+    baseline = {"flat": {"rss_kb_per_task": 4.0, "traced_kb_per_task": 2.0}}
+    current = {"flat": {"rss_kb_per_task": 4.4, "traced_kb_per_task": 2.6}, "nested": {"rss_kb_per_task": 9.0}}
+
+    regressions = bootstrap_memory.compare(current, baseline, threshold=0.15)
+
+    assert [(r.layout, r.field) for r in regressions] == [("flat", "traced_kb_per_task")]
+
+
+def test_runner_reports_peaks_and_fit(tmp_path):
+    output = tmp_path / "memory.json"
+
+    assert bootstrap_memory.main(["--sizes", "40", "120", "--layouts", "legacy", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    small, large = report["results"]
+    assert (small["tasks"], large["tasks"]) == (40, 120)
+    assert large["peak_rss_mb"] >= large["baseline_rss_mb"] > 0
+    assert large["traced_peak_mb"] > small["traced_peak_mb"] > 0
+    assert set(large["stage_peak_rss_mb"]) == {"discovery", "parse", "validate", "step_orders", "persist"}
+    assert report["fits"]["legacy"]["budget_mb"] == bootstrap_memory.DEFAULT_BUDGET_MB
+    assert "traced_kb_per_task" in report["fits"]["legacy"]
@@ -0,0 +1,139 @@
+import re
+
+import pytest
+
+from benchmarks.corpus import CorpusSpec, generate_corpus
+from benchmarks.postgres_harness import (
+    SCHEMA_DDL,
+    CountingCursor,
+    GatewayProbe,
+    RoundTripCounter,
+    counting_connection_factory,
+)
+from src.services.parser.feature_parser import FeatureParser
+from src.services.parser.project_parser import ProjectParser
+from src.services.parser.spec_parser import SpecificationParser
+from src.services.parser.task_parser import TaskParser
+from src.services.postgres_gateway import PostgresGateway
+
+
+class _FakeCursor:
+    def __init__(self, columns=None):
+        self.calls = []
+        self._columns = columns or {}
+        self._last = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        self.calls.append(("execute", sql))
+        self._last = (sql, params)
+
+    def executemany(self, sql, params):
+        self.calls.append(("executemany", len(params)))
+
+    def copy_expert(self, sql, file, size=8192):
+        self.calls.append(("copy", sql))
+
+    def fetchall(self):
+        sql, params = self._last
+        if "information_schema.tables" in sql:
+            return [(table,) for table in self._columns]
+        if "information_schema.columns" in sql:
+            return self._columns.get(params[0], [])
+        return []
+
+    rowcount = 3
+
+
+def test_counting_cursor_counts_statements_and_delegates():
+    counter = RoundTripCounter()
+    fake = _FakeCursor()
+
+    with CountingCursor(fake, counter) as cursor:
+        cursor.execute("SELECT 1")
+        cursor.executemany("INSERT", [(1,), (2,), (3,)])
+        cursor.copy_expert("COPY t FROM STDIN", None, size=1024)
+        assert cursor.rowcount == 3
+
+    assert counter.counts == {"execute": 1, "executemany": 3, "copy": 1}
+    assert counter.total == 5
+    assert [kind for kind, _ in fake.calls] == ["execute", "executemany", "copy"]
+
+
+def test_counting_connection_factory_is_a_psycopg2_connection_class():
+    extensions = pytest.importorskip("psycopg2.extensions")
+
+    factory = counting_connection_factory(RoundTripCounter())
+
+    assert issubclass(factory, extensions.connection)
+
+
+def test_gateway_probe_records_rows_time_and_round_trips():
+    counter = RoundTripCounter()
+
+    class _Gateway:
+        _is_postgres = True
+
+        def create_or_update_tasks(self, tasks):
+            counter.add("copy")
+            counter.add("execute", 4)
+
+    probe = GatewayProbe(_Gateway(), counter)
+    probe.create_or_update_tasks(iter(["t1", "t2"]))
+    probe.create_or_update_tasks(["t3"])
+
+    stats = probe.stats["create_or_update_tasks"].to_dict()
+    assert (stats["calls"], stats["rows"], stats["round_trips"]) == (2, 3, 10)
+    assert stats["round_trips_per_row"] == pytest.approx(10 / 3, abs=0.001)
+    assert probe._is_postgres is True
+
+
+def test_schema_ddl_satisfies_verify_schema(monkeypatch):
+    columns = {}
+    for statement in SCHEMA_DDL:
+        table = re.search(r"CREATE TABLE (\w+)", statement).group(1)
+        columns[table] = [
+            (m.group(1), m.group(2)) for m in re.finditer(r"^\s+(\w+) (uuid|text|integer|jsonb)\b", statement, re.M)
+        ]
+
+    cursor = _FakeCursor(columns)
+
+    class _Conn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def cursor(self, *args, **kwargs):
+            return cursor
+
+    gateway = PostgresGateway("postgresql://example")
+    monkeypatch.setattr(gateway, "_get_connection", lambda: _Conn())
+
+    gateway.verify_schema()
+
+
+@pytest.mark.parametrize("layout", ["flat", "legacy", "nested"])
+def test_postgres_compatible_corpus_uses_names_equal_to_codes(tmp_path, layout):
+    docs = tmp_path / "docs"
+    generate_corpus(docs, CorpusSpec(tasks=12, features=2, layout=layout, postgres_compatible=True))
+    nested = layout == "nested"
+
+    project = ProjectParser(docs / "project.md").parse()
+    features = FeatureParser(docs / "features", project.code).parse()
+    specs = SpecificationParser(docs / "specs", search_recursive=nested).parse()
+    tasks = TaskParser(docs / ("specs" if nested else "tasks"), search_recursive=nested).parse()
+
+    assert project.name == project.code == "bench"
+    assert all(f.name == f.code for f in features)
+    assert all(s.title == s.code for s in specs)
+    assert {t.feature_code for t in tasks} == {f.code for f in features}
+    assert all(t.code == t.code.lower() for t in tasks)
+    deps = [d for t in tasks for d in t.metadata.get("dependencies", [])]
+    assert deps and all(d == d.lower() for d in deps)
@@ -13,8 +13,8 @@ def test_sqlite_retry_success(tmp_path: Path):
     gateway = DataStoreGateway(tmp_path / "db.sqlite")
     project = ProjectDTO(code="P-1", name="Test", description="Desc")
     
-    # Mock sqlite3.connect to raise OperationalError twice then succeed
-    with patch("sqlite3.connect") as mock_connect:
+    # Mock the gateway's connection lookup to raise OperationalError twice then succeed
+    with patch.object(gateway._backend._connections, "get") as mock_connect:
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
@@ -46,7 +46,7 @@ def test_sqlite_retry_failure(tmp_path: Path):
     gateway = DataStoreGateway(tmp_path / "db.sqlite")
     project = ProjectDTO(code="P-1", name="Test", description="Desc")
     
-    with patch("sqlite3.connect") as mock_connect:
+    with patch.object(gateway._backend._connections, "get") as mock_connect:
         mock_connect.side_effect = sqlite3.OperationalError("database is locked")
         
         with pytest.raises(sqlite3.OperationalError, match="database is locked"):
@@ -0,0 +1,117 @@
+from src.lib.dependency_graph import TaskGraph, find_cycles
+from src.models.entities import TaskDTO, TaskDependencyDTO
+from src.services.parser.dependency_parser import DependencyParser
+from src.services.validation.rules import CircularDependencyRule, DependencyStatusRule
+from src.services.validation_pipeline import Severity
+
+
+def test_acyclic_graph_has_no_cycles():
+    assert find_cycles([("C", "B"), ("B", "A"), ("C", "A")]) == []
+
+
+def test_reports_every_cycle_group_with_a_shortest_witness():
+    edges = [
+        ("A", "B"), ("B", "C"), ("C", "D"), ("D", "A"), ("A", "D"),  # one group, shortest cycle A -> D -> A
+        ("X", "Y"), ("Y", "X"),
+        ("S", "S"),
+        ("Z", "A"),  # leads into a cycle but is not part of one
+    ]
+
+    groups = find_cycles(edges)
+
+    assert [g.members for g in groups] == [("A", "B", "C", "D"), ("X", "Y"), ("S",)]
+    assert [g.witness for g in groups] == [("A", "D", "A"), ("X", "Y", "X"), ("S", "S")]
+
+
+def test_deep_chains_do_not_hit_the_recursion_limit():
+    n = 50_000
+    chain = [(f"T{i}", f"T{i + 1}") for i in range(n)]
+
+    assert find_cycles(chain) == []
+    (group,) = find_cycles([*chain, (f"T{n}", "T0")])
+    assert len(group.members) == n + 1
+    assert group.witness[0] == group.witness[-1] == "T0"
+    assert len(group.witness) == n + 2
+
+
+def test_components_come_out_dependencies_first():
+    # A depends on B, B and C depend on each other, C depends on D.
+    graph = TaskGraph.from_edges([("A", "B"), ("B", "C"), ("C", "B"), ("C", "D")])
+
+    components = graph.strongly_connected_components()
+
+    assert [sorted(graph.codes[n] for n in c) for c in components] == [["D"], ["B", "C"], ["A"]]
+
+
+def _task(code, status="pending"):
+    return TaskDTO(code=code, feature_code="F", title=code, status=status, task_type="impl", acceptance="")
+
+
+def test_rule_and_parser_share_the_cycle_report(tmp_path):
+    tasks = [_task(code) for code in ("T1", "T2", "T3", "T8", "T9")]
+    deps = [
+        TaskDependencyDTO(task_code="T1", depends_on="T2"),
+        TaskDependencyDTO(task_code="T2", depends_on="T3"),
+        TaskDependencyDTO(task_code="T3", depends_on="T1"),
+        TaskDependencyDTO(task_code="T3", depends_on="T2"),
+        TaskDependencyDTO(task_code="T8", depends_on="T9"),
+        TaskDependencyDTO(task_code="T9", depends_on="T8"),
+    ]
+
+    issues = list(CircularDependencyRule(tasks, deps).run())
+
+    assert [i.severity for i in issues] == [Severity.ERROR, Severity.ERROR]
+    assert issues[0].message == "Circular dependency detected: T1 -> T2 -> T3 -> T1"
+    assert issues[1].message == "Circular dependency detected: T8 -> T9 -> T8"
+    assert DependencyParser(tmp_path).detect_circular_dependencies(deps) == [
+        ["T1", "T2", "T3", "T1"],
+        ["T8", "T9", "T8"],
+    ]
+
+
+def test_rule_lists_the_whole_group_when_the_witness_is_shorter():
+    deps = [TaskDependencyDTO(task_code=a, depends_on=b) for a, b in [("A", "B"), ("B", "A"), ("B", "C"), ("C", "A")]]
+
+    (issue,) = CircularDependencyRule([_task(c) for c in "ABC"], deps).run()
+
+    assert issue.message == "Circular dependency detected: A -> B -> A (3 tasks in the cycle group: A, B, C)"
+    assert issue.location == "Task Cycle starting at A"
+
+
+def test_task_graph_matches_codes_case_insensitively_and_drops_unknown_edges():
+    tasks = [_task("T1"), _task("t2"), _task("T3")]
+    deps = [
+        TaskDependencyDTO(task_code="T2", depends_on="T1"),
+        TaskDependencyDTO(task_code="t2", depends_on="t1"),  # duplicate once normalized
+        TaskDependencyDTO(task_code="T3", depends_on="T2"),
+        TaskDependencyDTO(task_code="T3", depends_on="T999"),
+    ]
+
+    graph = TaskGraph.from_tasks(tasks, deps)
+
+    assert len(graph) == 3 and graph.edge_count == 2
+    t1, t2, t3 = (graph.id_of(code) for code in ("t1", "T2", "t3"))
+    assert graph.codes[t2] == "t2"
+    assert list(graph.dependencies(t3)) == [t2] and list(graph.dependents(t1)) == [t2]
+    assert [graph.in_degree(n) for n in (t1, t2, t3)] == [0, 1, 1]
+    assert list(graph.topological_order()) == [t1, t2, t3]
+    assert list(graph.levels()) == [1, 2, 3]
+    assert graph.ancestors(t3) == {t1, t2} and graph.descendants(t1) == {t2, t3}
+    assert graph.id_of("T999") is None
+
+
+def test_topological_order_leaves_out_cycles_and_their_dependents():
+    graph = TaskGraph.from_edges([("B", "A"), ("C", "B"), ("B", "C"), ("D", "C"), ("E", "A")])
+
+    assert [graph.codes[n] for n in graph.topological_order()] == ["A", "E"]
+
+
+def test_dependency_status_rule_uses_the_shared_graph():
+    tasks = [_task("T1", "pending"), _task("T2", "completed"), _task("T3", "ready")]
+    deps = [TaskDependencyDTO(task_code="T2", depends_on="t1"), TaskDependencyDTO(task_code="T3", depends_on="T2")]
+    graph = TaskGraph.from_tasks(tasks, deps)
+
+    issues = list(DependencyStatusRule(tasks, [], graph).run())
+
+    assert [i.location for i in issues] == ["Task: T2"]
+    assert "dependency 't1' is 'pending'" in issues[0].message
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.services.doc_discovery import DocumentationDiscoveryService
+
+
+def _write(path: Path, text: str = "# Doc\n") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _names(files) -> list[str]:
+    return [f.path.name for f in files]
+
+
+def test_build_index_flat_layout(tmp_path):
+    _write(tmp_path / "project.md")
+    _write(tmp_path / "features" / "login.md")
+    _write(tmp_path / "features" / "nested" / "ignored.md")
+    _write(tmp_path / "specs" / "top.md")
+    _write(tmp_path / "specs" / "001-login" / "spec.md")
+    _write(tmp_path / "specs" / "drafts" / "ignored.md")
+    _write(tmp_path / "tasks" / "001-login" / "t001.md")
+    _write(tmp_path / "tasks" / "001-login" / "notes.txt")
+    _write(tmp_path / "dependencies" / "deps.md")
+    _write(tmp_path / "dependencies" / "01" / "more.md")
+    _write(tmp_path / "dependencies" / "01-x" / "ignored.md")
+
+    service = DocumentationDiscoveryService(tmp_path)
+    docs = service.verify_structure()
+    index = service.build_index(docs)
+
+    assert index.project is not None and index.project.path.name == "project.md"
+    assert _names(index.features) == ["login.md"]
+    assert _names(index.specs) == ["top.md", "spec.md"]
+    assert _names(index.tasks) == ["t001.md"]
+    assert _names(index.dependencies) == ["deps.md", "more.md"]
+    assert index.total_bytes == sum(f.size for f in index.all_files())
+    assert all(f.mtime_ns > 0 for f in index.all_files())
+
+
+def test_build_index_nested_layout_walks_specs_once(tmp_path, monkeypatch):
+    _write(tmp_path / "project.md")
+    _write(tmp_path / "features" / "login.md")
+    _write(tmp_path / "specs" / "001-login" / "spec.md")
+    _write(tmp_path / "specs" / "001-login" / "specs" / "api.md")
+    _write(tmp_path / "specs" / "001-login" / "tasks" / "t001.md")
+    _write(tmp_path / "specs" / "001-login" / "dependencies" / "deps.md")
+    _write(tmp_path / "specs" / "001-login" / "plan.md")
+
+    import src.services.doc_discovery as discovery
+
+    scanned: list[str] = []
+    real_scandir = discovery.os.scandir
+
+    def _counting_scandir(path):
+        scanned.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(discovery.os, "scandir", _counting_scandir)
+
+    service = DocumentationDiscoveryService(tmp_path)
+    docs = service.verify_structure()
+    assert docs.is_nested
+    index = service.build_index(docs)
+
+    assert _names(index.specs) == ["spec.md", "api.md"]
+    assert _names(index.tasks) == ["t001.md"]
+    assert _names(index.dependencies) == ["deps.md"]
+    assert len(scanned) == len(set(scanned))
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.services.doc_watcher import InotifyWatcher, PollingWatcher, wait_for_burst
+
+
+def _touch(path, text="# Doc\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _inotify_or_skip(root):
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError) as exc:
+        pytest.skip(f"inotify unavailable: {exc}")
+
+
+def test_polling_watcher_reports_created_modified_and_deleted_files(tmp_path):
+    keep = tmp_path / "features" / "login.md"
+    gone = tmp_path / "features" / "old.md"
+    _touch(keep)
+    _touch(gone)
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+
+    keep.write_text("# Login v2, longer\n", encoding="utf-8")
+    gone.unlink()
+    _touch(tmp_path / "tasks" / "001-login" / "t001.md")
+    _touch(tmp_path / ".speckit" / "db.md")
+    _touch(tmp_path / "features" / "notes.txt")
+
+    changed = watcher.poll(timeout=0.5)
+
+    assert changed == {keep, gone, tmp_path / "tasks" / "001-login" / "t001.md"}
+    assert watcher.poll(timeout=0.05) == set()
+
+
+def test_inotify_watcher_follows_new_directories_and_ignores_hidden(tmp_path):
+    watcher = _inotify_or_skip(tmp_path)
+    try:
+        new_dir = tmp_path / "tasks" / "002-signup"
+        new_dir.mkdir(parents=True)
+        assert wait_for_burst(watcher, quiet_period=0.05, idle_timeout=1.0)
+
+        task_file = new_dir / "t010.md"
+        _touch(task_file)
+        _touch(tmp_path / ".speckit" / "cache.md")
+
+        assert task_file in wait_for_burst(watcher, quiet_period=0.05, idle_timeout=1.0)
+        assert wait_for_burst(watcher, quiet_period=0.05, idle_timeout=0.2) == set()
+    finally:
+        watcher.close()
+
+
+def test_wait_for_burst_coalesces_events_until_quiet(tmp_path):
+    watcher = _inotify_or_skip(tmp_path)
+    paths = [tmp_path / f"f{i}.md" for i in range(5)]
+
+    def writer():
+        for path in paths:
+            _touch(path)
+            time.sleep(0.02)
+
+    thread = threading.Thread(target=writer)
+    try:
+        thread.start()
+        changed = wait_for_burst(watcher, quiet_period=0.2, idle_timeout=2.0)
+    finally:
+        thread.join()
+        watcher.close()
+
+    assert changed == set(paths)
+
+
+def test_wait_for_burst_returns_empty_after_idle_timeout(tmp_path):
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+
+    started = time.monotonic()
+    assert wait_for_burst(watcher, quiet_period=0.01, idle_timeout=0.05) == set()
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+
+from src.models.entities import FeatureDTO, ProjectDTO, TaskDTO
+from src.services.bootstrap_options import BootstrapOptions
+from src.services.bootstrap_orchestrator import BootstrapOrchestrator
+from src.services.matchers.entity_matcher import EntityMatcher
+from src.services.sqlite_gateway import SqliteGateway
+from src.services.upsert_service import UpsertService
+from tests.fixtures.projects.full_project import create_full_project
+
+
+def _task(code: str, title: str = "Task") -> TaskDTO:
+    return TaskDTO(
+        code=code,
+        feature_code="F01",
+        title=title,
+        status="pending",
+        task_type="backend",
+        acceptance="criteria",
+        metadata={},
+    )
+
+
+def _seed(gateway: SqliteGateway, codes: list[str]) -> None:
+    gateway.create_or_update_projects([ProjectDTO(code="P01", name="Proj", description="", repository_path=None)])
+    gateway.create_or_update_features(
+        [FeatureDTO(code="F01", project_code="P01", name="Feat", description="", priority="P1")]
+    )
+    gateway.create_or_update_tasks([_task(code) for code in codes])
+
+
+def test_get_tasks_by_codes_chunks_large_lookups(tmp_path):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    codes = [f"T{i:04d}" for i in range(1200)]
+    _seed(gateway, codes)
+
+    found = gateway.get_tasks_by_codes(codes + ["missing", "T0001", ""])
+
+    assert set(found) == set(codes)
+    assert found["T0042"] == gateway.get_task("T0042")
+
+
+def test_upsert_prefetches_tasks_with_one_bulk_query(tmp_path, mocker):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    _seed(gateway, ["T1", "T2"])
+    bulk = mocker.spy(gateway, "get_tasks_by_codes")
+    single = mocker.spy(gateway, "get_task")
+    write = mocker.spy(gateway, "create_or_update_tasks")
+
+    UpsertService(EntityMatcher(gateway), gateway).upsert_tasks([_task("T1", "Changed"), _task("T3")])
+
+    assert bulk.call_count == 1
+    assert single.call_count == 0
+    written = write.call_args.args[0]
+    assert [t.code for t in written] == ["T3"]
+    assert gateway.get_task("T1").title == "Task"
+
+
+def test_upsert_logs_one_summary_line_per_outcome(tmp_path, caplog):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    codes = [f"T{i:03d}" for i in range(50)]
+    _seed(gateway, codes)
+
+    with caplog.at_level(logging.DEBUG, logger="src.services.upsert_service"):
+        UpsertService(EntityMatcher(gateway), gateway).upsert_tasks([_task(code) for code in codes])
+
+    info = [r for r in caplog.records if r.levelno == logging.INFO]
+    debug = [r for r in caplog.records if r.levelno == logging.DEBUG]
+    assert [r.getMessage() for r in info] == ["Skipping existing 50 Task(s)"]
+    assert info[0].count == 50
+    assert len(debug) == 1
+    assert debug[0].getMessage().endswith("first 10 of 50: " + ", ".join(codes[:10]))
+
+
+def test_find_existing_falls_back_after_clear(tmp_path, mocker):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    _seed(gateway, ["T1"])
+    matcher = EntityMatcher(gateway)
+    matcher.prefetch_tasks([_task("T2")])
+    gateway.create_or_update_tasks([_task("T2")])
+    single = mocker.spy(gateway, "get_task")
+
+    assert matcher.find_existing_task(_task("T2")) is None
+    matcher.clear()
+    assert matcher.find_existing_task(_task("T2")).code == "T2"
+    assert single.call_count == 1
+
+
+def test_bootstrap_rerun_does_not_query_tasks_one_by_one(tmp_path, mocker):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    orchestrator = BootstrapOrchestrator(project_dir, gateway)
+    assert orchestrator.run_bootstrap(BootstrapOptions()).success
+
+    single = mocker.spy(gateway, "get_task")
+    bulk = mocker.spy(gateway, "get_tasks_by_codes")
+    summary = orchestrator.run_bootstrap(BootstrapOptions())
+
+    assert summary.success, summary.error_message
+    assert single.call_count == 0
+    assert bulk.call_count == 1
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import pytest
+
+from src.models.entities import FeatureDTO, ProjectDTO, TaskDependencyDTO, TaskDTO
+from src.services.postgres_gateway import PostgresGateway
+from src.services.sqlite_gateway import SqliteGateway
+
+
+def _task(code: str, feature_code: str, status: str = "pending") -> TaskDTO:
+    return TaskDTO(
+        code=code,
+        feature_code=feature_code,
+        title=f"Task {code}",
+        status=status,
+        task_type="backend",
+        acceptance="",
+        step_order=None,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    gateway.create_or_update_projects([ProjectDTO(code="P01", name="Proj", description="", repository_path=None)])
+    gateway.create_or_update_features(
+        [
+            FeatureDTO(code="F02", project_code="P01", name="Second", description="", priority="P2"),
+            FeatureDTO(code="F01", project_code="P01", name="First", description="", priority="P1"),
+        ]
+    )
+    tasks = [_task(f"T{i:03d}", "F01" if i % 2 else "F02", "done" if i % 3 == 0 else "pending") for i in range(25)]
+    gateway.create_or_update_tasks(tasks)
+    gateway.create_task_dependencies([TaskDependencyDTO(task_code="T002", depends_on="T001")])
+    yield gateway
+    gateway.close()
+
+
+class _RecordingCursor:
+    def __init__(self, cursor, fetch_sizes: list[int]) -> None:
+        self._cursor = cursor
+        self._fetch_sizes = fetch_sizes
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._cursor, name, value)
+
+    def fetchmany(self, size):
+        self._fetch_sizes.append(size)
+        return self._cursor.fetchmany(size)
+
+
+class _RecordingConnection:
+    def __init__(self, conn, fetch_sizes: list[int]) -> None:
+        self._conn = conn
+        self._fetch_sizes = fetch_sizes
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._conn.__exit__(exc_type, exc, tb)
+
+    def cursor(self):
+        return _RecordingCursor(self._conn.cursor(), self._fetch_sizes)
+
+
+def test_iter_tasks_streams_in_fetchmany_batches(gateway, mocker):
+    fetch_sizes: list[int] = []
+    conn = _RecordingConnection(gateway._connections.get(), fetch_sizes)
+    mocker.patch.object(gateway._connections, "get", return_value=conn)
+
+    stream = gateway.iter_tasks(batch_size=10)
+    first = next(stream)
+    assert first.code == "T000"
+    assert fetch_sizes == [10]
+
+    codes = [first.code] + [t.code for t in stream]
+    assert codes == sorted(f"T{i:03d}" for i in range(25))
+    assert fetch_sizes == [10, 10, 10, 10]
+
+
+def test_iter_tasks_filters_by_feature_and_status(gateway):
+    tasks = list(gateway.iter_tasks(feature_code="F01", status="done", batch_size=2))
+
+    assert [t.code for t in tasks] == ["T003", "T009", "T015", "T021"]
+    assert all(t.feature_code == "F01" and t.status == "done" for t in tasks)
+
+
+def test_iter_features_and_dependencies(gateway):
+    assert [f.code for f in gateway.iter_features()] == ["F01", "F02"]
+    assert [f.code for f in gateway.iter_features(project_code="missing")] == []
+    assert list(gateway.iter_dependencies()) == [TaskDependencyDTO(task_code="T002", depends_on="T001")]
+
+
+def test_iter_tasks_rejects_non_positive_batch_size(gateway):
+    with pytest.raises(ValueError, match="batch_size"):
+        list(gateway.iter_tasks(batch_size=0))
+
+
+class _NamedCursor:
+    def __init__(self, rows, name) -> None:
+        self.name = name
+        self.itersize = None
+        self.executed: list[tuple[str, object]] = []
+        self.fetch_sizes: list[int] = []
+        self._rows = list(rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+
+class _Conn:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+        self.cursors: list[_NamedCursor] = []
+
+    def cursor(self, name=None, cursor_factory=None):
+        cursor = _NamedCursor(self._rows, name)
+        self.cursors.append(cursor)
+        return cursor
+
+
+def test_postgres_iter_tasks_uses_named_server_side_cursor():
+    pytest.importorskip("psycopg2")
+    rows = [
+        {"task_code": f"T{i}", "feature_name": "F01", "name": f"Task {i}", "status": "pending", "metadata": {}}
+        for i in range(5)
+    ]
+    conn = _Conn(rows)
+    gateway = PostgresGateway("postgresql://example")
+    gateway._active_conn = conn
+
+    tasks = list(gateway.iter_tasks(feature_code="F01", batch_size=2))
+
+    [cursor] = conn.cursors
+    assert cursor.name.startswith("speckit_iter_tasks_")
+    assert cursor.itersize == 2
+    assert cursor.fetch_sizes == [2, 2, 2, 2]
+    sql, params = cursor.executed[0]
+    assert "f.name = %s" in sql and params == ["F01"]
+    assert [t.code for t in tasks] == [f"T{i}" for i in range(5)]
@@ -0,0 +1,44 @@
+import json
+import logging
+import threading
+
+from src.lib import logging as speckit_logging
+from src.lib.logging import JsonFormatter, configure_logging, shutdown_logging
+
+
+def test_json_formatter_emits_only_user_extras():
+    record = logging.LogRecord("speckit", logging.INFO, __file__, 1, "Bootstrapped %d tasks", (3,), None)
+    record.tasks = 3
+    record.message = "set by another formatter"
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Bootstrapped 3 tasks"
+    assert payload["extras"] == {"tasks": 3}
+
+
+def test_queued_logging_writes_from_listener_thread(capsys):
+    writers: list[str] = []
+
+    class _RecordingFilter(logging.Filter):
+        def filter(self, record: logging.LogRecord) -> bool:
+            writers.append(threading.current_thread().name)
+            return True
+
+    configure_logging(fmt="json", queued=True)
+    try:
+        speckit_logging._listener.handlers[0].addFilter(_RecordingFilter())
+        logging.getLogger("speckit.test").info("Queued line", extra={"count": 2})
+    finally:
+        shutdown_logging()
+
+    line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert line["message"] == "Queued line"
+    assert line["extras"] == {"count": 2}
+    assert writers and threading.main_thread().name not in writers
+    assert speckit_logging._listener is None
+
+    # After shutdown the root logger writes synchronously again.
+    logging.getLogger("speckit.test").info("After shutdown")
+    assert "After shutdown" in capsys.readouterr().out
+    configure_logging()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from src.services.parser.markdown_document import tokenize_markdown
+from src.services.parser.task_parser import TaskParser
+
+TASK_DOC = """---
+
+code: T010
+status: done
+---
+# T010: Wire the login form
+
+Owner: web
+
+## Acceptance Criteria
+- Form posts credentials
+  - Errors are shown inline
+
+Depends on: T001, T002
+
+## Notes
+Not part of the criteria.
+"""
+
+
+def test_tokenize_records_structure_in_one_pass():
+    doc = tokenize_markdown(TASK_DOC)
+
+    assert doc.frontmatter_text == "code: T010\nstatus: done"
+    assert doc.title == "T010: Wire the login form"
+    assert [(h.level, h.text) for h in doc.headings] == [
+        (1, "T010: Wire the login form"),
+        (2, "Acceptance Criteria"),
+        (2, "Notes"),
+    ]
+    assert doc.key_values["Owner"] == "web"
+    assert doc.first_depends_on() == "T001, T002"
+    assert doc.section_lines("Acceptance Criteria", min_level=2) == [
+        "- Form posts credentials",
+        "- Errors are shown inline",
+    ]
+    assert doc.body_lines()[0] == ""
+    assert "status: done" not in doc.body_lines()
+
+
+def test_depends_on_continues_onto_next_line():
+    doc = tokenize_markdown("# T1\n\nDepends on:\n\n  T2, T3\n")
+
+    assert doc.first_depends_on() == "T2, T3"
+
+
+def test_empty_acceptance_section_does_not_swallow_next_heading(tmp_path):
+    task_file = tmp_path / "t003.md"
+    task_file.write_text("# T003 Task\n\n## Acceptance Criteria\n\n## Notes\n- not criteria\n", encoding="utf-8")
+
+    task = TaskParser(tmp_path)._parse_task_file(task_file)
+
+    assert task.acceptance == ""
+    assert task.code == "T003"
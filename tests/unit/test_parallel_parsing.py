@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from src.services.doc_discovery import IndexedFile, scan_documents
+from src.services.parser.parallel import chunk_by_size, parse_files
+from src.services.parser.task_parser import TaskParser
+
+
+@pytest.fixture
+def tasks_dir(tmp_path):
+    tasks = tmp_path / "tasks"
+    feature_dir = tasks / "001-user-auth"
+    feature_dir.mkdir(parents=True)
+    for i in range(24):
+        (feature_dir / f"t{i:03d}.md").write_text(
+            f"# T{i:03d} Task {i}\n\n## Acceptance Criteria\n- Works {i}\n\nDepends on: T{max(i - 1, 0):03d}\n" + "x" * i * 50,
+            encoding="utf-8",
+        )
+    return tasks
+
+
+def test_chunk_by_size_is_contiguous_and_balanced(tmp_path):
+    files = [IndexedFile(path=tmp_path / f"{i}.md", size=size, mtime_ns=0) for i, size in enumerate([10, 10, 10, 70, 50, 50])]
+    chunks = chunk_by_size(files, 3)
+
+    assert [f for chunk in chunks for f in chunk] == files
+    assert len(chunks) <= 3
+    assert all(chunk for chunk in chunks)
+
+
+def test_parallel_parse_matches_sequential_order(tasks_dir):
+    parser = TaskParser(tasks_dir)
+    files = scan_documents(tasks_dir, "tasks")
+
+    sequential = parser.parse()
+    parallel = parse_files(parser, files, jobs=3, min_files=1)
+
+    assert [t.code for t in parallel] == [t.code for t in sequential]
+    assert parallel == sequential
+
+
+def test_parallel_parse_raises_first_error_in_file_order(tasks_dir):
+    feature_dir = tasks_dir / "001-user-auth"
+    (feature_dir / "t005.md").write_bytes(b"# T005\n\xff\xfe broken")
+    (feature_dir / "t020.md").write_bytes(b"# T020\n\xff\xfe broken")
+
+    parser = TaskParser(tasks_dir)
+    files = scan_documents(tasks_dir, "tasks")
+
+    with pytest.raises(ValueError, match="t005.md"):
+        parse_files(parser, files, jobs=4, min_files=1)
@@ -0,0 +1,27 @@
+import json
+
+from typer.testing import CliRunner
+
+from src.cli import app
+
+
+def test_parallelize_groups_tasks_by_their_own_dependency_lists(tmp_path):
+    tasks_file = tmp_path / "tasks.json"
+    tasks = [
+        {"code": "A"},
+        {"code": "B", "metadata": {"dependencies": ["A"]}},
+        {"code": "C", "metadata": {"dependencies": ["A"]}},
+        {"code": "D", "metadata": {"dependencies": ["A", "A"]}},
+        {"code": "D", "metadata": {"dependencies": ["X"]}},
+        {"code": "E"},
+    ]
+    tasks_file.write_text(json.dumps(tasks), encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["parallelize", str(tasks_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "Parallel Group (deps: none): A, E" in result.output
+    assert "Parallel Group (deps: A): B, C" in result.output
+    assert "Identified 2 parallel groups." in result.output
+    written = json.loads(tasks_file.read_text(encoding="utf-8"))
+    assert [t.get("metadata", {}).get("parallel_group") for t in written] == ["none", "A", "A", None, None, "none"]
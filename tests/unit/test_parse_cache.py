@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import yaml
+
+from src.lib.parse_cache import ParseCache, activate_parse_cache, cached_yaml_load
+from src.parsing.base_parser import MarkdownParser
+from src.services.parser.spec_parser import SpecificationParser
+
+SPEC_DOC = """---
+code: login-spec
+feature_code: login
+created: 2024-05-01
+tags: [auth, web]
+---
+# Login Spec
+"""
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, text: str):
+        self.calls += 1
+        return yaml.safe_load(text)
+
+
+def test_cache_persists_across_instances_and_returns_fresh_copies(tmp_path):
+    load = CountingLoader()
+    text = "code: x\ncreated: 2024-05-01\nitems: [1, 2]\n"
+
+    first = ParseCache(tmp_path)
+    value = first.load_yaml(text, load)
+    value["items"].append(3)
+    first.close()
+
+    second = ParseCache(tmp_path)
+    cached = second.load_yaml(text, load)
+    second.close()
+
+    assert load.calls == 1
+    assert cached == {"code": "x", "created": dt.date(2024, 5, 1), "items": [1, 2]}
+    assert (second.hits, second.misses) == (1, 0)
+
+
+def test_values_that_do_not_round_trip_are_not_cached(tmp_path):
+    load = CountingLoader()
+    cache = ParseCache(tmp_path)
+
+    assert cache.load_yaml("1: one\n", load) == {1: "one"}
+    assert cache.load_yaml("1: one\n", load) == {1: "one"}
+    assert load.calls == 2
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path):
+    cache = ParseCache(tmp_path, max_bytes=600)
+    for i in range(10):
+        cache.load_yaml(f"code: entry-{i}\nbody: {'x' * 40}\n", yaml.safe_load)
+    removed = cache.evict()
+    cache.close()
+
+    assert removed > 0
+    reopened = ParseCache(tmp_path)
+    load = CountingLoader()
+    reopened.load_yaml(f"code: entry-9\nbody: {'x' * 40}\n", load)
+    reopened.load_yaml(f"code: entry-0\nbody: {'x' * 40}\n", load)
+    assert load.calls == 1
+
+
+def test_validate_and_bootstrap_parsers_share_entries(tmp_path):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    spec_file = specs_dir / "login-spec.md"
+    spec_file.write_text(SPEC_DOC, encoding="utf-8")
+
+    with activate_parse_cache(tmp_path / ".speckit" / "cache") as cache:
+        data = MarkdownParser(tmp_path).parse_file(spec_file)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    with activate_parse_cache(tmp_path / ".speckit" / "cache") as cache:
+        spec = SpecificationParser(specs_dir)._parse_spec_file(spec_file)
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    assert data["code"] == spec.code == "login-spec"
+    assert spec.metadata["created"] == dt.date(2024, 5, 1)
+
+
+def test_cached_yaml_load_without_active_cache_calls_loader():
+    load = CountingLoader()
+
+    assert cached_yaml_load("a: 1", load) == {"a": 1}
+    assert load.calls == 1
@@ -0,0 +1,173 @@
+import pytest
+
+from src.models.entities import FeatureDTO, ProjectDTO, TaskDependencyDTO, TaskDTO
+from src.services import postgres_staging
+from src.services.postgres_gateway import TASK_CODE_INDEX, PostgresGateway
+
+
+class _FakeCursor:
+    def __init__(self, parent_counts: dict[str, int]) -> None:
+        self.queries: list[str] = []
+        self.params: list[object] = []
+        self.copies: dict[str, str] = {}
+        self._parent_counts = parent_counts
+        self._last_query = ""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, sql, params=None):
+        self._last_query = " ".join(str(sql).split())
+        self.queries.append(self._last_query)
+        self.params.append(params)
+
+    def copy_expert(self, sql, file, size=8192):
+        table = sql.split()[1]
+        chunks = []
+        while True:
+            chunk = file.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.copies[table] = "".join(chunks)
+
+    def fetchone(self):
+        # _postgres_has_column: tasks.metadata exists
+        return (1,)
+
+    def fetchall(self):
+        if "SELECT DISTINCT" in self._last_query:
+            return list(self._parent_counts.items())
+        return []
+
+
+class _FakeInfo:
+    transaction_status = 0  # psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+class _FakeConn:
+    def __init__(self, cursor: _FakeCursor) -> None:
+        self._cursor = cursor
+        self.commits = 0
+        self.closed = 0
+        self.info = _FakeInfo()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def cursor(self, *args, **kwargs):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        return None
+
+    def close(self):
+        self.closed = 1
+
+
+def _task(code: str, feature: str = "Login") -> TaskDTO:
+    return TaskDTO(
+        code=code,
+        feature_code=feature,
+        title=f"Task {code}",
+        status="pending",
+        task_type="implementation",
+        acceptance="line one\nline\ttwo",
+        step_order=1,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def fake_pg(monkeypatch):
+    psycopg2 = pytest.importorskip("psycopg2")
+
+    import psycopg2.extras
+
+    cursor = _FakeCursor({"Login": 1, "Proj": 1})
+    conn = _FakeConn(cursor)
+    monkeypatch.setattr(psycopg2, "connect", lambda _dsn, **_kwargs: conn)
+
+    def _execute_values(cur, sql, rows, template=None, page_size=100, fetch=False):
+        cur.execute(sql, list(rows))
+        return cur.fetchall() if fetch else None
+
+    monkeypatch.setattr(psycopg2.extras, "execute_values", _execute_values)
+    return cursor, conn
+
+
+def test_tasks_are_copied_and_reconciled_with_constant_round_trips(fake_pg):
+    cursor, conn = fake_pg
+    gateway = PostgresGateway("postgresql://example")
+
+    gateway.create_or_update_tasks([_task(f"T{i}") for i in range(1, 2001)] + [_task("T1")])
+
+    staged = cursor.copies["speckit_stage_tasks"].splitlines()
+    assert len(staged) == 2000
+    assert staged[0].split("\t")[:5] == ["T1", "Login", "Task T1", "pending", "line one\\nline\\ttwo"]
+    assert len(cursor.queries) <= 8
+    assert not any("WHERE metadata->>'code' = %s" in q for q in cursor.queries)
+    assert any(q.startswith("UPDATE tasks AS t") and "FROM speckit_stage_tasks s" in q for q in cursor.queries)
+    assert any(q.startswith("INSERT INTO tasks") and "NOT EXISTS" in q for q in cursor.queries)
+    assert cursor.queries[-1] == "DROP TABLE IF EXISTS speckit_stage_tasks"
+    assert conn.commits >= 1
+
+
+def test_missing_feature_fails_before_reconciling(fake_pg):
+    cursor, _conn = fake_pg
+    gateway = PostgresGateway("postgresql://example")
+
+    with pytest.raises(RuntimeError, match="Feature not found for task code='T9'"):
+        gateway.create_or_update_tasks([_task("T1"), _task("T9", feature="Unknown")])
+    assert not any(q.startswith(("UPDATE tasks", "INSERT INTO tasks")) for q in cursor.queries)
+
+
+def test_small_batches_are_sent_inline_without_a_staging_table(fake_pg):
+    cursor, conn = fake_pg
+    gateway = PostgresGateway("postgresql://example")
+
+    gateway.create_or_update_tasks([_task("T1"), _task("T2")])
+
+    assert cursor.copies == {}
+    assert not any("TEMP TABLE" in q or q.startswith("DROP TABLE") for q in cursor.queries)
+    update = next(i for i, q in enumerate(cursor.queries) if q.startswith("UPDATE tasks AS t"))
+    assert "FROM (VALUES %s) AS s(code, feature_name, name, status, description, metadata, step_order)" in cursor.queries[update]
+    assert [row[0] for row in cursor.params[update]] == ["T1", "T2"]
+    assert any(q.startswith("INSERT INTO tasks") and "NOT EXISTS" in q for q in cursor.queries)
+    assert conn.commits >= 1
+
+
+def test_projects_features_and_dependencies_use_staging_tables(fake_pg, monkeypatch):
+    monkeypatch.setattr(postgres_staging, "STAGING_MIN_ROWS", 1)
+    cursor, _conn = fake_pg
+    gateway = PostgresGateway("postgresql://example")
+
+    gateway.create_or_update_projects([ProjectDTO(code="p", name="Proj", description=None, repository_path=None)])
+    gateway.create_or_update_features(
+        [FeatureDTO(code="login", project_code="Proj", name="Login", description="", priority="P1")]
+    )
+    gateway.create_task_dependencies(
+        [TaskDependencyDTO(task_code="T2", depends_on="T1"), TaskDependencyDTO(task_code="t2", depends_on="t1")]
+    )
+
+    assert cursor.copies["speckit_stage_projects"] == "Proj\t\\N\n"
+    assert cursor.copies["speckit_stage_features"] == "Proj\tLogin\t\t1\n"
+    assert cursor.copies["speckit_stage_dependencies"] == "t1\tt2\n"
+    assert any("ON CONFLICT (predecessor_id, successor_id) DO NOTHING" in q for q in cursor.queries)
+
+
+def test_ensure_indexes_creates_unique_expression_index(fake_pg):
+    cursor, _conn = fake_pg
+    PostgresGateway("postgresql://example").ensure_indexes()
+
+    assert f"CREATE UNIQUE INDEX IF NOT EXISTS {TASK_CODE_INDEX}" in cursor.queries[-1]
+    assert "((metadata->>'code'))" in cursor.queries[-1]
@@ -1,6 +1,10 @@
+import threading
+import time
+
 import pytest
 
 from src.services.postgres_gateway import PostgresGateway
+from src.services.postgres_pool import PostgresConnectionPool, PostgresPoolConfig
 
 
 class _FakeCursor:
@@ -62,9 +66,15 @@ class _FakeCursor:
         return None
 
 
+class _FakeInfo:
+    transaction_status = 0  # psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
 class _FakeConn:
     def __init__(self) -> None:
         self.autocommit = True
+        self.closed = 0
+        self.info = _FakeInfo()
         self._cursor = _FakeCursor()
 
     def __enter__(self):
@@ -82,6 +92,9 @@ class _FakeConn:
     def rollback(self):
         return None
 
+    def close(self):
+        self.closed = 1
+
 
 def test_postgres_reuses_single_connection_in_transaction(monkeypatch):
     psycopg2 = pytest.importorskip("psycopg2")
@@ -105,3 +118,137 @@ def test_postgres_reuses_single_connection_in_transaction(monkeypatch):
         gateway.create_task_dependencies([])
 
     assert len(connect_calls) == 1
+
+
+def _counting_connect(monkeypatch, factory=_FakeConn):
+    psycopg2 = pytest.importorskip("psycopg2")
+    calls: list[tuple[str, dict]] = []
+
+    def _fake_connect(conn_str, **kwargs):
+        calls.append((conn_str, kwargs))
+        return factory()
+
+    monkeypatch.setattr(psycopg2, "connect", _fake_connect)
+    return calls
+
+
+def test_postgres_reads_reuse_pooled_connection(monkeypatch):
+    calls = _counting_connect(monkeypatch)
+    gateway = PostgresGateway("postgresql://example")
+
+    started = time.perf_counter()
+    for i in range(500):
+        gateway.get_task(f"T{i}")
+        gateway.get_feature("F01")
+        gateway.get_spec("F01-spec")
+    elapsed = time.perf_counter() - started
+
+    assert len(calls) == 1
+    assert elapsed < 2.0
+    gateway.close()
+
+
+def test_pool_applies_statement_timeout(monkeypatch):
+    calls = _counting_connect(monkeypatch)
+    gateway = PostgresGateway("postgresql://example", PostgresPoolConfig(statement_timeout_ms=1500))
+
+    gateway.get_project("Proj")
+
+    assert calls == [("postgresql://example", {"options": "-c statement_timeout=1500"})]
+
+
+def test_pool_passes_connection_factory(monkeypatch):
+    calls = _counting_connect(monkeypatch)
+    gateway = PostgresGateway("postgresql://example", PostgresPoolConfig(connection_factory=_FakeConn))
+
+    gateway.get_project("Proj")
+
+    assert calls == [("postgresql://example", {"connection_factory": _FakeConn})]
+
+
+def test_pool_replaces_closed_and_unhealthy_connections(monkeypatch):
+    class _BrokenCursor(_FakeCursor):
+        def execute(self, sql, params=None):
+            if sql == "SELECT 1":
+                raise RuntimeError("server closed the connection unexpectedly")
+            super().execute(sql, params)
+
+    calls = _counting_connect(monkeypatch)
+    pool = PostgresConnectionPool("postgresql://example", PostgresPoolConfig(health_check_interval=0.0))
+
+    with pool.connection() as conn:
+        first = conn
+    first.closed = 2  # dropped by the server while idle
+    with pool.connection() as conn:
+        second = conn
+    second._cursor = _BrokenCursor()
+    with pool.connection() as conn:
+        third = conn
+
+    assert first is not second and second is not third
+    assert len(calls) == 3
+    pool.close()
+
+
+def test_pool_blocks_callers_beyond_max_size(monkeypatch):
+    _counting_connect(monkeypatch)
+    pool = PostgresConnectionPool("postgresql://example", PostgresPoolConfig(max_size=2, acquire_timeout=0.05))
+    release = threading.Event()
+    ready = threading.Barrier(3)
+
+    def _hold():
+        with pool.connection():
+            ready.wait()
+            release.wait(1.0)
+
+    holders = [threading.Thread(target=_hold) for _ in range(2)]
+    for t in holders:
+        t.start()
+    ready.wait()
+    try:
+        with pytest.raises(RuntimeError, match="waiting for a Postgres connection"):
+            with pool.connection():
+                pass
+    finally:
+        release.set()
+        for t in holders:
+            t.join()
+
+    with pool.connection():
+        pass
+    pool.close()
+
+
+def test_pool_updates_last_used_under_its_lock(monkeypatch):
+    _counting_connect(monkeypatch)
+    pool = PostgresConnectionPool(
+        "postgresql://example", PostgresPoolConfig(max_size=4, health_check_interval=0.0)
+    )
+    unlocked: list[str] = []
+
+    class _CheckedDict(dict):
+        def __getattribute__(self, name):
+            if name in {"get", "pop", "clear"} and not pool._lock.locked():
+                unlocked.append(name)
+            return super().__getattribute__(name)
+
+        def __setitem__(self, key, value):
+            if not pool._lock.locked():
+                unlocked.append("__setitem__")
+            super().__setitem__(key, value)
+
+    pool._last_used = _CheckedDict()
+
+    def _work():
+        for _ in range(50):
+            with pool.connection():
+                pass
+
+    workers = [threading.Thread(target=_work) for _ in range(4)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    pool.close()
+
+    assert unlocked == []
@@ -0,0 +1,62 @@
+import pstats
+import time
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from src.cli import app
+from src.lib.profiling import profile_paths, profile_to
+from src.lib.stage_timing import StageTimer
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def test_profile_to_writes_pstats_and_stage_tagged_collapsed_stacks(tmp_path):
+    timer = StageTimer()
+
+    with profile_to(tmp_path / "run", label="db.prepare", interval=0.001) as output:
+        with timer.span("persist"), timer.span("upsert.tasks"):
+            _busy(0.05)
+        _busy(0.02)
+
+    assert output.pstats_path == tmp_path / "run.pstats"
+    functions = {name for _, _, name in pstats.Stats(str(output.pstats_path)).stats}
+    assert "_busy" in functions
+
+    lines = output.collapsed_path.read_text(encoding="utf-8").splitlines()
+    stacks = [line.rsplit(" ", 1) for line in lines]
+    assert all(count.isdigit() for _, count in stacks)
+    assert any(s.startswith("stage:persist;stage:upsert.tasks;thread:MainThread;") and "_busy" in s for s, _ in stacks)
+    assert any(s.startswith("stage:db.prepare;thread:MainThread;") for s, _ in stacks)
+    assert not any("speckit-profiler" in s for s, _ in stacks)
+
+
+def test_profile_is_written_when_the_run_fails(tmp_path):
+    with pytest.raises(RuntimeError):
+        with profile_to(tmp_path / "failed.pstats", label="validate"):
+            raise RuntimeError("boom")
+
+    assert profile_paths(tmp_path / "failed.pstats").collapsed_path == tmp_path / "failed.collapsed"
+    assert (tmp_path / "failed.pstats").exists()
+    assert (tmp_path / "failed.collapsed").exists()
+
+
+def test_db_prepare_profile_flag(tmp_path):
+    def _fake_run(*args, **kwargs):
+        with StageTimer().span("parse.tasks"):
+            _busy(0.03)
+
+    with patch("src.cli.commands.db_prepare._run_bootstrap", side_effect=_fake_run):
+        result = CliRunner().invoke(
+            app, ["db.prepare", "--docs-path", str(tmp_path), "--profile", str(tmp_path / "prof" / "run")]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "Profile written to" in result.output
+    assert (tmp_path / "prof" / "run.pstats").exists()
+    assert "stage:parse.tasks;" in (tmp_path / "prof" / "run.collapsed").read_text(encoding="utf-8")
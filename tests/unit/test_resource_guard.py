@@ -0,0 +1,138 @@
+import multiprocessing
+import time
+
+import pytest
+
+from src.lib import resource_guard
+from src.lib.resource_guard import (
+    ResourceGuard,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    current_rss_mb,
+    process_cpu_seconds,
+)
+from src.lib.stage_timing import StageTimer
+
+
+def test_current_rss_is_reported_in_megabytes():
+    assert 0 < current_rss_mb() < 1024 * 1024
+
+
+def test_stage_spans_record_peak_rss_while_monitored():
+    guard = ResourceGuard(sample_interval=0.01)
+    timer = StageTimer(monitor=guard)
+
+    with guard.monitor():
+        with timer.span("parse.tasks"):
+            ballast = bytearray(32 * 1024 * 1024)
+            ballast[::4096] = b"x" * len(ballast[::4096])  # touch every page so it is resident
+            time.sleep(0.05)  # the fill holds the GIL; give the sampler a few intervals to see it
+            del ballast
+        with timer.span("persist"):
+            pass
+
+    spans = {s.name: s for s in timer.spans}
+    assert spans["parse.tasks"].peak_rss_mb >= spans["persist"].peak_rss_mb
+    assert spans["parse.tasks"].peak_rss_mb - current_rss_mb() > 16
+    assert guard.peak_rss_mb >= spans["parse.tasks"].peak_rss_mb
+
+
+def test_memory_breach_aborts_at_the_next_stage_boundary():
+    guard = ResourceGuard(ResourceLimits(max_memory_mb=1), sample_interval=0.01)
+    timer = StageTimer(monitor=guard)
+
+    with guard.monitor():
+        with pytest.raises(ResourceLimitExceeded, match="Memory usage exceeded limit"):
+            with timer.span("discovery"):
+                pass
+
+    assert timer.spans == ()
+
+
+def test_each_monitored_run_starts_without_a_pending_breach():
+    guard = ResourceGuard(ResourceLimits(max_memory_mb=1))
+    with guard.monitor():
+        pass
+
+    guard._limits = ResourceLimits()
+    with guard.monitor():
+        guard.raise_if_exceeded()
+
+
+def test_file_size_limit_uses_indexed_size():
+    guard = ResourceGuard(ResourceLimits(max_file_mb=1))
+
+    guard.check_file_size("specs/tasks/small.md", 512 * 1024)
+    with pytest.raises(RuntimeError, match="File size exceeded limit.*huge.md"):
+        guard.check_file_size("specs/tasks/huge.md", 2 * 1024 * 1024)
+
+
+def test_trace_allocations_reports_top_sites():
+    guard = ResourceGuard(trace_allocations=3)
+
+    with guard.monitor():
+        kept = [bytes(1024) for _ in range(2000)]
+
+    assert len(guard.top_allocations) == 3
+    assert any("test_resource_guard.py" in site.location for site in guard.top_allocations)
+    assert kept
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_cpu_seconds_include_running_child_processes():
+    before = process_cpu_seconds()
+    child = multiprocessing.get_context("fork").Process(target=_spin, args=(5.0,))
+    child.start()
+    try:
+        time.sleep(0.5)
+        during = process_cpu_seconds()
+    finally:
+        child.terminate()
+        child.join()
+
+    # The parent only slept, so the growth is the (still unreaped) child's CPU time.
+    assert during - before > 0.2
+
+
+def test_worker_budget_is_capped_by_cpu_budget(monkeypatch):
+    monkeypatch.setattr(resource_guard, "usable_cores", lambda: 8)
+    guard = ResourceGuard(ResourceLimits(max_cpu_cores=2.5))
+
+    assert guard.cpu_budget_cores == 2.5
+    assert guard.worker_budget(0) == 2
+    assert guard.worker_budget(16) == 2
+    assert guard.worker_budget(1) == 1
+    assert ResourceGuard().worker_budget(0) == 8
+
+
+def test_cpu_overuse_halves_workers_instead_of_raising(monkeypatch):
+    monkeypatch.setattr(resource_guard, "usable_cores", lambda: 8)
+    guard = ResourceGuard(ResourceLimits(max_cpu_cores=4))
+
+    guard._sample_cpu(6.0)
+    assert guard.worker_budget(0) == 2
+    guard._sample_cpu(3.0)
+    assert guard.worker_budget(0) == 2
+    guard._sample_cpu(9.0)
+    guard._sample_cpu(9.0)
+    assert guard.worker_budget(0) == 1
+    guard._sample_cpu(9.0)
+    assert guard.worker_budget(0) == 1
+    assert guard.peak_cpu_cores == 9.0
+
+    with guard.monitor():
+        assert guard.worker_budget(0) == 4
+
+
+def test_check_cpu_reports_cores_without_raising():
+    guard = ResourceGuard(ResourceLimits(max_cpu_cores=0.5))
+    _spin(0.3)
+
+    cores = guard.check_cpu()
+    assert cores is not None and 0 < cores <= resource_guard.usable_cores() + 0.5
+    guard.enforce_all()
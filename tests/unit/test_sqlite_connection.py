@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.services.bootstrap_options import BootstrapOptions
+from src.services.bootstrap_orchestrator import BootstrapOrchestrator
+from src.services.sqlite_connection import SqliteConnectionManager, resolve_pragma_profile
+from src.services.sqlite_gateway import SqliteGateway
+from tests.fixtures.projects.full_project import create_full_project
+
+
+def test_gateway_reuses_one_connection_for_reads_and_writes(tmp_path, mocker):
+    connect = mocker.spy(sqlite3, "connect")
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+
+    for i in range(200):
+        gateway.get_task(f"T{i}")
+    gateway.verify_schema()
+    with gateway.transaction():
+        gateway.replace_source_manifest([])
+
+    assert connect.call_count == 1
+    assert connect.call_args.kwargs["cached_statements"] >= 128
+
+
+def test_default_profile_is_durable_and_described(tmp_path):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+
+    profile = gateway.describe_storage()
+
+    assert profile["backend"] == "sqlite"
+    assert profile["profile"] == "durable"
+    assert profile["journal_mode"] == "delete"
+    assert profile["synchronous"] == "FULL"
+    with gateway._get_connection() as conn:
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_tuned_profile_and_unknown_profile(tmp_path):
+    gateway = SqliteGateway(tmp_path / "db.sqlite", pragma_profile="tuned")
+    assert gateway.describe_storage()["journal_mode"] == "wal"
+    assert gateway.describe_storage()["synchronous"] == "NORMAL"
+    assert gateway.describe_storage()["temp_store"] == "MEMORY"
+
+    with pytest.raises(ValueError, match="Unknown SQLite pragma profile"):
+        resolve_pragma_profile("turbo")
+
+
+def test_each_thread_gets_its_own_connection_and_close_releases_them(tmp_path):
+    manager = SqliteConnectionManager(tmp_path / "db.sqlite", "tuned")
+    main_conn = manager.get()
+    seen = []
+
+    thread = threading.Thread(target=lambda: seen.append(manager.get()))
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not main_conn
+    assert manager.get() is main_conn
+    manager.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        main_conn.execute("SELECT 1")
+    assert manager.get() is not main_conn
+    manager.close()
+    assert not (tmp_path / "db.sqlite-wal").exists()
+
+
+def test_summary_reports_storage_profile(tmp_path):
+    project_dir = tmp_path / "project"
+    create_full_project(project_dir)
+    gateway = SqliteGateway(tmp_path / "db.sqlite", pragma_profile="fast")
+
+    summary = BootstrapOrchestrator(project_dir, gateway).run_bootstrap(BootstrapOptions())
+
+    assert summary.success, summary.error_message
+    assert summary.storage_profile["profile"] == "fast"
+    assert summary.storage_profile["synchronous"] == "OFF"
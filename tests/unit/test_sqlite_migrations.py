@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from src.services.sqlite_gateway import SqliteGateway
+from src.services.sqlite_migrations import MIGRATIONS, SCHEMA_VERSION
+
+
+def _indexes(db_path) -> set[str]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'").fetchall()
+    return {row[0] for row in rows}
+
+
+def _user_version(db_path) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def test_new_store_is_created_at_current_version_with_indexes(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    SqliteGateway(db_path).close()
+
+    assert _user_version(db_path) == SCHEMA_VERSION
+    assert {
+        "idx_features_project_code",
+        "idx_specs_feature_code",
+        "idx_tasks_feature_code",
+        "idx_tasks_status",
+        "idx_task_dependencies_depends_on",
+    } <= _indexes(db_path)
+
+
+def test_unversioned_store_is_upgraded_in_place(tmp_path):
+    db_path = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        for statement in MIGRATIONS[0].statements:
+            conn.execute(statement)
+        conn.execute("INSERT INTO projects (code, name) VALUES ('P01', 'Legacy')")
+
+    gateway = SqliteGateway(db_path)
+
+    assert gateway.get_project("P01").name == "Legacy"
+    assert gateway.describe_storage()["schema_version"] == str(SCHEMA_VERSION)
+    with gateway._get_connection() as conn:
+        plan = conn.execute("EXPLAIN QUERY PLAN SELECT task_code FROM task_dependencies WHERE depends_on = ?", ("T1",))
+        assert "idx_task_dependencies_depends_on" in " ".join(str(row) for row in plan.fetchall())
+
+
+def test_drifted_store_stays_unversioned(tmp_path):
+    db_path = tmp_path / "drift.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE projects (code TEXT PRIMARY KEY, name TEXT, description TEXT)")
+
+    gateway = SqliteGateway(db_path)
+
+    assert _user_version(db_path) == 0
+    with pytest.raises(Exception, match="Schema drift detected: Table 'projects' missing columns"):
+        gateway.verify_schema()
+
+
+def test_verify_schema_at_current_version_is_a_single_pragma(tmp_path):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    statements: list[str] = []
+    with gateway._get_connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            gateway.verify_schema()
+        finally:
+            conn.set_trace_callback(None)
+
+    assert statements == ["PRAGMA user_version"]
+
+
+def test_store_from_a_newer_release_is_rejected(tmp_path):
+    db_path = tmp_path / "future.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+    with pytest.raises(RuntimeError, match="newer than this release supports"):
+        SqliteGateway(db_path)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import replace
+
+import pytest
+from typer.testing import CliRunner
+
+from src.cli import app
+from src.models.entities import FeatureDTO, ProjectDTO, SpecificationDTO, TaskDTO
+from src.services import sqlite_migrations
+from src.services.parser.spec_parser import SpecificationParser
+from src.services.sqlite_gateway import SqliteGateway
+
+pytestmark = pytest.mark.skipif(
+    not sqlite3.connect(":memory:").execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0],
+    reason="SQLite built without FTS5",
+)
+
+
+def _task(code: str, title: str, acceptance: str = "") -> TaskDTO:
+    return TaskDTO(
+        code=code,
+        feature_code="F01",
+        title=title,
+        status="pending",
+        task_type="backend",
+        acceptance=acceptance,
+        step_order=None,
+    )
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    gateway.create_or_update_projects([ProjectDTO(code="P01", name="Proj", description="")])
+    gateway.create_or_update_features(
+        [FeatureDTO(code="F01", project_code="P01", name="Authentication", description="OAuth login", priority="P1")]
+    )
+    gateway.create_or_update_specs(
+        [
+            SpecificationDTO(
+                code="f01-spec",
+                feature_code="F01",
+                title="Auth spec",
+                path="specs/f01.md",
+                body="# Auth\nRefresh tokens are rotated by the /oauth/token endpoint.",
+            )
+        ]
+    )
+    gateway.create_or_update_tasks(
+        [_task("T-001", "Implement token refresh", "Tokens rotate"), _task("T-002", "Add audit log", "Events stored")]
+    )
+    yield gateway
+    gateway.close()
+
+
+def test_search_ranks_hits_across_entity_types(gateway):
+    hits = gateway.search("token*")
+
+    assert {(h.entity_type, h.code) for h in hits} == {("task", "T-001"), ("spec", "f01-spec")}
+    assert hits[0].code == "T-001"  # title matches outrank body matches
+    assert all(h.score > 0 for h in hits)
+    assert "[" in hits[0].snippet
+
+
+def test_search_filters_by_type_and_quotes_punctuation(gateway):
+    assert [h.code for h in gateway.search("token*", entity_type="spec")] == ["f01-spec"]
+    assert [h.code for h in gateway.search("T-002")] == ["T-002"]
+    assert [h.code for h in gateway.search("oauth/token")] == ["f01-spec"]
+    with pytest.raises(ValueError, match="Unknown entity type"):
+        gateway.search("token", entity_type="project")
+    with pytest.raises(ValueError, match="empty"):
+        gateway.search("  ")
+
+
+def test_upserts_keep_the_index_in_sync(gateway):
+    gateway.create_or_update_tasks([_task("T-001", "Implement logout", "Sessions end")])
+
+    assert [h.code for h in gateway.search("refresh", entity_type="task")] == []
+    assert [h.code for h in gateway.search("logout")] == ["T-001"]
+    assert gateway.get_spec("f01-spec").body.startswith("# Auth")
+
+
+def test_rebuild_restores_a_cleared_index(gateway):
+    with gateway._get_connection() as conn:
+        conn.execute("DELETE FROM search_index")
+    assert gateway.search("audit") == []
+
+    gateway.rebuild_search_index()
+
+    assert [h.code for h in gateway.search("audit")] == ["T-002"]
+
+
+def test_index_survives_renumbered_rowids(gateway, tmp_path):
+    gateway.create_or_update_tasks([_task("T-003", "Export invoices", "CSV written")])
+    gateway.close()
+    with sqlite3.connect(tmp_path / "db.sqlite") as conn:
+        conn.execute("DELETE FROM tasks WHERE code = 'T-001'")
+        # What VACUUM may do to tables without an INTEGER PRIMARY KEY.
+        conn.execute("UPDATE tasks SET rowid = rowid - 1")
+
+    reopened = SqliteGateway(tmp_path / "db.sqlite")
+    reopened.create_or_update_tasks([_task("T-002", "Add audit trail", "Events stored")])
+
+    assert [h.code for h in reopened.search("trail")] == ["T-002"]
+    assert [h.code for h in reopened.search("invoices")] == ["T-003"]
+    assert [h.code for h in reopened.search("stored")] == ["T-002"]
+    reopened.close()
+
+
+def test_store_opened_without_fts5_gets_index_later(tmp_path, monkeypatch):
+    without_fts5 = replace(sqlite_migrations.MIGRATIONS[3], requires=lambda conn: False)
+    with monkeypatch.context() as patch:
+        patch.setattr(sqlite_migrations, "MIGRATIONS", (*sqlite_migrations.MIGRATIONS[:3], without_fts5))
+        old = SqliteGateway(tmp_path / "db.sqlite")
+        old.create_or_update_projects([ProjectDTO(code="P01", name="Proj", description="")])
+        old.create_or_update_features(
+            [FeatureDTO(code="F01", project_code="P01", name="Authentication", description="", priority="P1")]
+        )
+        old.create_or_update_tasks([_task("T-001", "Implement token refresh")])
+        assert old.describe_storage()["schema_version"] == "3"
+        old.close()
+
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+
+    assert gateway.describe_storage()["schema_version"] == str(sqlite_migrations.SCHEMA_VERSION)
+    assert [h.code for h in gateway.search("refresh")] == ["T-001"]
+    assert [h.code for h in gateway.search("authentication")] == ["F01"]
+    gateway.close()
+
+
+def test_spec_frontmatter_is_not_indexed(gateway, tmp_path):
+    spec_dir = tmp_path / "specs" / "001-f01"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text(
+        "---\nfeature_code: auth\nstatus: draft\n---\n# Session spec\n\nSessions expire after idle time.\n",
+        encoding="utf-8",
+    )
+    (spec,) = SpecificationParser(tmp_path / "specs").parse()
+    gateway.create_or_update_features(
+        [FeatureDTO(code="auth", project_code="P01", name="Sessions", description="", priority="P1")]
+    )
+    gateway.create_or_update_specs([spec])
+
+    assert spec.body.strip().startswith("# Session spec")
+    assert gateway.search("feature_code") == []
+    assert gateway.search("draft") == []
+    assert [h.code for h in gateway.search("idle")] == [spec.code]
+
+
+def test_search_command_prints_json_hits(gateway, tmp_path):
+    result = CliRunner().invoke(
+        app, ["search", "refresh", "--type", "task", "--json", "--storage-path", str(tmp_path / "db.sqlite")]
+    )
+
+    assert result.exit_code == 0, result.output
+    hits = json.loads(result.output)
+    assert [(h["entity_type"], h["code"]) for h in hits] == [("task", "T-001")]
+
+
+def test_search_command_rejects_unknown_type(tmp_path):
+    result = CliRunner().invoke(app, ["search", "x", "--type", "bogus", "--storage-path", str(tmp_path / "db.sqlite")])
+
+    assert result.exit_code == 2
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from src.models.entities import FeatureDTO, ProjectDTO, TaskDependencyDTO, TaskDTO
+from src.services.sqlite_gateway import SqliteGateway
+
+
+def _task(code: str, title: str = "Task") -> TaskDTO:
+    return TaskDTO(
+        code=code,
+        feature_code="F01",
+        title=title,
+        status="pending",
+        task_type="backend",
+        acceptance="criteria",
+        step_order=1,
+        metadata={"owner": "team-a"},
+    )
+
+
+def _seeded(tmp_path) -> SqliteGateway:
+    gateway = SqliteGateway(tmp_path / "db.sqlite")
+    gateway.create_or_update_projects([ProjectDTO(code="P01", name="Proj", description="", repository_path=None)])
+    gateway.create_or_update_features(
+        [FeatureDTO(code="F01", project_code="P01", name="Feat", description="", priority="P1")]
+    )
+    gateway.create_or_update_tasks([_task("T1"), _task("T2")])
+    gateway.create_task_dependencies([TaskDependencyDTO(task_code="T2", depends_on="T1")])
+    return gateway
+
+
+def _dependency_rows(gateway: SqliteGateway) -> list[tuple]:
+    with gateway._get_connection() as conn:
+        return conn.execute("SELECT task_code, depends_on FROM task_dependencies").fetchall()
+
+
+def test_reupserting_tasks_keeps_cascading_dependencies(tmp_path):
+    gateway = _seeded(tmp_path)
+
+    gateway.create_or_update_tasks([_task("T1", "Renamed"), _task("T2")])
+
+    assert _dependency_rows(gateway) == [("T2", "T1")]
+    assert gateway.get_task("T1").title == "Renamed"
+
+
+def test_unchanged_rows_are_not_rewritten(tmp_path):
+    gateway = _seeded(tmp_path)
+    with gateway._get_connection() as conn:
+        before = conn.total_changes
+
+    gateway.create_or_update_tasks([_task("T1"), _task("T2")])
+    with gateway._get_connection() as conn:
+        unchanged = conn.total_changes - before
+
+    gateway.create_or_update_tasks([_task("T1"), replace(_task("T2"), step_order=2)])
+    with gateway._get_connection() as conn:
+        one_changed = conn.total_changes - before - unchanged
+
+    assert unchanged == 0
+    assert one_changed == 1
+    assert gateway.get_task("T2").step_order == 2
+
+
+def test_upsert_sql_targets_composite_keys():
+    sql = SqliteGateway._upsert_sql("ai_jobs", ["task_code", "job_type", "prompt"], ("task_code", "job_type"))
+
+    assert "ON CONFLICT(task_code, job_type) DO UPDATE SET prompt = excluded.prompt" in sql
+    assert sql.endswith("WHERE ai_jobs.prompt IS NOT excluded.prompt")
+    assert SqliteGateway._upsert_sql("t", ["a"], ("a",)).endswith("ON CONFLICT(a) DO NOTHING")
@@ -0,0 +1,78 @@
+import json
+import logging
+import resource
+
+import pytest
+
+from src.lib.logging import JsonFormatter
+from src.lib.metrics import emit_bootstrap_summary
+from src.lib.stage_timing import StageTimer
+from src.services.bootstrap_orchestrator import BootstrapSummary
+from src.services.doc_discovery import scan_documents
+from src.services.parser.parallel import parse_files
+from src.services.parser.task_parser import TaskParser
+
+
+def test_span_records_counters_and_times():
+    timer = StageTimer()
+
+    with timer.span("parse.tasks") as span:
+        sum(range(10_000))
+        span.items = 3
+        span.bytes_read = 512
+
+    [recorded] = timer.spans
+    assert recorded.name == "parse.tasks"
+    assert (recorded.items, recorded.bytes_read) == (3, 512)
+    assert recorded.wall_seconds >= 0 and recorded.cpu_seconds >= 0
+
+
+def test_span_is_recorded_when_the_stage_fails():
+    timer = StageTimer()
+
+    with pytest.raises(RuntimeError):
+        with timer.span("persist"):
+            raise RuntimeError("database is locked")
+
+    assert [s.name for s in timer.spans] == ["persist"]
+
+
+def test_span_includes_worker_process_cpu(tmp_path):
+    feature_dir = tmp_path / "tasks" / "001-user-auth"
+    feature_dir.mkdir(parents=True)
+    for i in range(40):
+        (feature_dir / f"t{i:03d}.md").write_text(
+            f"# T{i:03d} Task {i}\n\n## Acceptance Criteria\n" + f"- Criterion {i}\n" * 4000, encoding="utf-8"
+        )
+    parser = TaskParser(tmp_path / "tasks")
+    files = scan_documents(tmp_path / "tasks", "tasks")
+    timer = StageTimer()
+
+    with timer.span("parse.tasks"):
+        children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        tasks = parse_files(parser, files, jobs=2, min_files=1)
+        children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    workers_cpu = (children_after.ru_utime + children_after.ru_stime) - (
+        children_before.ru_utime + children_before.ru_stime
+    )
+    [recorded] = timer.spans
+    assert len(tasks) == 40
+    assert workers_cpu > 0
+    assert recorded.cpu_seconds >= workers_cpu
+
+
+def test_summary_stages_are_emitted_in_json_logs(caplog):
+    timer = StageTimer()
+    with timer.span("discovery") as span:
+        span.items = 7
+    summary = BootstrapSummary(task_count=1, stages=timer.spans)
+
+    with caplog.at_level(logging.INFO, logger="src.lib.metrics"):
+        emit_bootstrap_summary(summary)
+
+    payload = json.loads(JsonFormatter().format(caplog.records[-1]))
+    [stage] = payload["extras"]["stages"]
+    assert stage["name"] == "discovery"
+    assert stage["items"] == 7
+    assert set(stage) == {"name", "wall_seconds", "cpu_seconds", "items", "bytes_read", "peak_rss_mb"}
@@ -39,3 +39,23 @@ def test_task_parser_extracts_heading_code_acceptance_and_deps(tasks_dir):
     assert task.title == "T001 Implement login"
     assert task.acceptance == "- Works\n- Has tests"
     assert task.metadata.get("dependencies") == ["T000"]
+
+
+@pytest.mark.parametrize(
+    ("body", "acceptance"),
+    [
+        ("## Acceptance Criteria\n- Works\n\n## Notes\n- not criteria\n\nDepends on: T000\n", "- Works"),
+        # The pre-tokenizer regex swallowed the blank line after an empty section and took the
+        # trailing heading or "Depends on:" line as the criteria.
+        ("## Acceptance Criteria\n\n## Notes\n- not criteria\n\nDepends on: T000\n", ""),
+        ("## Acceptance Criteria\n\n\nDepends on: T000\n", ""),
+    ],
+)
+def test_acceptance_stops_before_trailing_heading_and_depends_on(tmp_path, body, acceptance):
+    task_file = tmp_path / "t002.md"
+    task_file.write_text(f"# T002 Add logout\n\n{body}", encoding="utf-8")
+
+    task = TaskParser(tmp_path)._parse_task_file(task_file)
+
+    assert task.acceptance == acceptance
+    assert task.metadata.get("dependencies") == ["T000"]